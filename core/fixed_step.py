@@ -0,0 +1,38 @@
+# =====================================
+# Fixed Timestep — Physics Tick Accumulator
+# =====================================
+# Games feed it the variable frame dt from Clock and run their physics a
+# whole number of fixed ticks, so results do not depend on frame rate.
+# `alpha` is how far the next tick has progressed; renderers blend the
+# previous and current state by it.
+
+
+class FixedTimestep:
+
+    def __init__(self, rate, max_ticks=8):
+        self.step = 1.0 / rate
+        # Cap per frame so a stall does not snowball into ever longer frames
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    def advance(self, dt):
+        """Number of ticks to run for a frame that took `dt` seconds."""
+        self.accumulator += dt
+        ticks = int(self.accumulator / self.step)
+        if ticks > self.max_ticks:
+            # Drop the backlog instead of trying to catch up
+            self.accumulator = 0.0
+            return self.max_ticks
+        self.accumulator -= ticks * self.step
+        return ticks
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step
+
+
+def lerp(a, b, t):
+    return a + (b - a) * t
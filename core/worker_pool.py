@@ -0,0 +1,108 @@
+# =====================================
+# Worker Pool — Shared Setup for AI Process Pools
+# =====================================
+# The chess, checkers and Connect 4 AIs search in worker processes so the
+# Kivy frame loop never waits on them. Each pool shares one integer with
+# its workers: the parent bumps it to cancel, and searches poll it through
+# cancel_requested() to stop early instead of running out their budget.
+# SearchWorker is the one-process pool checkers and Connect 4 use; chess
+# splits its root moves over several (games/chess/analysis.py).
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Set in each worker by init_worker
+_cancel_generation = None
+
+
+def pool_context():
+    # fork keeps workers from re-importing the Kivy entry point; Windows
+    # only has spawn, which re-runs core/main.py as __mp_main__ (see there)
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+def shared_generation(context):
+    """The cancel counter to hand to init_worker through initargs."""
+    return context.Value("i", 0, lock=False)
+
+
+def init_worker(generation):
+    global _cancel_generation
+    _cancel_generation = generation
+
+
+def cancel_requested(generation):
+    """True in a worker once the parent has moved past `generation`."""
+    return _cancel_generation is not None and _cancel_generation.value != generation
+
+
+class SearchWorker:
+    """
+    Runs one search at a time in a background process. `job` is a
+    module-level function taking the request's arguments plus the cancel
+    generation; its result tuple is unpacked into the callback, or
+    `failed` when the job raises.
+    """
+
+    def __init__(self, job, failed, name="AI"):
+        self.job = job
+        self.failed = failed
+        self.name = name
+        self.generation = 0
+        self._context = pool_context()
+        self._shared_generation = shared_generation(self._context)
+        self._pool = None
+
+    def submit(self, callback, *args):
+        """
+        Start job(*args, generation) and call callback(*result) from a
+        background thread. Any earlier search is cancelled first.
+        """
+        self.cancel()
+        generation = self.generation
+        try:
+            future = self._get_pool().submit(self.job, *args, generation)
+        except BrokenProcessPool:
+            # The worker died earlier; start over with a fresh one
+            self._drop_pool()
+            future = self._get_pool().submit(self.job, *args, generation)
+
+        def done(f):
+            if f.cancelled() or generation != self.generation:
+                return
+            try:
+                result = f.result()
+            except Exception as e:
+                print(f"[{self.name}] search failed: {e}")
+                # Still answer, so the game stops waiting for the move
+                result = self.failed
+            callback(*result)
+
+        future.add_done_callback(done)
+        return future
+
+    def cancel(self):
+        """Stop the search in flight, freeing the worker; its callback never fires."""
+        self.generation += 1
+        self._shared_generation.value = self.generation
+
+    def shutdown(self):
+        self.cancel()
+        self._drop_pool()
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=self._context,
+                initializer=init_worker,
+                initargs=(self._shared_generation,),
+            )
+        return self._pool
+
+    def _drop_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
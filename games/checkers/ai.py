@@ -0,0 +1,232 @@
+# =====================================
+# Checkers AI — Alpha-Beta + Endgame Table
+# =====================================
+import time
+
+from core.worker_pool import SearchWorker, cancel_requested
+from games.checkers.engine import CheckersPosition, RED, WHITE, PROMOTION_MASK, iter_bits
+from games.checkers.endgame import EndgameTable, WIN, LOSS, DEFAULT_PATH
+
+WIN_SCORE = 100000
+INFINITY = 10 ** 9
+
+MAN_VALUE = 100
+KING_VALUE = 160
+
+# TT bound types
+EXACT, LOWER, UPPER = range(3)
+
+# Central squares are worth a little extra
+CENTER_MASK = sum(1 << i for i in (13, 14, 17, 18))
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+# --------------------------------------------------
+# Evaluation
+# --------------------------------------------------
+def evaluate(pos):
+    """Material plus advancement, from the side to move's point of view."""
+    score = 0
+    for color, sign in ((RED, 1), (WHITE, -1)):
+        own = pos.red if color == RED else pos.white
+        kings = own & pos.kings
+        men = own & ~pos.kings
+        score += sign * (MAN_VALUE * bin(men).count("1") +
+                         KING_VALUE * bin(kings).count("1") +
+                         5 * bin(own & CENTER_MASK).count("1"))
+        for sq in iter_bits(men):
+            row = sq >> 2
+            score += sign * (7 - row if color == RED else row)
+    return score if pos.side == RED else -score
+
+
+# --------------------------------------------------
+# Search
+# --------------------------------------------------
+class CheckersAI:
+
+    MAX_DEPTH = 40
+    CHECK_EVERY = 1024
+
+    def __init__(self, time_limit=1.0, endgame=None, tt_bits=17):
+        self.time_limit = time_limit
+        self.endgame = endgame
+        self.tt_mask = (1 << tt_bits) - 1
+        self.tt = [None] * (1 << tt_bits)
+        self.nodes = 0
+        self.deadline = None
+        self.completed_depth = 0
+        # Set by the worker job to poll its cancel flag
+        self.stop_check = None
+
+    def search(self, pos, time_limit=None):
+        """Return (best_move, score); best_move is None if there is no legal move."""
+        moves = pos.legal_moves()
+        if not moves:
+            return None, -WIN_SCORE
+        if len(moves) == 1:
+            return moves[0], 0
+
+        if self.endgame and self.endgame.covers(pos):
+            return self._endgame_move(pos, moves)
+
+        budget = self.time_limit if time_limit is None else time_limit
+        self.deadline = time.perf_counter() + budget
+        self.nodes = 0
+        self.completed_depth = 0
+        best_move, best_score = moves[0], 0
+
+        for depth in range(1, self.MAX_DEPTH + 1):
+            try:
+                score, move = self._root(pos, moves, depth)
+            except SearchTimeout:
+                break
+            best_move, best_score = move, score
+            self.completed_depth = depth
+            # Move the best line to the front for the next iteration
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) >= WIN_SCORE - self.MAX_DEPTH:
+                break
+
+        return best_move, best_score
+
+    def _endgame_move(self, pos, moves):
+        # Win fastest, lose slowest, otherwise hold the draw
+        def rank(move):
+            result, distance = self.endgame.probe(pos.play(move))
+            if result == LOSS:
+                return (2, -distance)
+            if result == WIN:
+                return (0, distance)
+            return (1, 0)
+
+        best = max(moves, key=rank)
+        result, distance = self.endgame.probe(pos.play(best))
+        if result == LOSS:
+            return best, WIN_SCORE - distance - 1
+        if result == WIN:
+            return best, -(WIN_SCORE - distance - 1)
+        return best, 0
+
+    # ----------------------------
+    # Internals
+    # ----------------------------
+    def _tick(self):
+        self.nodes += 1
+        if self.nodes % self.CHECK_EVERY == 0:
+            if time.perf_counter() > self.deadline:
+                raise SearchTimeout()
+            if self.stop_check and self.stop_check():
+                raise SearchTimeout()
+
+    def _root(self, pos, moves, depth):
+        alpha = -INFINITY
+        best_move = moves[0]
+        for move in moves:
+            score = -self._negamax(pos.play(move), depth - 1, -INFINITY, -alpha, 1)
+            if score > alpha:
+                alpha = score
+                best_move = move
+        return alpha, best_move
+
+    def _negamax(self, pos, depth, alpha, beta, ply):
+        self._tick()
+
+        if self.endgame and self.endgame.covers(pos):
+            result, distance = self.endgame.probe(pos)
+            if result == WIN:
+                return WIN_SCORE - ply - distance
+            if result == LOSS:
+                return -(WIN_SCORE - ply - distance)
+            return 0
+
+        key = hash(pos)
+        slot = key & self.tt_mask
+        entry = self.tt[slot]
+        tt_move = None
+        alpha_orig = alpha
+        if entry is not None and entry[0] == key:
+            tt_move = entry[4]
+            if entry[1] >= depth:
+                score, bound = entry[2], entry[3]
+                if bound == EXACT:
+                    return score
+                if bound == LOWER and score > alpha:
+                    alpha = score
+                elif bound == UPPER and score < beta:
+                    beta = score
+                if alpha >= beta:
+                    return score
+
+        moves = pos.legal_moves()
+        if not moves:
+            return -(WIN_SCORE - ply)
+
+        # Keep searching while captures are pending so exchanges resolve
+        if depth <= 0 and not moves[0][1]:
+            return evaluate(pos)
+
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        else:
+            # Longer captures and crowning moves first
+            promotion = PROMOTION_MASK[pos.side]
+            moves.sort(key=lambda m: (-bin(m[1]).count("1"),
+                                      -((promotion >> m[0][-1]) & 1)))
+
+        best_score = -INFINITY
+        best_move = moves[0]
+        for move in moves:
+            score = -self._negamax(pos.play(move), depth - 1, -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= alpha_orig:
+            bound = UPPER
+        elif best_score >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.tt[slot] = (key, depth, best_score, bound, best_move)
+        return best_score
+
+
+# --------------------------------------------------
+# Worker Process
+# --------------------------------------------------
+_worker_ai = None
+
+
+def _search_job(key, time_limit, endgame_path, generation):
+    global _worker_ai
+    if _worker_ai is None:
+        # One AI (and one mmap of the table) per worker, kept between moves
+        _worker_ai = CheckersAI(endgame=EndgameTable.load(endgame_path))
+    if cancel_requested(generation):
+        return None, 0
+    _worker_ai.stop_check = lambda: cancel_requested(generation)
+    move, score = _worker_ai.search(CheckersPosition(*key), time_limit)
+    return move, score
+
+
+class CheckersAIWorker(SearchWorker):
+    """Runs CheckersAI.search in a background process."""
+
+    def __init__(self, time_limit=1.0, endgame_path=DEFAULT_PATH):
+        super().__init__(_search_job, failed=(None, 0), name="Checkers AI")
+        self.time_limit = time_limit
+        self.endgame_path = endgame_path
+
+    def request_move(self, pos, callback):
+        """Search `pos` and call callback(move, score); move is None if the search failed."""
+        return self.submit(callback, pos.key(), self.time_limit, self.endgame_path)
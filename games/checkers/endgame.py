@@ -0,0 +1,261 @@
+# =====================================
+# Checkers Endgame Table — Offline Generator & mmap Probe
+# =====================================
+# games/checkers/endgame.bin ships with the game, built with the defaults:
+#   python -m games.checkers.endgame
+# every position of up to 3 pieces, about 2.2 MB and 10-25 seconds on one
+# core (--pieces 4 is far larger and slower). The game memory-maps it and
+# looks positions up by binary search; nothing is loaded into RAM.
+#
+# File layout (little-endian):
+#   header  b"CKEG", version u16, max_pieces u16, count u32
+#   keys    count x u32, sorted   (see position_key)
+#   values  count x u16           (distance << 2) | result
+# Only won/lost positions are stored; a covered position that is missing
+# is a draw.
+import argparse
+import itertools
+import mmap
+import os
+import struct
+import sys
+import time
+
+from games.checkers.engine import (
+    CheckersPosition, RED, WHITE, PROMOTION_MASK, iter_bits,
+)
+
+MAGIC = b"CKEG"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "endgame.bin")
+DEFAULT_PIECES = 3
+MAX_SUPPORTED_PIECES = 4   # 4 x 7 bits + side bit fits a u32 key
+
+# Results, from the side to move's point of view
+WIN, LOSS, DRAW = 1, 2, 3
+
+
+# --------------------------------------------------
+# Position Keys
+# --------------------------------------------------
+def position_key(pos):
+    """
+    Pack up to four pieces into a u32: 7 bits per piece in square order
+    (square | white << 5 | king << 6) then the side-to-move bit. Code 0
+    (a red man on square 0) cannot occur, so keys never collide.
+    """
+    key = 0
+    for sq in iter_bits(pos.red | pos.white):
+        code = sq | (((pos.white >> sq) & 1) << 5) | (((pos.kings >> sq) & 1) << 6)
+        key = (key << 7) | code
+    return (key << 1) | (pos.side == WHITE)
+
+
+def enumerate_positions(count):
+    """Every position with `count` pieces, both sides on the board."""
+    for squares in itertools.combinations(range(32), count):
+        for colors in itertools.product((RED, WHITE), repeat=count):
+            if RED not in colors or WHITE not in colors:
+                continue
+            for kings in itertools.product((0, 1), repeat=count):
+                red = white = king_bb = 0
+                valid = True
+                for sq, color, king in zip(squares, colors, kings):
+                    bit = 1 << sq
+                    # Men never stand on the row where they would be crowned
+                    if not king and PROMOTION_MASK[color] & bit:
+                        valid = False
+                        break
+                    if color == RED:
+                        red |= bit
+                    else:
+                        white |= bit
+                    if king:
+                        king_bb |= bit
+                if not valid:
+                    continue
+                yield CheckersPosition(red, white, king_bb, RED)
+                yield CheckersPosition(red, white, king_bb, WHITE)
+
+
+# --------------------------------------------------
+# Generator (retrograde analysis)
+# --------------------------------------------------
+def solve(max_pieces, log=print):
+    """Return {key: (result, distance)} for all decisive positions."""
+    solved = {}
+
+    def lookup(child):
+        # Side to move has been wiped out
+        own = child.red if child.side == RED else child.white
+        if not own:
+            return (LOSS, 0)
+        return solved.get(position_key(child), (DRAW, 0))
+
+    for count in range(2, max_pieces + 1):
+        t0 = time.perf_counter()
+        positions = list(enumerate_positions(count))
+        index = {position_key(p): i for i, p in enumerate(positions)}
+        n = len(positions)
+
+        predecessors = [[] for _ in range(n)]
+        remaining = [0] * n
+        has_draw = [False] * n
+        result = [0] * n
+        distance = [0] * n
+        # events[d] -> (parent, child result) for capture children lost/won in d
+        events = {}
+        terminal = []
+
+        for i, pos in enumerate(positions):
+            moves = pos.legal_moves()
+            if not moves:
+                terminal.append(i)
+                continue
+            remaining[i] = len(moves)
+            for move in moves:
+                child = pos.play(move)
+                if move[1]:
+                    # Captures drop into an already solved (smaller) class
+                    child_result, child_dist = lookup(child)
+                    if child_result == DRAW:
+                        has_draw[i] = True
+                        remaining[i] -= 1
+                    else:
+                        events.setdefault(child_dist, []).append((i, child_result))
+                else:
+                    predecessors[index[position_key(child)]].append(i)
+
+        def resolve(i, res, dist, frontier):
+            result[i] = res
+            distance[i] = dist
+            frontier.append(i)
+
+        # Positions with no legal move are lost on the spot
+        frontier = []
+        for i in terminal:
+            resolve(i, LOSS, 0, frontier)
+
+        # Layer d: every child resolved at distance d updates its parents
+        d = 0
+        while frontier or events:
+            updates = events.pop(d, [])
+            for child in frontier:
+                updates.extend((parent, result[child]) for parent in predecessors[child])
+
+            next_frontier = []
+            for i, child_result in updates:
+                if result[i]:
+                    continue
+                if child_result == LOSS:
+                    resolve(i, WIN, d + 1, next_frontier)
+                else:
+                    remaining[i] -= 1
+                    if remaining[i] == 0 and not has_draw[i]:
+                        resolve(i, LOSS, d + 1, next_frontier)
+            frontier = next_frontier
+            d += 1
+
+        for i, pos in enumerate(positions):
+            if result[i]:
+                solved[position_key(pos)] = (result[i], distance[i])
+
+        decided = sum(1 for r in result if r)
+        log(f"{count} pieces: {n} positions, {decided} decisive "
+            f"({time.perf_counter() - t0:.1f}s)")
+
+    return solved
+
+
+def write_table(solved, max_pieces, path=DEFAULT_PATH):
+    keys = sorted(solved)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, max_pieces, len(keys)))
+        f.write(struct.pack(f"<{len(keys)}I", *keys))
+        f.write(struct.pack(f"<{len(keys)}H", *(
+            (min(solved[k][1], 0x3FFF) << 2) | solved[k][0] for k in keys
+        )))
+
+
+# --------------------------------------------------
+# Probe
+# --------------------------------------------------
+class EndgameTable:
+    """Read-only view of endgame.bin through mmap."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.max_pieces, self.count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a checkers endgame table: {path}")
+        self.keys_offset = HEADER.size
+        self.values_offset = HEADER.size + 4 * self.count
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        """The table at `path`, or None when it has not been generated."""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            print(f"[Checkers] Endgame table unavailable: {e}")
+            return None
+
+    def covers(self, pos):
+        return pos.piece_count() <= self.max_pieces
+
+    def probe(self, pos):
+        """(result, distance) for the side to move, or None if not covered."""
+        if not self.covers(pos):
+            return None
+        own = pos.red if pos.side == RED else pos.white
+        if not own:
+            return (LOSS, 0)
+
+        key = position_key(pos)
+        data = self.data
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            value = struct.unpack_from("<I", data, self.keys_offset + 4 * mid)[0]
+            if value < key:
+                lo = mid + 1
+            elif value > key:
+                hi = mid
+            else:
+                packed = struct.unpack_from("<H", data, self.values_offset + 2 * mid)[0]
+                return (packed & 3, packed >> 2)
+        return (DRAW, 0)
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the checkers endgame table")
+    parser.add_argument("--pieces", type=int, default=DEFAULT_PIECES,
+                        help=f"largest piece count to solve (2-{MAX_SUPPORTED_PIECES})")
+    parser.add_argument("--out", default=DEFAULT_PATH, help="output file")
+    args = parser.parse_args(argv)
+
+    if not 2 <= args.pieces <= MAX_SUPPORTED_PIECES:
+        parser.error(f"--pieces must be between 2 and {MAX_SUPPORTED_PIECES}")
+
+    solved = solve(args.pieces)
+    write_table(solved, args.pieces, args.out)
+    print(f"Wrote {len(solved)} positions to {args.out} "
+          f"({os.path.getsize(args.out) // 1024} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
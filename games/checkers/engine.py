@@ -0,0 +1,228 @@
+# =====================================
+# Checkers Engine — 32-Square Bitboards
+# =====================================
+# Only the 32 dark squares ((row + col) odd) are playable. Square index
+# idx = row * 4 + col // 2. Red (player 1) starts on rows 5-7 and moves
+# towards row 0; White (player 2) starts on rows 0-2 and moves towards row 7.
+# Captures are mandatory and a capturing piece must keep jumping; a man
+# that is crowned mid-capture ends its move there.
+
+RED, WHITE = 1, 2
+
+FULL = (1 << 32) - 1
+
+# Board codes used by CheckersGame
+EMPTY_CODE, RED_MAN, WHITE_MAN, RED_KING, WHITE_KING = range(5)
+
+# Directions as (d_row, d_col): Red men use the first two, White men the last two
+DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+MAN_DIRECTIONS = {RED: (0, 1), WHITE: (2, 3)}
+KING_DIRECTIONS = (0, 1, 2, 3)
+
+
+def square_index(r, c):
+    if not (0 <= r < 8 and 0 <= c < 8) or (r + c) % 2 == 0:
+        return -1
+    return r * 4 + c // 2
+
+
+SQUARE_RC = [None] * 32
+for _r in range(8):
+    for _c in range(8):
+        if (_r + _c) % 2 == 1:
+            SQUARE_RC[square_index(_r, _c)] = (_r, _c)
+
+# NEIGHBOR[idx][d] / JUMP[idx][d]: adjacent square / landing square, or -1
+NEIGHBOR = []
+JUMP = []
+for _idx in range(32):
+    _r, _c = SQUARE_RC[_idx]
+    NEIGHBOR.append([square_index(_r + dr, _c + dc) for dr, dc in DIRECTIONS])
+    JUMP.append([square_index(_r + 2 * dr, _c + 2 * dc) if square_index(_r + dr, _c + dc) >= 0
+                 else -1 for dr, dc in DIRECTIONS])
+
+# Rows where each side's men are crowned
+PROMOTION_MASK = {
+    RED: sum(1 << i for i in range(4)),            # row 0
+    WHITE: sum(1 << i for i in range(28, 32)),     # row 7
+}
+
+
+def iter_bits(bb):
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+# --------------------------------------------------
+# Position
+# --------------------------------------------------
+class CheckersPosition:
+    """
+    Immutable position: red / white / kings bitboards plus the side to move.
+    A move is (path, captured) where path is the tuple of squares visited
+    and captured is a bitboard of the pieces it removes.
+    """
+
+    __slots__ = ("red", "white", "kings", "side")
+
+    def __init__(self, red, white, kings, side=RED):
+        self.red = red
+        self.white = white
+        self.kings = kings
+        self.side = side
+
+    # ----------------------------
+    # Setup / Conversion
+    # ----------------------------
+    @classmethod
+    def initial(cls):
+        return cls(red=sum(1 << i for i in range(20, 32)),
+                   white=sum(1 << i for i in range(12)),
+                   kings=0)
+
+    @classmethod
+    def from_board(cls, board, side=RED):
+        red = white = kings = 0
+        for idx, (r, c) in enumerate(SQUARE_RC):
+            piece = board[r][c]
+            bit = 1 << idx
+            if piece in (RED_MAN, RED_KING):
+                red |= bit
+            elif piece in (WHITE_MAN, WHITE_KING):
+                white |= bit
+            if piece in (RED_KING, WHITE_KING):
+                kings |= bit
+        return cls(red, white, kings, side)
+
+    def to_board(self):
+        board = [[EMPTY_CODE] * 8 for _ in range(8)]
+        for idx, (r, c) in enumerate(SQUARE_RC):
+            board[r][c] = self.piece_at(idx)
+        return board
+
+    def piece_at(self, idx):
+        bit = 1 << idx
+        king = 2 if self.kings & bit else 0
+        if self.red & bit:
+            return RED_MAN + king
+        if self.white & bit:
+            return WHITE_MAN + king
+        return EMPTY_CODE
+
+    def key(self):
+        return (self.red, self.white, self.kings, self.side)
+
+    def __eq__(self, other):
+        return isinstance(other, CheckersPosition) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    # ----------------------------
+    # Move Generation
+    # ----------------------------
+    def own_and_enemy(self):
+        if self.side == RED:
+            return self.red, self.white
+        return self.white, self.red
+
+    def legal_moves(self):
+        """All legal moves; captures (with full jump chains) are forced."""
+        captures = self.capture_moves()
+        if captures:
+            return captures
+        return self.simple_moves()
+
+    def simple_moves(self):
+        own, _ = self.own_and_enemy()
+        empty = ~(self.red | self.white) & FULL
+        moves = []
+        man_dirs = MAN_DIRECTIONS[self.side]
+        for sq in iter_bits(own):
+            neighbors = NEIGHBOR[sq]
+            for d in (KING_DIRECTIONS if (self.kings >> sq) & 1 else man_dirs):
+                to = neighbors[d]
+                if to >= 0 and (empty >> to) & 1:
+                    moves.append(((sq, to), 0))
+        return moves
+
+    def capture_moves(self):
+        own, enemy = self.own_and_enemy()
+        empty = ~(self.red | self.white) & FULL
+        promotion = PROMOTION_MASK[self.side]
+        man_dirs = MAN_DIRECTIONS[self.side]
+        moves = []
+
+        # Only pieces with an enemy neighbour can start a capture
+        for sq in iter_bits(own):
+            is_king = (self.kings >> sq) & 1
+            dirs = KING_DIRECTIONS if is_king else man_dirs
+            if any(NEIGHBOR[sq][d] >= 0 and (enemy >> NEIGHBOR[sq][d]) & 1 for d in dirs):
+                self._extend_jumps(sq, (sq,), 0, empty | (1 << sq), enemy,
+                                   dirs, is_king, promotion, moves)
+        return moves
+
+    def _extend_jumps(self, sq, path, captured, empty, enemy, dirs, is_king, promotion, out):
+        extended = False
+        for d in dirs:
+            over = NEIGHBOR[sq][d]
+            land = JUMP[sq][d]
+            if (land < 0 or not (enemy >> over) & 1 or (captured >> over) & 1
+                    or not (empty >> land) & 1):
+                continue
+            extended = True
+            new_path = path + (land,)
+            new_captured = captured | (1 << over)
+            if not is_king and (promotion >> land) & 1:
+                out.append((new_path, new_captured))
+                continue
+            self._extend_jumps(land, new_path, new_captured,
+                               (empty | (1 << sq)) & ~(1 << land),
+                               enemy, dirs, is_king, promotion, out)
+        if not extended and captured:
+            out.append((path, captured))
+
+    # ----------------------------
+    # Play
+    # ----------------------------
+    def play(self, move):
+        path, captured = move
+        frm, to = path[0], path[-1]
+        frm_bit, to_bit = 1 << frm, 1 << to
+        own, enemy = self.own_and_enemy()
+
+        own = (own & ~frm_bit) | to_bit
+        enemy &= ~captured
+        kings = self.kings & ~captured
+        if kings & frm_bit:
+            kings = (kings & ~frm_bit) | to_bit
+        elif PROMOTION_MASK[self.side] & to_bit:
+            kings |= to_bit
+
+        if self.side == RED:
+            return CheckersPosition(own, enemy, kings, WHITE)
+        return CheckersPosition(enemy, own, kings, RED)
+
+    def find_move(self, frm, to):
+        """Legal move frm -> to (square indexes); prefers the longest capture."""
+        best = None
+        for move in self.legal_moves():
+            path, captured = move
+            if path[0] == frm and path[-1] == to:
+                if best is None or bin(captured).count("1") > bin(best[1]).count("1"):
+                    best = move
+        return best
+
+    # ----------------------------
+    # Game State
+    # ----------------------------
+    def winner(self):
+        """RED / WHITE once the side to move has no legal move, else None."""
+        if self.legal_moves():
+            return None
+        return WHITE if self.side == RED else RED
+
+    def piece_count(self):
+        return bin(self.red | self.white).count("1")
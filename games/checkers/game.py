@@ -9,15 +9,20 @@ from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.popup import Popup
 from kivy.graphics import Color, Rectangle, Ellipse
+from games.checkers.engine import CheckersPosition, SQUARE_RC, RED, WHITE, square_index
+from games.checkers.ai import CheckersAIWorker
 
 
 class CheckersGame(BaseGame):
 
+    AI_TIME_LIMIT = 1.0
+
     def __init__(self, db):
         super().__init__(db, "Checkers")
 
         self.board = self.create_board()
         self.current_player = 1
+        self.position = CheckersPosition.from_board(self.board, self.current_player)
         self.player_role = 1
         self.selected = None
         self.valid_moves = []
@@ -31,6 +36,18 @@ class CheckersGame(BaseGame):
         self.board_widget = None
         self.turn_label = None
 
+        # Persistent canvas instructions, one set per square
+        self.squares = []
+        self.square_state = {}
+        self.board_geometry = None
+
+        # Computer opponent (plays White when enabled)
+        self.ai_worker = CheckersAIWorker(time_limit=self.AI_TIME_LIMIT)
+        self.ai_player = None
+        self.ai_generation = 0
+        self.ai_thinking = False
+        self.ai_button = None
+
     # ---------------------------------
     # BOARD INIT
     # ---------------------------------
@@ -81,14 +98,19 @@ class CheckersGame(BaseGame):
 
         btns = BoxLayout(size_hint_y=None, height=50)
         btns.add_widget(Button(text="Restart", on_release=lambda *_: self.reset()))
-        btns.add_widget(Button(text="Menu", on_release=lambda *_: self.app.switch_to("menu")))
+        self.ai_button = Button(text="Vs Computer: Off", on_release=lambda *_: self.toggle_ai())
+        btns.add_widget(self.ai_button)
+        btns.add_widget(Button(text="Menu", on_release=lambda *_: self.exit_game()))
         root.add_widget(btns)
 
         screen.add_widget(root)
         self.app.switch_to("game")
 
+        self.build_board_canvas()
+
         self.board_widget.bind(on_touch_down=lambda w, t: self.on_touch(w, t))
         self.board_widget.bind(size=lambda *a: self.draw_board())
+        self.board_widget.bind(pos=lambda *a: self.draw_board())
 
     # ---------------------------------
     # TOUCH
@@ -98,6 +120,9 @@ class CheckersGame(BaseGame):
         if self.multiplayer_enabled and not self.is_my_turn:
             return
 
+        if self.ai_thinking:
+            return
+
         if not widget.collide_point(*touch.pos):
             return
 
@@ -126,6 +151,7 @@ class CheckersGame(BaseGame):
                 self.move_piece(self.selected, (row, col))
                 self.selected = None
                 self.valid_moves = []
+                self.draw_board()
                 return
 
         if self.belongs_to_current(piece):
@@ -143,71 +169,39 @@ class CheckersGame(BaseGame):
             return piece in (2,4)
 
     def get_valid_moves(self, r, c):
-        moves = []
-
-        piece = self.board[r][c]
-
-        directions = []
-
-        if piece in (1,3):
-            directions.append(-1)
-        if piece in (2,4):
-            directions.append(1)
-        if piece in (3,4):
-            directions = [-1,1]
-
-        for d in directions:
-            for dc in [-1,1]:
-
-                nr = r + d
-                nc = c + dc
-
-                if 0 <= nr < 8 and 0 <= nc < 8:
-
-                    if self.board[nr][nc] == 0:
-                        moves.append((nr,nc))
-
-                    elif not self.belongs_to_current(self.board[nr][nc]):
-                        jr = nr + d
-                        jc = nc + dc
-                        if 0 <= jr < 8 and 0 <= jc < 8:
-                            if self.board[jr][jc] == 0:
-                                moves.append((jr,jc))
-
-        return moves
+        # Full moves from this square; captures are forced across the board
+        frm = square_index(r, c)
+        return [
+            SQUARE_RC[path[-1]]
+            for path, _ in self.position.legal_moves()
+            if path[0] == frm
+        ]
 
     # ---------------------------------
     # MOVE
     # ---------------------------------
     def move_piece(self, start, end):
 
-        sr, sc = start
-        er, ec = end
-
-        piece = self.board[sr][sc]
+        move = self.position.find_move(square_index(*start), square_index(*end))
+        if move is not None:
+            self.play_move(move)
 
-        if abs(er - sr) == 2:
-            mid_r = (sr + er) // 2
-            mid_c = (sc + ec) // 2
-            self.board[mid_r][mid_c] = 0
-
-        self.board[er][ec] = piece
-        self.board[sr][sc] = 0
-
-        # KING PROMOTION
-        if piece == 1 and er == 0:
-            self.board[er][ec] = 3
-        if piece == 2 and er == 7:
-            self.board[er][ec] = 4
+    def play_move(self, move):
+        """Play an engine (path, captured) move and pass the turn on."""
+        path, _ = move
+        self.position = self.position.play(move)
+        self.board = self.position.to_board()
 
         if self.multiplayer_enabled and not self.is_remote_move:
-            move_data = {"from":start,"to":end}
+            # Jump chains are resolved by the engine, so {"from","to"} is enough remotely
+            move_data = {"from":SQUARE_RC[path[0]],"to":SQUARE_RC[path[-1]]}
             self.app.multiplayer_manager.send_move(move_data)
             self.is_my_turn = False
 
         self.switch_turn()
         self.draw_board()
         self.check_game_over()
+        self.start_ai_turn()
 
     # ---------------------------------
     # REMOTE MOVE
@@ -234,99 +228,177 @@ class CheckersGame(BaseGame):
     # ---------------------------------
     # DRAW
     # ---------------------------------
-    def draw_board(self):
+    SELECTED_COLOR = (1, 1, 0, 0.6)
+    VALID_MOVE_COLOR = (0, 1, 0, 0.5)
+    NO_HIGHLIGHT = (0, 0, 0, 0)
+
+    def build_board_canvas(self):
         self.board_widget.canvas.clear()
+        self.squares = []
+        self.square_state = {}
+        self.board_geometry = None
 
         with self.board_widget.canvas:
-
-            w = self.board_widget.width
-            h = self.board_widget.height
-            board_size = min(w,h)
-            cell = board_size/8
-
-            offset_x = self.board_widget.x + (w-board_size)/2
-            offset_y = self.board_widget.y + (h-board_size)/2
-
             for r in range(8):
+                row = []
                 for c in range(8):
 
                     if (r+c)%2==0:
                         Color(0.9,0.9,0.9,1)
                     else:
                         Color(0.3,0.3,0.3,1)
+                    base = Rectangle()
+
+                    highlight_color = Color(*self.NO_HIGHLIGHT)
+                    highlight = Rectangle()
+
+                    piece_color = Color(0,0,0,0)
+                    piece = Ellipse()
 
-                    Rectangle(
-                        pos=(offset_x+c*cell,offset_y+r*cell),
-                        size=(cell,cell)
-                    )
-
-                    if self.selected==(r,c):
-                        Color(1,1,0,0.6)
-                        Rectangle(
-                            pos=(offset_x+c*cell,offset_y+r*cell),
-                            size=(cell,cell)
-                        )
-
-                    if (r,c) in self.valid_moves:
-                        Color(0,1,0,0.5)
-                        Rectangle(
-                            pos=(offset_x+c*cell,offset_y+r*cell),
-                            size=(cell,cell)
-                        )
-
-                    piece=self.board[r][c]
-
-                    if piece!=0:
-
-                        if piece in (1,3):
-                            Color(1,0.2,0.2,1)
-                        else:
-                            Color(0.95,0.95,0.95,1)
-
-                        Ellipse(
-                            pos=(offset_x+c*cell+cell*0.15,
-                                 offset_y+r*cell+cell*0.15),
-                            size=(cell*0.7,cell*0.7)
-                        )
-
-                        Color(0,0,0,0.4)
-                        Ellipse(
-                            pos=(offset_x+c*cell+cell*0.18,
-                                 offset_y+r*cell+cell*0.18),
-                            size=(cell*0.64,cell*0.64)
-                        )
-
-                        # KING VISUAL
-                        if piece in (3,4):
-                            Color(1,0.85,0,1)
-                            Ellipse(
-                                pos=(offset_x+c*cell+cell*0.35,
-                                     offset_y+r*cell+cell*0.35),
-                                size=(cell*0.3,cell*0.3)
-                            )
+                    shadow_color = Color(0,0,0,0)
+                    shadow = Ellipse()
+
+                    # KING VISUAL
+                    crown_color = Color(1,0.85,0,0)
+                    crown = Ellipse()
+
+                    row.append((base, highlight_color, highlight,
+                                piece_color, piece, shadow_color, shadow,
+                                crown_color, crown))
+                self.squares.append(row)
+
+    def draw_board(self):
+        if not self.squares:
+            return
+
+        w = self.board_widget.width
+        h = self.board_widget.height
+        board_size = min(w,h)
+        cell = board_size/8
+
+        offset_x = self.board_widget.x + (w-board_size)/2
+        offset_y = self.board_widget.y + (h-board_size)/2
+
+        geometry = (offset_x, offset_y, cell)
+        relayout = geometry != self.board_geometry
+        self.board_geometry = geometry
+
+        valid = set(self.valid_moves)
+
+        for r in range(8):
+            for c in range(8):
+                (base, highlight_color, highlight,
+                 piece_color, piece_ellipse, shadow_color, shadow,
+                 crown_color, crown) = self.squares[r][c]
+
+                if relayout:
+                    x = offset_x+c*cell
+                    y = offset_y+r*cell
+                    base.pos = highlight.pos = (x, y)
+                    base.size = highlight.size = (cell, cell)
+                    piece_ellipse.pos = (x+cell*0.15, y+cell*0.15)
+                    piece_ellipse.size = (cell*0.7, cell*0.7)
+                    shadow.pos = (x+cell*0.18, y+cell*0.18)
+                    shadow.size = (cell*0.64, cell*0.64)
+                    crown.pos = (x+cell*0.35, y+cell*0.35)
+                    crown.size = (cell*0.3, cell*0.3)
+
+                if self.selected==(r,c):
+                    mark = self.SELECTED_COLOR
+                elif (r,c) in valid:
+                    mark = self.VALID_MOVE_COLOR
+                else:
+                    mark = self.NO_HIGHLIGHT
+
+                piece = self.board[r][c]
+                state = (piece, mark)
+                if self.square_state.get((r,c)) == state:
+                    continue
+                self.square_state[(r,c)] = state
+
+                highlight_color.rgba = mark
+
+                if piece in (1,3):
+                    piece_color.rgba = (1,0.2,0.2,1)
+                elif piece in (2,4):
+                    piece_color.rgba = (0.95,0.95,0.95,1)
+                else:
+                    piece_color.a = 0
+
+                shadow_color.a = 0.4 if piece else 0
+                crown_color.a = 1 if piece in (3,4) else 0
 
     # ---------------------------------
     # RESET
     # ---------------------------------
     def reset(self):
+        self.cancel_ai()
         self.board=self.create_board()
         self.current_player=1
+        self.position=CheckersPosition.from_board(self.board,self.current_player)
         self.selected=None
         self.valid_moves=[]
         self.is_my_turn=True
         self.draw_board()
 
+    # ---------------------------------
+    # COMPUTER OPPONENT
+    # ---------------------------------
+    def toggle_ai(self):
+        if self.multiplayer_enabled:
+            return
+        # Abandon any search in flight and hand the move back
+        self.cancel_ai()
+        self.ai_player = None if self.ai_player else WHITE
+        self.ai_button.text = "Vs Computer: On" if self.ai_player else "Vs Computer: Off"
+        self.start_ai_turn()
+
+    def cancel_ai(self):
+        self.ai_generation += 1
+        self.ai_thinking = False
+        self.ai_worker.cancel()
+
+    def start_ai_turn(self):
+        if self.current_player != self.ai_player or self.ai_thinking:
+            return
+        if self.position.winner():
+            return
+
+        self.ai_thinking = True
+        generation = self.ai_generation
+        self.ai_worker.request_move(
+            self.position,
+            lambda move, score: Clock.schedule_once(
+                lambda dt: self._apply_ai_move(generation, move)
+            ),
+        )
+
+    def _apply_ai_move(self, generation, move):
+        if generation != self.ai_generation or not self.ai_thinking:
+            return
+        self.ai_thinking = False
+        if move is None:
+            return
+
+        # The searched move itself: find_move could pick another capture
+        # chain between the same two squares
+        self.play_move(move)
+
+    def exit_game(self):
+        self.cancel_ai()
+        self.ai_worker.shutdown()
+        self.app.switch_to("menu")
+
     # ---------------------------------
     # GAME OVER
     # ---------------------------------
     def check_game_over(self):
-        red=any(1 in row or 3 in row for row in self.board)
-        white=any(2 in row or 4 in row for row in self.board)
+        # A side with no pieces or no legal move loses
+        winner=self.position.winner()
 
-        if not red or not white:
-            winner="Red" if red else "White"
+        if winner:
             self.end_session()
-            self.show_game_over(winner)
+            self.show_game_over("Red" if winner==RED else "White")
 
     def show_game_over(self,winner):
         popup=Popup(
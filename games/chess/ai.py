@@ -0,0 +1,370 @@
+# =====================================
+# Chess AI — Alpha-Beta with Iterative Deepening
+# =====================================
+import time
+
+from games.chess.engine import (
+    WHITE, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, EMPTY,
+    EN_PASSANT, iter_bits,
+)
+
+MATE_SCORE = 100000
+# Scores past this are mates; no search gets near 1000 plies deep
+MATE_BOUND = MATE_SCORE - 1000
+INFINITY = 10 ** 9
+
+PIECE_VALUES = [100, 320, 330, 500, 900, 0]
+
+# Piece-square tables, written from White's side with row 0 (rank 8) first.
+# Black looks them up with sq ^ 56 (rows mirrored).
+PST = [
+    [  # Pawn
+         0,  0,  0,  0,  0,  0,  0,  0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+         5,  5, 10, 25, 25, 10,  5,  5,
+         0,  0,  0, 20, 20,  0,  0,  0,
+         5, -5,-10,  0,  0,-10, -5,  5,
+         5, 10, 10,-20,-20, 10, 10,  5,
+         0,  0,  0,  0,  0,  0,  0,  0,
+    ],
+    [  # Knight
+        -50,-40,-30,-30,-30,-30,-40,-50,
+        -40,-20,  0,  0,  0,  0,-20,-40,
+        -30,  0, 10, 15, 15, 10,  0,-30,
+        -30,  5, 15, 20, 20, 15,  5,-30,
+        -30,  0, 15, 20, 20, 15,  0,-30,
+        -30,  5, 10, 15, 15, 10,  5,-30,
+        -40,-20,  0,  5,  5,  0,-20,-40,
+        -50,-40,-30,-30,-30,-30,-40,-50,
+    ],
+    [  # Bishop
+        -20,-10,-10,-10,-10,-10,-10,-20,
+        -10,  0,  0,  0,  0,  0,  0,-10,
+        -10,  0,  5, 10, 10,  5,  0,-10,
+        -10,  5,  5, 10, 10,  5,  5,-10,
+        -10,  0, 10, 10, 10, 10,  0,-10,
+        -10, 10, 10, 10, 10, 10, 10,-10,
+        -10,  5,  0,  0,  0,  0,  5,-10,
+        -20,-10,-10,-10,-10,-10,-10,-20,
+    ],
+    [  # Rook
+         0,  0,  0,  0,  0,  0,  0,  0,
+         5, 10, 10, 10, 10, 10, 10,  5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+         0,  0,  0,  5,  5,  0,  0,  0,
+    ],
+    [  # Queen
+        -20,-10,-10, -5, -5,-10,-10,-20,
+        -10,  0,  0,  0,  0,  0,  0,-10,
+        -10,  0,  5,  5,  5,  5,  0,-10,
+         -5,  0,  5,  5,  5,  5,  0, -5,
+          0,  0,  5,  5,  5,  5,  0, -5,
+        -10,  5,  5,  5,  5,  5,  0,-10,
+        -10,  0,  5,  0,  0,  0,  0,-10,
+        -20,-10,-10, -5, -5,-10,-10,-20,
+    ],
+    [  # King (middlegame)
+        -30,-40,-40,-50,-50,-40,-40,-30,
+        -30,-40,-40,-50,-50,-40,-40,-30,
+        -30,-40,-40,-50,-50,-40,-40,-30,
+        -30,-40,-40,-50,-50,-40,-40,-30,
+        -20,-30,-30,-40,-40,-30,-30,-20,
+        -10,-20,-20,-20,-20,-20,-20,-10,
+         20, 20,  0,  0,  0,  0, 20, 20,
+         20, 30, 10,  0,  0, 10, 30, 20,
+    ],
+]
+
+# TT bound types
+EXACT, LOWER, UPPER = range(3)
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+# --------------------------------------------------
+# Evaluation
+# --------------------------------------------------
+def evaluate(pos):
+    """Static score in centipawns from the side to move's point of view."""
+    score = 0
+    for ptype in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING):
+        table = PST[ptype]
+        value = PIECE_VALUES[ptype]
+        for sq in iter_bits(pos.pieces[WHITE][ptype]):
+            score += value + table[sq]
+        for sq in iter_bits(pos.pieces[1][ptype]):
+            score -= value + table[sq ^ 56]
+    return score if pos.side == WHITE else -score
+
+
+# --------------------------------------------------
+# Transposition Table
+# --------------------------------------------------
+class TranspositionTable:
+    """Fixed number of slots indexed by the low bits of the Zobrist hash."""
+
+    def __init__(self, size_bits=18):
+        self.mask = (1 << size_bits) - 1
+        self.slots = [None] * (1 << size_bits)
+
+    def get(self, key):
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key, depth, score, bound, move):
+        index = key & self.mask
+        entry = self.slots[index]
+        # Depth-preferred, but always replace entries from other positions
+        if entry is None or entry[0] != key or depth >= entry[1]:
+            self.slots[index] = (key, depth, score, bound, move)
+
+    def clear(self):
+        self.slots = [None] * len(self.slots)
+
+
+def score_to_tt(score, ply):
+    """
+    Search scores count mates from the root; the table keeps them as
+    distance from the stored node so they stay right at any other ply.
+    """
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def score_from_tt(score, ply):
+    """Inverse of score_to_tt for a probe at `ply`."""
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
+
+
+# --------------------------------------------------
+# Search
+# --------------------------------------------------
+class ChessAI:
+
+    MAX_DEPTH = 64
+    CHECK_EVERY = 1024
+
+    def __init__(self, time_limit=1.0, max_depth=None, tt_bits=18):
+        self.time_limit = time_limit
+        self.max_depth = max_depth or self.MAX_DEPTH
+        self.tt = TranspositionTable(tt_bits)
+        self.nodes = 0
+        self.stopped = False
+        self.deadline = None
+        self.killers = []
+        self.root_moves = None
+        self.completed_depth = 0
+
+        # Optional callable polled alongside the clock, e.g. a cross-process cancel flag
+        self.stop_check = None
+
+    def stop(self):
+        self.stopped = True
+
+    def search(self, pos, time_limit=None, on_iteration=None, root_moves=None):
+        """
+        Iteratively deepen from depth 1 until the time budget runs out.
+        Returns (best_move, score, principal_variation); best_move is None
+        when the side to move has no legal moves. `root_moves` restricts the
+        search to a subset of the legal root moves.
+        """
+        pos = pos.copy()
+        budget = self.time_limit if time_limit is None else time_limit
+        self.deadline = time.perf_counter() + budget
+        self.stopped = False
+        self.nodes = 0
+        self.completed_depth = 0
+        self.killers = [[0, 0] for _ in range(self.max_depth + 64)]
+
+        legal = pos.legal_moves()
+        root_moves = [m for m in legal if m in root_moves] if root_moves else legal
+        self.root_moves = set(root_moves)
+        if not legal:
+            return None, (-MATE_SCORE if pos.in_check() else 0), []
+
+        best_move, best_score, pv = root_moves[0], 0, [root_moves[0]]
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score = self._negamax(pos, depth, -INFINITY, INFINITY, 0)
+            except SearchTimeout:
+                break
+            self.completed_depth = depth
+            entry = self.tt.get(pos.hash)
+            if entry and entry[4]:
+                best_move, best_score = entry[4], score
+                pv = self.principal_variation(pos, depth)
+            if on_iteration:
+                on_iteration(depth, best_move, best_score, pv)
+            if abs(score) >= MATE_SCORE - self.max_depth:
+                break
+            if len(legal) == 1:
+                break
+
+        return best_move, best_score, pv
+
+    def principal_variation(self, pos, depth):
+        pv = []
+        seen = set()
+        for _ in range(depth):
+            entry = self.tt.get(pos.hash)
+            if not entry or not entry[4] or pos.hash in seen:
+                break
+            move = entry[4]
+            if move not in pos.legal_moves():
+                break
+            seen.add(pos.hash)
+            pv.append(move)
+            pos.make_move(move)
+        for _ in pv:
+            pos.unmake_move()
+        return pv
+
+    # ----------------------------
+    # Internals
+    # ----------------------------
+    def _tick(self):
+        self.nodes += 1
+        if self.nodes % self.CHECK_EVERY == 0:
+            if self.stopped or time.perf_counter() > self.deadline:
+                raise SearchTimeout()
+            if self.stop_check and self.stop_check():
+                self.stopped = True
+                raise SearchTimeout()
+
+    def _order(self, pos, moves, tt_move, ply):
+        mailbox = pos.mailbox
+        killers = self.killers[ply]
+
+        def key(move):
+            if move == tt_move:
+                return -INFINITY
+            victim = mailbox[(move >> 6) & 63]
+            if victim != EMPTY:
+                attacker = mailbox[move & 63] % 6
+                return -(10 * PIECE_VALUES[victim % 6] - PIECE_VALUES[attacker]) - 10000
+            if (move >> 12) & 7:
+                return -9000
+            if move == killers[0] or move == killers[1]:
+                return -5000
+            return 0
+
+        moves.sort(key=key)
+        return moves
+
+    def _negamax(self, pos, depth, alpha, beta, ply):
+        self._tick()
+
+        if ply and (pos.halfmove >= 100 or pos.is_repetition()):
+            return 0
+
+        alpha_orig = alpha
+        entry = self.tt.get(pos.hash)
+        tt_move = 0
+        if entry:
+            tt_move = entry[4]
+            if ply and entry[1] >= depth:
+                score, bound = score_from_tt(entry[2], ply), entry[3]
+                if bound == EXACT:
+                    return score
+                if bound == LOWER and score > alpha:
+                    alpha = score
+                elif bound == UPPER and score < beta:
+                    beta = score
+                if alpha >= beta:
+                    return score
+
+        in_check = pos.in_check()
+        if depth <= 0 and not in_check:
+            return self._quiesce(pos, alpha, beta, ply)
+
+        us = pos.side
+        best_score = -INFINITY
+        best_move = 0
+        legal = 0
+
+        moves = pos.pseudo_moves()
+        if not ply:
+            moves = [m for m in moves if m in self.root_moves]
+
+        for move in self._order(pos, moves, tt_move, ply):
+            pos.make_move(move)
+            if pos.is_attacked(pos.king_square(us), us ^ 1):
+                pos.unmake_move()
+                continue
+            legal += 1
+            try:
+                score = -self._negamax(pos, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                pos.unmake_move()
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if pos.mailbox[(move >> 6) & 63] == EMPTY:
+                    killers = self.killers[ply]
+                    if killers[0] != move:
+                        killers[1] = killers[0]
+                        killers[0] = move
+                break
+
+        if not legal:
+            return -(MATE_SCORE - ply) if in_check else 0
+
+        if best_score <= alpha_orig:
+            bound = UPPER
+        elif best_score >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.tt.store(pos.hash, depth, score_to_tt(best_score, ply), bound, best_move)
+        return best_score
+
+    def _quiesce(self, pos, alpha, beta, ply):
+        self._tick()
+
+        stand_pat = evaluate(pos)
+        if stand_pat >= beta:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        us = pos.side
+        mailbox = pos.mailbox
+        captures = [
+            m for m in pos.pseudo_moves()
+            if mailbox[(m >> 6) & 63] != EMPTY or (m >> 16) == EN_PASSANT or (m >> 12) & 7
+        ]
+        for move in self._order(pos, captures, 0, ply):
+            pos.make_move(move)
+            if pos.is_attacked(pos.king_square(us), us ^ 1):
+                pos.unmake_move()
+                continue
+            try:
+                score = -self._quiesce(pos, -beta, -alpha, ply + 1)
+            finally:
+                pos.unmake_move()
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
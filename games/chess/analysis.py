@@ -0,0 +1,167 @@
+# =====================================
+# Chess Analysis — Process Pool Search Service
+# =====================================
+# Runs ChessAI searches in worker processes so the Kivy frame loop never
+# competes with the search for the GIL. Root moves are split across the
+# workers and the best result is reported back through a callback.
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from core.worker_pool import pool_context, shared_generation, init_worker, cancel_requested
+from games.chess.ai import ChessAI, INFINITY, MATE_SCORE
+
+
+def _search_job(position, time_limit, generation, root_moves):
+    ai = ChessAI(time_limit=time_limit)
+    ai.stop_check = lambda: cancel_requested(generation)
+    move, score, pv = ai.search(position, root_moves=root_moves)
+    return {
+        "best_move": move,
+        "score": score,
+        "pv": pv,
+        "depth": ai.completed_depth,
+        "nodes": ai.nodes,
+    }
+
+
+class AnalysisRequest:
+
+    def __init__(self, service, generation, futures, callback):
+        self.service = service
+        self.generation = generation
+        self.futures = futures
+        self.callback = callback
+        self.results = []
+        self.finished = False
+        self.lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self.generation != self.service.generation
+
+    def cancel(self):
+        if not self.cancelled:
+            self.service.cancel()
+
+    def _on_done(self, future):
+        if future.cancelled() or self.cancelled:
+            return
+        try:
+            result = future.result()
+            error = None
+        except Exception as e:
+            print(f"[Chess Analysis] search failed: {e}")
+            result, error = None, e
+
+        with self.lock:
+            if self.finished:
+                return
+            if error is None:
+                self.results.append(result)
+                if len(self.results) < len(self.futures):
+                    return
+            self.finished = True
+
+        if not self.cancelled:
+            # A failed part fails the request, so the caller is never left waiting
+            self.callback(self._combine() if error is None else self._failure(error))
+
+    def _failure(self, error):
+        return {
+            "best_move": None,
+            "score": 0,
+            "pv": [],
+            "depth": 0,
+            "nodes": 0,
+            "generation": self.generation,
+            "error": str(error),
+        }
+
+    def _combine(self):
+        best = max(self.results, key=lambda r: r["score"] if r["best_move"] else -INFINITY)
+        return {
+            "best_move": best["best_move"],
+            "score": best["score"],
+            "pv": best["pv"],
+            "depth": min(r["depth"] for r in self.results),
+            "nodes": sum(r["nodes"] for r in self.results),
+            "generation": self.generation,
+        }
+
+
+class AnalysisService:
+
+    def __init__(self, workers=None, time_limit=1.0):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.time_limit = time_limit
+        self.generation = 0
+        self._context = pool_context()
+        self._shared_generation = shared_generation(self._context)
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._context,
+                initializer=init_worker,
+                initargs=(self._shared_generation,),
+            )
+        return self._pool
+
+    def analyse(self, position, callback, time_limit=None):
+        """
+        Search a snapshot of `position` and call callback(result) from a
+        background thread, where result has best_move, score (centipawns for
+        the side to move), pv, depth, nodes and the request generation. Any
+        earlier request is cancelled first. If the search fails, best_move
+        is None and result has an "error" message.
+        """
+        self.cancel()
+        snapshot = position.copy()
+        budget = self.time_limit if time_limit is None else time_limit
+
+        moves = snapshot.legal_moves()
+        if not moves:
+            request = AnalysisRequest(self, self.generation, [], callback)
+            score = -MATE_SCORE if snapshot.in_check() else 0
+            callback({"best_move": None, "score": score, "pv": [], "depth": 0,
+                      "nodes": 0, "generation": self.generation})
+            return request
+
+        parts = min(self.workers, len(moves))
+        chunks = [moves[i::parts] for i in range(parts)]
+
+        try:
+            futures = self._submit(snapshot, budget, chunks)
+        except BrokenProcessPool:
+            # A worker died earlier; start over with a fresh pool
+            self._drop_pool()
+            futures = self._submit(snapshot, budget, chunks)
+        request = AnalysisRequest(self, self.generation, futures, callback)
+        for future in futures:
+            future.add_done_callback(request._on_done)
+        return request
+
+    def _submit(self, snapshot, budget, chunks):
+        pool = self._get_pool()
+        return [
+            pool.submit(_search_job, snapshot, budget, self.generation, chunk)
+            for chunk in chunks
+        ]
+
+    def _drop_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def cancel(self):
+        """Stop every search in flight; their callbacks never fire."""
+        self.generation += 1
+        self._shared_generation.value = self.generation
+
+    def shutdown(self):
+        self.cancel()
+        self._drop_pool()
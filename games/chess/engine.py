@@ -0,0 +1,527 @@
+# =====================================
+# Chess Engine — Bitboard Position
+# =====================================
+# Squares follow the board used by ChessGame: sq = row * 8 + col,
+# row 0 is Black's back rank and White pawns move towards row 0.
+import random
+
+WHITE, BLACK = 0, 1
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+
+COLOR_CODES = "wb"
+PIECE_CODES = "PNBRQK"
+EMPTY = -1
+
+# Move flags (bits 16+ of an encoded move)
+NORMAL, DOUBLE_PUSH, EN_PASSANT, CASTLE = range(4)
+
+# Castling rights
+WHITE_KINGSIDE, WHITE_QUEENSIDE = 1, 2
+BLACK_KINGSIDE, BLACK_QUEENSIDE = 4, 8
+
+
+# --------------------------------------------------
+# Move Encoding
+# --------------------------------------------------
+def encode_move(frm, to, promo=0, flag=NORMAL):
+    return frm | (to << 6) | (promo << 12) | (flag << 16)
+
+
+def move_from(move):
+    return move & 63
+
+
+def move_to(move):
+    return (move >> 6) & 63
+
+
+def move_promo(move):
+    return (move >> 12) & 7
+
+
+def move_flag(move):
+    return move >> 16
+
+
+def square_name(sq):
+    r, c = divmod(sq, 8)
+    return "abcdefgh"[c] + str(8 - r)
+
+
+def move_to_uci(move):
+    text = square_name(move_from(move)) + square_name(move_to(move))
+    promo = move_promo(move)
+    if promo:
+        text += PIECE_CODES[promo].lower()
+    return text
+
+
+# --------------------------------------------------
+# Attack Tables
+# --------------------------------------------------
+def _leaper_table(offsets):
+    table = []
+    for sq in range(64):
+        r, c = divmod(sq, 8)
+        bb = 0
+        for dr, dc in offsets:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < 8 and 0 <= nc < 8:
+                bb |= 1 << (nr * 8 + nc)
+        table.append(bb)
+    return table
+
+
+def _ray_table(dr, dc):
+    table = []
+    for sq in range(64):
+        r, c = divmod(sq, 8)
+        bb = 0
+        nr, nc = r + dr, c + dc
+        while 0 <= nr < 8 and 0 <= nc < 8:
+            bb |= 1 << (nr * 8 + nc)
+            nr += dr
+            nc += dc
+        table.append(bb)
+    return table
+
+
+KNIGHT_ATTACKS = _leaper_table([(2, 1), (2, -1), (-2, 1), (-2, -1),
+                                (1, 2), (1, -2), (-1, 2), (-1, -2)])
+KING_ATTACKS = _leaper_table([(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                              if dr or dc])
+PAWN_ATTACKS = (
+    _leaper_table([(-1, -1), (-1, 1)]),   # white captures towards row 0
+    _leaper_table([(1, -1), (1, 1)]),     # black captures towards row 7
+)
+
+# (ray table, True if the ray runs towards higher square indexes)
+ROOK_RAYS = tuple((_ray_table(dr, dc), dr > 0 or (dr == 0 and dc > 0))
+                  for dr, dc in [(1, 0), (-1, 0), (0, 1), (0, -1)])
+BISHOP_RAYS = tuple((_ray_table(dr, dc), dr > 0)
+                    for dr, dc in [(1, 1), (1, -1), (-1, 1), (-1, -1)])
+
+ROW_MASKS = [0xFF << (8 * r) for r in range(8)]
+
+# Rights kept after a move touches a square (king / rook home squares)
+CASTLE_MASK = [15] * 64
+CASTLE_MASK[60] = 15 & ~(WHITE_KINGSIDE | WHITE_QUEENSIDE)
+CASTLE_MASK[63] = 15 & ~WHITE_KINGSIDE
+CASTLE_MASK[56] = 15 & ~WHITE_QUEENSIDE
+CASTLE_MASK[4] = 15 & ~(BLACK_KINGSIDE | BLACK_QUEENSIDE)
+CASTLE_MASK[7] = 15 & ~BLACK_KINGSIDE
+CASTLE_MASK[0] = 15 & ~BLACK_QUEENSIDE
+
+# King destination -> (rook from, rook to)
+CASTLE_ROOK = {62: (63, 61), 58: (56, 59), 6: (7, 5), 2: (0, 3)}
+
+
+# Zobrist keys (fixed seed so hashes are stable between runs)
+_zobrist_rng = random.Random(0x5EED)
+ZOBRIST_PIECE = [[_zobrist_rng.getrandbits(64) for _ in range(64)] for _ in range(12)]
+ZOBRIST_CASTLING = [_zobrist_rng.getrandbits(64) for _ in range(16)]
+ZOBRIST_EP_FILE = [_zobrist_rng.getrandbits(64) for _ in range(8)]
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)
+
+
+def _slide(sq, occ, rays):
+    attacks = 0
+    for ray, positive in rays:
+        bb = ray[sq]
+        blockers = bb & occ
+        if blockers:
+            if positive:
+                first = (blockers & -blockers).bit_length() - 1
+            else:
+                first = blockers.bit_length() - 1
+            bb ^= ray[first]
+        attacks |= bb
+    return attacks
+
+
+def rook_attacks(sq, occ):
+    return _slide(sq, occ, ROOK_RAYS)
+
+
+def bishop_attacks(sq, occ):
+    return _slide(sq, occ, BISHOP_RAYS)
+
+
+def iter_bits(bb):
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+# --------------------------------------------------
+# Position
+# --------------------------------------------------
+class Position:
+
+    def __init__(self):
+        self.pieces = [[0] * 6, [0] * 6]
+        self.occupancy = [0, 0]
+        self.mailbox = [EMPTY] * 64
+        self.side = WHITE
+        self.castling = 0
+        self.ep_square = -1
+        self.halfmove = 0
+        self.hash = 0
+        self.history = []
+
+    # ----------------------------
+    # Setup / Conversion
+    # ----------------------------
+    @classmethod
+    def initial(cls):
+        return cls.from_board([
+            ["bR", "bN", "bB", "bQ", "bK", "bB", "bN", "bR"],
+            ["bP"] * 8,
+            [""] * 8,
+            [""] * 8,
+            [""] * 8,
+            [""] * 8,
+            ["wP"] * 8,
+            ["wR", "wN", "wB", "wQ", "wK", "wB", "wN", "wR"],
+        ])
+
+    @classmethod
+    def from_board(cls, board, side="w"):
+        """Build a position from ChessGame's 8x8 list of "wP"-style strings."""
+        pos = cls()
+        for r in range(8):
+            for c in range(8):
+                piece = board[r][c]
+                if piece:
+                    pos.put(r * 8 + c,
+                            COLOR_CODES.index(piece[0]),
+                            PIECE_CODES.index(piece[1]))
+        pos.side = COLOR_CODES.index(side)
+
+        # Grant castling rights only where king and rook are still home
+        homes = [(WHITE_KINGSIDE, WHITE, 60, 63), (WHITE_QUEENSIDE, WHITE, 60, 56),
+                 (BLACK_KINGSIDE, BLACK, 4, 7), (BLACK_QUEENSIDE, BLACK, 4, 0)]
+        for right, color, king_sq, rook_sq in homes:
+            if (pos.mailbox[king_sq] == color * 6 + KING and
+                    pos.mailbox[rook_sq] == color * 6 + ROOK):
+                pos.castling |= right
+        pos.hash = pos.compute_hash()
+        return pos
+
+    @classmethod
+    def from_fen(cls, fen):
+        fields = fen.split()
+        board = []
+        for rank in fields[0].split("/"):
+            row = []
+            for ch in rank:
+                if ch.isdigit():
+                    row.extend([""] * int(ch))
+                else:
+                    row.append(("w" if ch.isupper() else "b") + ch.upper())
+            board.append(row)
+
+        pos = cls.from_board(board, fields[1] if len(fields) > 1 else "w")
+
+        rights = fields[2] if len(fields) > 2 else "-"
+        pos.castling = 0
+        for ch, right in zip("KQkq", (WHITE_KINGSIDE, WHITE_QUEENSIDE,
+                                      BLACK_KINGSIDE, BLACK_QUEENSIDE)):
+            if ch in rights:
+                pos.castling |= right
+
+        ep = fields[3] if len(fields) > 3 else "-"
+        if ep != "-":
+            pos.ep_square = (8 - int(ep[1])) * 8 + "abcdefgh".index(ep[0])
+        if len(fields) > 4:
+            pos.halfmove = int(fields[4])
+        pos.hash = pos.compute_hash()
+        return pos
+
+    def copy(self):
+        pos = Position.__new__(Position)
+        pos.pieces = [self.pieces[0][:], self.pieces[1][:]]
+        pos.occupancy = self.occupancy[:]
+        pos.mailbox = self.mailbox[:]
+        pos.side = self.side
+        pos.castling = self.castling
+        pos.ep_square = self.ep_square
+        pos.halfmove = self.halfmove
+        pos.hash = self.hash
+        pos.history = self.history[:]
+        return pos
+
+    def compute_hash(self):
+        h = 0
+        for sq, piece in enumerate(self.mailbox):
+            if piece != EMPTY:
+                h ^= ZOBRIST_PIECE[piece][sq]
+        h ^= ZOBRIST_CASTLING[self.castling]
+        if self.ep_square >= 0:
+            h ^= ZOBRIST_EP_FILE[self.ep_square & 7]
+        if self.side == BLACK:
+            h ^= ZOBRIST_SIDE
+        return h
+
+    def to_board(self):
+        board = [[""] * 8 for _ in range(8)]
+        for sq, piece in enumerate(self.mailbox):
+            if piece != EMPTY:
+                board[sq >> 3][sq & 7] = self.piece_code(sq)
+        return board
+
+    def piece_code(self, sq):
+        piece = self.mailbox[sq]
+        if piece == EMPTY:
+            return ""
+        color, ptype = divmod(piece, 6)
+        return COLOR_CODES[color] + PIECE_CODES[ptype]
+
+    def put(self, sq, color, ptype):
+        bit = 1 << sq
+        self.pieces[color][ptype] |= bit
+        self.occupancy[color] |= bit
+        self.mailbox[sq] = color * 6 + ptype
+        self.hash ^= ZOBRIST_PIECE[color * 6 + ptype][sq]
+
+    def remove(self, sq):
+        piece = self.mailbox[sq]
+        color, ptype = divmod(piece, 6)
+        mask = ~(1 << sq)
+        self.pieces[color][ptype] &= mask
+        self.occupancy[color] &= mask
+        self.mailbox[sq] = EMPTY
+        self.hash ^= ZOBRIST_PIECE[piece][sq]
+
+    def _shift(self, frm, to):
+        piece = self.mailbox[frm]
+        color, ptype = divmod(piece, 6)
+        flip = (1 << frm) | (1 << to)
+        self.pieces[color][ptype] ^= flip
+        self.occupancy[color] ^= flip
+        self.mailbox[frm] = EMPTY
+        self.mailbox[to] = piece
+        keys = ZOBRIST_PIECE[piece]
+        self.hash ^= keys[frm] ^ keys[to]
+
+    # ----------------------------
+    # Attacks
+    # ----------------------------
+    def king_square(self, color):
+        return self.pieces[color][KING].bit_length() - 1
+
+    def is_attacked(self, sq, by):
+        theirs = self.pieces[by]
+        if KNIGHT_ATTACKS[sq] & theirs[KNIGHT]:
+            return True
+        if PAWN_ATTACKS[by ^ 1][sq] & theirs[PAWN]:
+            return True
+        if KING_ATTACKS[sq] & theirs[KING]:
+            return True
+        occ = self.occupancy[0] | self.occupancy[1]
+        if rook_attacks(sq, occ) & (theirs[ROOK] | theirs[QUEEN]):
+            return True
+        if bishop_attacks(sq, occ) & (theirs[BISHOP] | theirs[QUEEN]):
+            return True
+        return False
+
+    def in_check(self, color=None):
+        if color is None:
+            color = self.side
+        king = self.king_square(color)
+        return king >= 0 and self.is_attacked(king, color ^ 1)
+
+    # ----------------------------
+    # Move Generation
+    # ----------------------------
+    def pseudo_moves(self, from_mask=~0):
+        us = self.side
+        them = us ^ 1
+        own = self.occupancy[us]
+        enemy = self.occupancy[them]
+        occ = own | enemy
+        bb = self.pieces[us]
+        moves = []
+        append = moves.append
+
+        # Pawns
+        if us == WHITE:
+            push, start_row, promo_row = -8, ROW_MASKS[6], ROW_MASKS[0]
+        else:
+            push, start_row, promo_row = 8, ROW_MASKS[1], ROW_MASKS[7]
+
+        pawn_attacks = PAWN_ATTACKS[us]
+        for frm in iter_bits(bb[PAWN] & from_mask):
+            to = frm + push
+            if not 0 <= to < 64:
+                continue
+            if not (occ >> to) & 1:
+                if (1 << to) & promo_row:
+                    for promo in (QUEEN, ROOK, BISHOP, KNIGHT):
+                        append(frm | (to << 6) | (promo << 12))
+                else:
+                    append(frm | (to << 6))
+                    if (1 << frm) & start_row and not (occ >> (to + push)) & 1:
+                        append(frm | ((to + push) << 6) | (DOUBLE_PUSH << 16))
+            attacks = pawn_attacks[frm]
+            for to in iter_bits(attacks & enemy):
+                if (1 << to) & promo_row:
+                    for promo in (QUEEN, ROOK, BISHOP, KNIGHT):
+                        append(frm | (to << 6) | (promo << 12))
+                else:
+                    append(frm | (to << 6))
+            if self.ep_square >= 0 and (attacks >> self.ep_square) & 1:
+                append(frm | (self.ep_square << 6) | (EN_PASSANT << 16))
+
+        # Knights
+        for frm in iter_bits(bb[KNIGHT] & from_mask):
+            for to in iter_bits(KNIGHT_ATTACKS[frm] & ~own):
+                append(frm | (to << 6))
+
+        # Sliders
+        for frm in iter_bits((bb[BISHOP] | bb[QUEEN]) & from_mask):
+            for to in iter_bits(bishop_attacks(frm, occ) & ~own):
+                append(frm | (to << 6))
+        for frm in iter_bits((bb[ROOK] | bb[QUEEN]) & from_mask):
+            for to in iter_bits(rook_attacks(frm, occ) & ~own):
+                append(frm | (to << 6))
+
+        # King
+        for frm in iter_bits(bb[KING] & from_mask):
+            for to in iter_bits(KING_ATTACKS[frm] & ~own):
+                append(frm | (to << 6))
+            self._castle_moves(frm, occ, append)
+
+        return moves
+
+    def _castle_moves(self, king, occ, append):
+        if not self.castling:
+            return
+        if self.side == WHITE:
+            if king != 60:
+                return
+            kingside, queenside = WHITE_KINGSIDE, WHITE_QUEENSIDE
+        else:
+            if king != 4:
+                return
+            kingside, queenside = BLACK_KINGSIDE, BLACK_QUEENSIDE
+        them = self.side ^ 1
+
+        if (self.castling & kingside and
+                not occ & ((1 << (king + 1)) | (1 << (king + 2))) and
+                not self.is_attacked(king, them) and
+                not self.is_attacked(king + 1, them) and
+                not self.is_attacked(king + 2, them)):
+            append(encode_move(king, king + 2, 0, CASTLE))
+
+        if (self.castling & queenside and
+                not occ & ((1 << (king - 1)) | (1 << (king - 2)) | (1 << (king - 3))) and
+                not self.is_attacked(king, them) and
+                not self.is_attacked(king - 1, them) and
+                not self.is_attacked(king - 2, them)):
+            append(encode_move(king, king - 2, 0, CASTLE))
+
+    def legal_moves(self, from_mask=~0):
+        us = self.side
+        legal = []
+        for move in self.pseudo_moves(from_mask):
+            self.make_move(move)
+            if not self.is_attacked(self.pieces[us][KING].bit_length() - 1, us ^ 1):
+                legal.append(move)
+            self.unmake_move()
+        return legal
+
+    def legal_moves_from(self, sq):
+        return self.legal_moves(1 << sq)
+
+    def find_move(self, frm, to, promo=QUEEN):
+        """Return the legal move frm -> to (promoting to `promo`), or None."""
+        for move in self.legal_moves_from(frm):
+            if move_to(move) == to and move_promo(move) in (0, promo):
+                return move
+        return None
+
+    # ----------------------------
+    # Make / Unmake
+    # ----------------------------
+    def make_move(self, move):
+        frm = move & 63
+        to = (move >> 6) & 63
+        promo = (move >> 12) & 7
+        flag = move >> 16
+        us = self.side
+        captured = self.mailbox[to]
+
+        castling = self.castling
+        ep_square = self.ep_square
+        self.history.append((move, captured, castling, ep_square, self.halfmove, self.hash))
+
+        if flag == EN_PASSANT:
+            self.remove(to + 8 if us == WHITE else to - 8)
+        elif captured != EMPTY:
+            self.remove(to)
+
+        moving = self.mailbox[frm]
+        self._shift(frm, to)
+
+        if promo:
+            self.remove(to)
+            self.put(to, us, promo)
+        elif flag == CASTLE:
+            rook_from, rook_to = CASTLE_ROOK[to]
+            self._shift(rook_from, rook_to)
+
+        self.castling &= CASTLE_MASK[frm] & CASTLE_MASK[to]
+        self.ep_square = (frm + to) >> 1 if flag == DOUBLE_PUSH else -1
+
+        h = self.hash ^ ZOBRIST_SIDE
+        if castling != self.castling:
+            h ^= ZOBRIST_CASTLING[castling] ^ ZOBRIST_CASTLING[self.castling]
+        if ep_square >= 0:
+            h ^= ZOBRIST_EP_FILE[ep_square & 7]
+        if self.ep_square >= 0:
+            h ^= ZOBRIST_EP_FILE[self.ep_square & 7]
+        self.hash = h
+        if captured != EMPTY or moving % 6 == PAWN:
+            self.halfmove = 0
+        else:
+            self.halfmove += 1
+        self.side = us ^ 1
+
+    def unmake_move(self):
+        move, captured, castling, ep_square, halfmove, h = self.history.pop()
+        frm = move & 63
+        to = (move >> 6) & 63
+        promo = (move >> 12) & 7
+        flag = move >> 16
+        us = self.side ^ 1
+
+        self.side = us
+        self.castling = castling
+        self.ep_square = ep_square
+        self.halfmove = halfmove
+
+        if promo:
+            self.remove(to)
+            self.put(to, us, PAWN)
+        elif flag == CASTLE:
+            rook_from, rook_to = CASTLE_ROOK[to]
+            self._shift(rook_to, rook_from)
+
+        self._shift(to, frm)
+
+        if flag == EN_PASSANT:
+            self.put(to + 8 if us == WHITE else to - 8, us ^ 1, PAWN)
+        elif captured != EMPTY:
+            color, ptype = divmod(captured, 6)
+            self.put(to, color, ptype)
+        self.hash = h
+
+    def is_repetition(self):
+        """True if the current position occurred since the last irreversible move."""
+        stop = max(len(self.history) - self.halfmove, 0)
+        for i in range(len(self.history) - 2, stop - 1, -2):
+            if self.history[i][5] == self.hash:
+                return True
+        return False
@@ -16,13 +16,19 @@ from kivy.uix.widget import Widget
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
+from kivy.clock import Clock
 from kivy.graphics import Color, Rectangle
 from kivy.core.image import Image as CoreImage
+from games.chess.engine import (
+    Position, COLOR_CODES, move_from, move_to, move_promo, QUEEN
+)
+from games.chess.analysis import AnalysisService
 
 
 class ChessGame(BaseGame):
 
     BOARD_SIZE = 8
+    AI_TIME_LIMIT = 1.0
 
     def __init__(self, db):
         super().__init__(db, "Chess")
@@ -34,6 +40,18 @@ class ChessGame(BaseGame):
         self.current_player = "w"
 
         self.piece_cache = {}
+        self.position = None
+
+        # Persistent canvas instructions, one set per square
+        self.squares = []
+        self.square_state = {}
+        self.board_geometry = None
+
+        # Computer opponent (plays Black when enabled)
+        self.analysis = AnalysisService(time_limit=self.AI_TIME_LIMIT)
+        self.ai_color = None
+        self.ai_request = None
+        self.ai_button = None
 
     # --------------------------------------------------
     # Lifecycle
@@ -45,6 +63,7 @@ class ChessGame(BaseGame):
         self.reset()
 
     def reset(self):
+        self.cancel_ai()
         self.init_board()
         self.selected = None
         self.valid_moves = []
@@ -73,14 +92,19 @@ class ChessGame(BaseGame):
 
         btns = BoxLayout(size_hint_y=None, height=50)
         btns.add_widget(Button(text="Restart", on_release=lambda *_: self.reset()))
-        btns.add_widget(Button(text="Menu", on_release=lambda *_: self.app.switch_to("menu")))
+        self.ai_button = Button(text="Vs Computer: Off", on_release=lambda *_: self.toggle_ai())
+        btns.add_widget(self.ai_button)
+        btns.add_widget(Button(text="Menu", on_release=lambda *_: self.exit_game()))
         root.add_widget(btns)
 
         screen.add_widget(root)
         self.app.switch_to("game")
 
+        self.build_board_canvas()
+
         self.board_widget.bind(on_touch_down=self.on_touch)
         self.board_widget.bind(size=lambda *_: self.draw_board())
+        self.board_widget.bind(pos=lambda *_: self.draw_board())
 
     # --------------------------------------------------
     # Board Setup
@@ -100,12 +124,45 @@ class ChessGame(BaseGame):
             ["wP"]*8,
             ["wR","wN","wB","wQ","wK","wB","wN","wR"],
         ]
+        self.position = Position.from_board(self.board, "w")
 
     # --------------------------------------------------
     # Drawing (Perfect Square + Clean)
     # --------------------------------------------------
-    def draw_board(self):
+    SELECTED_COLOR = (0, 0.6, 1, 0.4)
+    VALID_MOVE_COLOR = (0, 1, 0, 0.3)
+    NO_HIGHLIGHT = (0, 0, 0, 0)
+
+    def build_board_canvas(self):
+        """Create the per-square instructions once; draw_board only updates them."""
         self.board_widget.canvas.clear()
+        self.squares = []
+        self.square_state = {}
+        self.board_geometry = None
+
+        with self.board_widget.canvas:
+            for r in range(8):
+                row = []
+                for c in range(8):
+                    # Modern soft theme
+                    if (r + c) % 2 == 0:
+                        Color(0.92, 0.92, 0.92)
+                    else:
+                        Color(0.35, 0.45, 0.55)
+                    base = Rectangle()
+
+                    highlight_color = Color(*self.NO_HIGHLIGHT)
+                    highlight = Rectangle()
+
+                    piece_color = Color(1, 1, 1, 0)
+                    piece = Rectangle()
+
+                    row.append((base, highlight_color, highlight, piece_color, piece))
+                self.squares.append(row)
+
+    def draw_board(self):
+        if not self.squares:
+            return
 
         w = self.board_widget.width
         h = self.board_widget.height
@@ -116,40 +173,43 @@ class ChessGame(BaseGame):
         offset_x = self.board_widget.x + (w - board_size) / 2
         offset_y = self.board_widget.y + (h - board_size) / 2
 
-        with self.board_widget.canvas:
+        geometry = (offset_x, offset_y, cell)
+        relayout = geometry != self.board_geometry
+        self.board_geometry = geometry
 
-            for r in range(8):
-                for c in range(8):
+        valid = set(self.valid_moves)
+
+        for r in range(8):
+            for c in range(8):
+                base, highlight_color, highlight, piece_color, piece_rect = self.squares[r][c]
 
+                if relayout:
                     x = offset_x + c * cell
                     y = offset_y + r * cell
-
-                    # Modern soft theme
-                    if (r + c) % 2 == 0:
-                        Color(0.92, 0.92, 0.92)
-                    else:
-                        Color(0.35, 0.45, 0.55)
-
-                    Rectangle(pos=(x, y), size=(cell, cell))
-
-                    # Selected highlight
-                    if self.selected == (r, c):
-                        Color(0, 0.6, 1, 0.4)
-                        Rectangle(pos=(x, y), size=(cell, cell))
-
-                    # Valid move highlight
-                    if (r, c) in self.valid_moves:
-                        Color(0, 1, 0, 0.3)
-                        Rectangle(pos=(x, y), size=(cell, cell))
-
-                    piece = self.board[r][c]
-                    if piece:
-                        texture = self.get_piece_texture(piece)
-                        Rectangle(
-                            texture=texture,
-                            pos=(x + cell*0.1, y + cell*0.1),
-                            size=(cell*0.8, cell*0.8)
-                        )
+                    base.pos = highlight.pos = (x, y)
+                    base.size = highlight.size = (cell, cell)
+                    piece_rect.pos = (x + cell*0.1, y + cell*0.1)
+                    piece_rect.size = (cell*0.8, cell*0.8)
+
+                if self.selected == (r, c):
+                    mark = self.SELECTED_COLOR
+                elif (r, c) in valid:
+                    mark = self.VALID_MOVE_COLOR
+                else:
+                    mark = self.NO_HIGHLIGHT
+
+                piece = self.board[r][c]
+                state = (piece, mark)
+                if self.square_state.get((r, c)) == state:
+                    continue
+                self.square_state[(r, c)] = state
+
+                highlight_color.rgba = mark
+                if piece:
+                    piece_rect.texture = self.get_piece_texture(piece)
+                    piece_color.a = 1
+                else:
+                    piece_color.a = 0
 
     # --------------------------------------------------
     # Piece Texture Cache
@@ -199,6 +259,7 @@ class ChessGame(BaseGame):
             self.selected = None
             self.valid_moves = []
             self.draw_board()
+            self.start_ai_turn()
 
         elif piece and piece[0] == self.current_player:
             self.selected = (row, col)
@@ -208,21 +269,30 @@ class ChessGame(BaseGame):
 
 
     # --------------------------------------------------
-    # Minimal Move Logic Hook
-    # (Keep your existing logic if already implemented)
+    # Move Logic (backed by games/chess/engine.py)
     # --------------------------------------------------
-    def get_valid_moves(self, r, c):
-        return []  # Keep your existing logic
-
     def move_piece(self, start, end):
+        """Play start -> end if it is legal; returns whether a move was made."""
         sr, sc = start
         er, ec = end
-        self.board[er][ec] = self.board[sr][sc]
-        self.board[sr][sc] = ""
+        move = self.position.find_move(sr * 8 + sc, er * 8 + ec, QUEEN)
+        if move is None:
+            return False
+        self.position.make_move(move)
+        self.board = self.position.to_board()
+        return True
 
     def switch_turn(self):
         self.current_player = "b" if self.current_player == "w" else "w"
         self.turn_label.text = "White Turn" if self.current_player == "w" else "Black Turn"
+
+        if not self.position.legal_moves():
+            if self.position.in_check():
+                winner = "White" if self.current_player == "b" else "Black"
+                self.turn_label.text = f"Checkmate — {winner} Wins"
+            else:
+                self.turn_label.text = "Stalemate"
+            self.input_locked = True
         
     def is_in_bounds(self, r, c):
         return 0 <= r < 8 and 0 <= c < 8
@@ -236,114 +306,27 @@ class ChessGame(BaseGame):
         return piece and piece[0] == self.current_player
 
     def get_valid_moves(self, r, c):
-        piece = self.board[r][c]
-        if not piece:
+        if not self.board[r][c]:
             return []
 
-        raw_moves = self.get_raw_moves(r, c, piece)
-
         legal_moves = []
-        for move in raw_moves:
-            if not self.would_cause_check((r, c), move):
-                legal_moves.append(move)
+        for move in self.position.legal_moves_from(r * 8 + c):
+            # Under-promotions share a target square; the UI always queens
+            if move_promo(move) not in (0, QUEEN):
+                continue
+            legal_moves.append(divmod(move_to(move), 8))
 
         return legal_moves
-    def would_cause_check(self, start, end):
-        temp = [row[:] for row in self.board]
-
-        sr, sc = start
-        er, ec = end
-
-        temp[er][ec] = temp[sr][sc]
-        temp[sr][sc] = ""
 
-        return self.is_in_check(self.current_player, temp)
-    
-    def is_in_check(self, color, board):
-        king_pos = None
+    def is_in_check(self, color):
+        return self.position.in_check(COLOR_CODES.index(color))
 
-        for r in range(8):
-            for c in range(8):
-                if board[r][c] == color + "K":
-                    king_pos = (r, c)
-                    break
+    def get_raw_moves(self, r, c):
+        return sorted({
+            divmod(move_to(move), 8)
+            for move in self.position.pseudo_moves(1 << (r * 8 + c))
+        })
 
-        enemy = "b" if color == "w" else "w"
-
-        for r in range(8):
-            for c in range(8):
-                piece = board[r][c]
-                if piece and piece[0] == enemy:
-                    moves = self.get_raw_moves(r, c, piece, board_override=board)
-                    if king_pos in moves:
-                        return True
-
-        return False
-    
-    def get_raw_moves(self, r, c, piece, board_override=None):
-        board = board_override if board_override else self.board
-        color = piece[0]
-        p = piece[1]
-        moves = []
-
-        directions = []
-
-        if p == "P":
-            direction = -1 if color == "w" else 1
-            if self.is_in_bounds(r + direction, c) and not board[r + direction][c]:
-                moves.append((r + direction, c))
-
-            for dc in [-1, 1]:
-                nr, nc = r + direction, c + dc
-                if self.is_in_bounds(nr, nc):
-                    if board[nr][nc] and board[nr][nc][0] != color:
-                        moves.append((nr, nc))
-
-        elif p == "R":
-            directions = [(1,0),(-1,0),(0,1),(0,-1)]
-
-        elif p == "B":
-            directions = [(1,1),(1,-1),(-1,1),(-1,-1)]
-
-        elif p == "Q":
-            directions = [(1,0),(-1,0),(0,1),(0,-1),
-                        (1,1),(1,-1),(-1,1),(-1,-1)]
-
-        elif p == "N":
-            jumps = [(2,1),(2,-1),(-2,1),(-2,-1),
-                    (1,2),(1,-2),(-1,2),(-1,-2)]
-            for dr, dc in jumps:
-                nr, nc = r + dr, c + dc
-                if self.is_in_bounds(nr, nc):
-                    if not board[nr][nc] or board[nr][nc][0] != color:
-                        moves.append((nr, nc))
-            return moves
-
-        elif p == "K":
-            for dr in [-1,0,1]:
-                for dc in [-1,0,1]:
-                    if dr == 0 and dc == 0:
-                        continue
-                    nr, nc = r + dr, c + dc
-                    if self.is_in_bounds(nr, nc):
-                        if not board[nr][nc] or board[nr][nc][0] != color:
-                            moves.append((nr, nc))
-            return moves
-
-    # Sliding pieces
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            while self.is_in_bounds(nr, nc):
-                if not board[nr][nc]:
-                    moves.append((nr, nc))
-                else:
-                    if board[nr][nc][0] != color:
-                        moves.append((nr, nc))
-                    break
-                nr += dr
-                nc += dc
-
-        return moves
     def serialize_move(self, start, end):
         return {
             "type": "move",
@@ -355,13 +338,62 @@ class ChessGame(BaseGame):
         start = tuple(move_data["from"])
         end = tuple(move_data["to"])
 
-        self.move_piece(start, end)
+        if not self.move_piece(start, end):
+            # Illegal here (e.g. a desynced peer); keep the turn where it is
+            return
+        self.input_locked = False
         self.switch_turn()
 
-        self.input_locked = False
         self.draw_board()
 
+    # --------------------------------------------------
+    # Computer Opponent
+    # --------------------------------------------------
+    def toggle_ai(self):
+        if self.multiplayer_enabled:
+            return
+        if self.ai_color and self.current_player == self.ai_color:
+            # Abandon the search in flight and hand the move back
+            self.cancel_ai()
+            self.input_locked = False
+
+        self.ai_color = None if self.ai_color else "b"
+        self.ai_button.text = "Vs Computer: On" if self.ai_color else "Vs Computer: Off"
+        self.start_ai_turn()
+
+    def cancel_ai(self):
+        if self.ai_request:
+            self.ai_request.cancel()
+            self.ai_request = None
+
+    def start_ai_turn(self):
+        if self.current_player != self.ai_color or self.input_locked:
+            return
 
+        self.input_locked = True
+        self.ai_request = self.analysis.analyse(self.position, self._on_ai_result)
 
+    def _on_ai_result(self, result):
+        # Widgets may only be touched on the main thread, not the pool's
+        Clock.schedule_once(lambda dt: self._apply_ai_move(result))
 
+    def _apply_ai_move(self, result):
+        request = self.ai_request
+        if not request or request.cancelled or result["generation"] != request.generation:
+            return
+        self.ai_request = None
 
+        move = result["best_move"]
+        if move is None:
+            # Search failed (mate and stalemate never start one); hand the board back
+            self.input_locked = False
+            return
+        self.apply_remote_move({
+            "from": divmod(move_from(move), 8),
+            "to": divmod(move_to(move), 8),
+        })
+
+    def exit_game(self):
+        self.cancel_ai()
+        self.analysis.shutdown()
+        self.app.switch_to("menu")
@@ -0,0 +1,152 @@
+# =====================================
+# Chess Perft — Headless Benchmark & Correctness Suite
+# =====================================
+# Usage (from the project root, no Kivy window needed):
+#   python -m games.chess.perft                       # run the suite
+#   python -m games.chess.perft --depth 4             # start position
+#   python -m games.chess.perft --fen "<fen>" --depth 3 --divide
+#   python -m games.chess.perft --bench --json        # one JSON line per run
+import argparse
+import json
+import sys
+import time
+
+from games.chess.engine import Position, move_to_uci
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# Published node counts (chessprogramming.org/Perft_Results)
+PERFT_SUITE = [
+    ("startpos", START_FEN,
+     [20, 400, 8902, 197281, 4865609]),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+     [48, 2039, 97862, 4085603]),
+    ("position3", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+     [14, 191, 2812, 43238, 674624]),
+    ("position4", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+     [6, 264, 9467, 422333]),
+    ("position5", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+     [44, 1486, 62379, 2103487]),
+    ("position6", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+     [46, 2079, 89890, 3894594]),
+]
+
+# Default depth per suite entry — keeps a full run to a few seconds
+SUITE_DEPTH = 3
+
+
+# --------------------------------------------------
+# Perft
+# --------------------------------------------------
+def perft(pos, depth):
+    if depth == 0:
+        return 1
+
+    moves = pos.legal_moves()
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        pos.make_move(move)
+        nodes += perft(pos, depth - 1)
+        pos.unmake_move()
+    return nodes
+
+
+def divide(pos, depth):
+    """Node count below each root move, for diffing against another engine."""
+    counts = {}
+    for move in pos.legal_moves():
+        pos.make_move(move)
+        counts[move_to_uci(move)] = perft(pos, depth - 1)
+        pos.unmake_move()
+    return counts
+
+
+def timed_perft(fen, depth):
+    pos = Position.from_fen(fen)
+    t0 = time.perf_counter()
+    nodes = perft(pos, depth)
+    elapsed = time.perf_counter() - t0
+    return {
+        "fen": fen,
+        "depth": depth,
+        "nodes": nodes,
+        "seconds": round(elapsed, 4),
+        "nps": int(nodes / elapsed) if elapsed > 0 else 0,
+    }
+
+
+# --------------------------------------------------
+# Suite
+# --------------------------------------------------
+def run_suite(max_depth=SUITE_DEPTH, out=print):
+    failures = 0
+    total_nodes = 0
+    total_time = 0.0
+
+    for name, fen, expected in PERFT_SUITE:
+        for depth in range(1, min(max_depth, len(expected)) + 1):
+            result = timed_perft(fen, depth)
+            total_nodes += result["nodes"]
+            total_time += result["seconds"]
+
+            ok = result["nodes"] == expected[depth - 1]
+            if not ok:
+                failures += 1
+            out(f"{'ok  ' if ok else 'FAIL'} {name:<10} depth {depth}: "
+                f"{result['nodes']:>9} (expected {expected[depth - 1]}) "
+                f"{result['nps']:>8} nps")
+
+    nps = int(total_nodes / total_time) if total_time > 0 else 0
+    out(f"{total_nodes} nodes in {total_time:.2f}s — {nps} nps, {failures} failure(s)")
+    return failures
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chess move generator perft")
+    parser.add_argument("--fen", help="position to search (default: start position)")
+    parser.add_argument("--depth", type=int, help="search depth")
+    parser.add_argument("--divide", action="store_true", help="print counts per root move")
+    parser.add_argument("--bench", action="store_true",
+                        help="time the start position at --depth (default 4)")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args(argv)
+
+    if args.fen is None and args.depth is None and not args.bench:
+        return 1 if run_suite() else 0
+
+    fen = args.fen or START_FEN
+    depth = args.depth or 4
+
+    if args.divide:
+        counts = divide(Position.from_fen(fen), depth)
+        for move, nodes in sorted(counts.items()):
+            print(f"{move}: {nodes}")
+        print(f"\nNodes: {sum(counts.values())}")
+        return 0
+
+    result = timed_perft(fen, depth)
+    for name, suite_fen, expected in PERFT_SUITE:
+        if suite_fen == fen and depth <= len(expected):
+            result["expected"] = expected[depth - 1]
+            result["ok"] = result["nodes"] == expected[depth - 1]
+
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"depth {depth}: {result['nodes']} nodes in {result['seconds']}s "
+              f"({result['nps']} nps)")
+        if "ok" in result:
+            print("matches published count" if result["ok"]
+                  else f"MISMATCH, expected {result['expected']}")
+
+    return 0 if result.get("ok", True) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
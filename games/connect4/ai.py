@@ -0,0 +1,343 @@
+# =====================================
+# Connect 4 AI — Negamax Solver
+# =====================================
+# Scores follow the usual solver convention: a win with the side to move
+# playing its k-th stone last scores (SIZE + 1 - moves) // 2, i.e. faster
+# wins score higher; 0 is a draw and negative scores are losses.
+import time
+
+from core.worker_pool import SearchWorker, cancel_requested
+from games.connect4.engine import (
+    Connect4Position, SIZE, BOTTOM_MASK, BOARD_MASK, COLUMN_MASK,
+    COLUMN_ORDER, winning_cells, popcount,
+)
+
+# TT bound types
+LOWER, UPPER = range(2)
+
+# Depth-limited search values: a forced win is worth more than any
+# evaluation, sooner wins more than later ones
+WIN_VALUE = 1000
+THREAT_VALUE = 4
+CENTER_MASK = COLUMN_MASK[COLUMN_ORDER[0]]
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+def _non_losing_moves(current, mask):
+    """Playable cells that do not hand the opponent an immediate win."""
+    possible = (mask + BOTTOM_MASK) & BOARD_MASK
+    opponent_win = winning_cells(current ^ mask, mask)
+    forced = possible & opponent_win
+    if forced:
+        if forced & (forced - 1):
+            # Two threats at once cannot both be blocked
+            return 0
+        possible = forced
+    # Never play directly below a cell the opponent needs
+    return possible & ~(opponent_win >> 1)
+
+
+class Connect4AI:
+
+    # A few milliseconds of search between clock checks
+    CHECK_EVERY = 256
+
+    def __init__(self, time_limit=1.0, tt_bits=20, book=None):
+        self.time_limit = time_limit
+        self.book = book
+        self.tt_mask = (1 << tt_bits) - 1
+        self.tt = [None] * (1 << tt_bits)
+        self.nodes = 0
+        self.deadline = None
+        # Worker processes point this at their cancel flag
+        self.stop_check = None
+
+    # ----------------------------
+    # Public API
+    # ----------------------------
+    def solve(self, pos, time_limit=None):
+        """
+        Exact score of `pos` for the side to move, or None if the time
+        budget runs out first.
+        """
+        budget = self.time_limit if time_limit is None else time_limit
+        self.deadline = time.perf_counter() + budget
+        self.nodes = 0
+        try:
+            return self._solve(pos.current, pos.mask, pos.moves)
+        except SearchTimeout:
+            return None
+
+    def column_scores(self, pos, time_limit=None):
+        """
+        {col: score} for every playable column, from the mover's point of
+        view; a column maps to None when it could not be solved in time.
+        """
+        budget = self.time_limit if time_limit is None else time_limit
+        self.deadline = time.perf_counter() + budget
+        self.nodes = 0
+        scores = {}
+        timed_out = False
+        for col in COLUMN_ORDER:
+            if not pos.can_play(col):
+                continue
+            if pos.is_winning_move(col):
+                scores[col] = (SIZE + 1 - pos.moves) // 2
+                continue
+            # Once the budget is spent, the remaining columns are not started
+            if timed_out or time.perf_counter() > self.deadline:
+                timed_out = True
+                scores[col] = None
+                continue
+            child = pos.copy()
+            child.play(col)
+            try:
+                scores[col] = -self._solve(child.current, child.mask, child.moves)
+            except SearchTimeout:
+                timed_out = True
+                scores[col] = None
+        return scores
+
+    def best_move(self, pos, time_limit=None):
+        """(column, score) to play; score is None when not solved in time."""
+        if self.book:
+            entry = self.book.best_move(pos)
+            if entry is not None:
+                return entry
+
+        scores = self.column_scores(pos, time_limit)
+        if not scores:
+            return None, None
+        solved = {c: s for c, s in scores.items() if s is not None}
+        unsolved = [c for c, s in scores.items() if s is None]
+        if not unsolved or (solved and max(solved.values()) >= 0):
+            col = max(solved, key=lambda c: solved[c])
+            return col, solved[col]
+
+        # Out of time and nothing proven safe: pick among the unsolved columns
+        # with the move ordering heuristic
+        return self._heuristic_move(pos, unsolved), None
+
+    def search_depth(self, pos, depth, time_limit=None):
+        """
+        (column, value) from an alpha-beta search `depth` plies deep that
+        scores the horizon with evaluate(); for positions too early to
+        solve. Values are heuristic, not solver scores.
+        """
+        budget = self.time_limit if time_limit is None else time_limit
+        self.deadline = time.perf_counter() + budget
+        self.nodes = 0
+        current, mask, moves = pos.current, pos.mask, pos.moves
+
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        columns = [c for c in COLUMN_ORDER if possible & COLUMN_MASK[c]]
+        if not columns:
+            return None, None
+        for col in columns:
+            if pos.is_winning_move(col):
+                return col, WIN_VALUE + SIZE - moves
+
+        # Prefer moves that do not lose at once; any move when all do
+        safe = _non_losing_moves(current, mask)
+        columns = [c for c in columns if safe & COLUMN_MASK[c]] or columns
+
+        best, best_value = columns[0], -2 * WIN_VALUE
+        for col in columns:
+            move = possible & COLUMN_MASK[col]
+            try:
+                value = -self._alphabeta(current ^ mask, mask | move, moves + 1,
+                                         depth - 1, -2 * WIN_VALUE, -best_value)
+            except SearchTimeout:
+                break
+            if value > best_value:
+                best, best_value = col, value
+        return best, best_value
+
+    def hint(self, pos, time_limit=None):
+        """Suggested column for the side to move, or None if the board is full."""
+        col, _ = self.best_move(pos, time_limit)
+        return col
+
+    # ----------------------------
+    # Internals
+    # ----------------------------
+    def _tick(self):
+        self.nodes += 1
+        if self.nodes % self.CHECK_EVERY == 0:
+            if time.perf_counter() > self.deadline:
+                raise SearchTimeout()
+            if self.stop_check and self.stop_check():
+                raise SearchTimeout()
+
+    def _heuristic_move(self, pos, columns):
+        current, mask = pos.current, pos.mask
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        best, best_threats = columns[0], -1
+        for col in columns:
+            move = possible & COLUMN_MASK[col]
+            threats = popcount(winning_cells(current | move, mask | move))
+            if threats > best_threats:
+                best, best_threats = col, threats
+        return best
+
+    def _solve(self, current, mask, moves):
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        if possible & winning_cells(current, mask):
+            return (SIZE + 1 - moves) // 2
+
+        # Null-window searches narrow [low, high] down to the exact score
+        low = -((SIZE - moves) // 2)
+        high = (SIZE + 1 - moves) // 2
+        while low < high:
+            mid = low + (high - low) // 2
+            if mid <= 0 and int(low / 2) < mid:
+                mid = int(low / 2)
+            elif mid >= 0 and int(high / 2) > mid:
+                mid = int(high / 2)
+            result = self._negamax(current, mask, moves, mid, mid + 1)
+            if result <= mid:
+                high = result
+            else:
+                low = result
+        return low
+
+    def _negamax(self, current, mask, moves, alpha, beta):
+        # Precondition: the side to move cannot win immediately
+        self._tick()
+
+        candidates = _non_losing_moves(current, mask)
+        if not candidates:
+            return -((SIZE - moves) // 2)
+        if moves >= SIZE - 2:
+            return 0
+
+        # We cannot win before our next-but-one stone, nor lose before theirs
+        low = -((SIZE - 2 - moves) // 2)
+        if alpha < low:
+            alpha = low
+            if alpha >= beta:
+                return alpha
+
+        high = (SIZE - 1 - moves) // 2
+        key = current + mask
+        slot = key & self.tt_mask
+        entry = self.tt[slot]
+        if entry is not None and entry[0] == key:
+            if entry[2] == UPPER:
+                if entry[1] < high:
+                    high = entry[1]
+            elif entry[1] > low:
+                low = entry[1]
+                if alpha < low:
+                    alpha = low
+                    if alpha >= beta:
+                        return alpha
+        if beta > high:
+            beta = high
+            if alpha >= beta:
+                return beta
+
+        # Most new threats first; ties keep the centre-first column order
+        ordered = []
+        for col in COLUMN_ORDER:
+            move = candidates & COLUMN_MASK[col]
+            if move:
+                ordered.append((popcount(winning_cells(current | move, mask)), move))
+        ordered.sort(key=lambda item: -item[0])
+
+        opponent = current ^ mask
+        for _, move in ordered:
+            score = -self._negamax(opponent, mask | move, moves + 1, -beta, -alpha)
+            if score >= beta:
+                self.tt[slot] = (key, score, LOWER)
+                return score
+            if score > alpha:
+                alpha = score
+
+        self.tt[slot] = (key, alpha, UPPER)
+        return alpha
+
+    def _alphabeta(self, current, mask, moves, depth, alpha, beta):
+        self._tick()
+
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        if possible & winning_cells(current, mask):
+            return WIN_VALUE + SIZE - moves
+        candidates = _non_losing_moves(current, mask)
+        if not candidates:
+            return -(WIN_VALUE + SIZE - moves - 1)
+        if moves >= SIZE - 2:
+            return 0
+        if depth <= 0:
+            return evaluate(current, mask)
+
+        ordered = []
+        for col in COLUMN_ORDER:
+            move = candidates & COLUMN_MASK[col]
+            if move:
+                ordered.append((popcount(winning_cells(current | move, mask)), move))
+        ordered.sort(key=lambda item: -item[0])
+
+        opponent = current ^ mask
+        for _, move in ordered:
+            value = -self._alphabeta(opponent, mask | move, moves + 1, depth - 1, -beta, -alpha)
+            if value >= beta:
+                return value
+            if value > alpha:
+                alpha = value
+        return alpha
+
+
+def evaluate(current, mask):
+    """Open threats and centre stones, for the side to move."""
+    opponent = current ^ mask
+    threats = popcount(winning_cells(current, mask)) - popcount(winning_cells(opponent, mask))
+    center = popcount(current & CENTER_MASK) - popcount(opponent & CENTER_MASK)
+    return THREAT_VALUE * threats + center
+
+
+def describe_score(score, moves):
+    """Human readable outcome for a solver score at `moves` stones played."""
+    if score is None:
+        return "unclear"
+    if score == 0:
+        return "draw"
+    # Stones the winner still needs to place
+    if score > 0:
+        return f"wins in {(SIZE + 1 - moves) // 2 - score + 1}"
+    return f"loses in {(SIZE - moves) // 2 + score + 1}"
+
+
+# --------------------------------------------------
+# Worker Process
+# --------------------------------------------------
+_worker_ai = None
+
+
+def _search_job(state, time_limit, generation):
+    global _worker_ai
+    if _worker_ai is None:
+        # book.py builds on this module, so it is only imported here
+        from games.connect4.book import OpeningBook
+        # One solver (and one mmap of the book) per worker, kept between moves
+        _worker_ai = Connect4AI(book=OpeningBook.load())
+    if cancel_requested(generation):
+        return None, None
+    _worker_ai.stop_check = lambda: cancel_requested(generation)
+    return _worker_ai.best_move(Connect4Position(*state), time_limit)
+
+
+class Connect4AIWorker(SearchWorker):
+    """Runs Connect4AI.best_move in a background process."""
+
+    def __init__(self, time_limit=1.0):
+        super().__init__(_search_job, failed=(None, None), name="Connect4 AI")
+        self.time_limit = time_limit
+
+    def request_move(self, pos, callback):
+        """Search `pos` and call callback(column, score); column is None if the search failed."""
+        state = (pos.current, pos.mask, pos.moves)
+        return self.submit(callback, state, self.time_limit)
@@ -0,0 +1,134 @@
+# =====================================
+# Connect 4 Engine — Two-Bitboard Position
+# =====================================
+# Each column takes HEIGHT + 1 bits (one spare sentinel bit on top), so
+# bit = col * H1 + height where height 0 is the bottom cell. A position is
+# `current` (stones of the player to move) plus `mask` (all stones); the
+# opponent's stones are current ^ mask. Rows in Connect4Game.board count
+# from the top, so board row r is height ROWS - 1 - r.
+
+WIDTH = 7
+HEIGHT = 6
+H1 = HEIGHT + 1
+SIZE = WIDTH * HEIGHT
+
+BOTTOM = [1 << (c * H1) for c in range(WIDTH)]
+TOP = [1 << (c * H1 + HEIGHT - 1) for c in range(WIDTH)]
+COLUMN_MASK = [((1 << HEIGHT) - 1) << (c * H1) for c in range(WIDTH)]
+
+BOTTOM_MASK = sum(BOTTOM)
+BOARD_MASK = BOTTOM_MASK * ((1 << HEIGHT) - 1)
+
+# Centre columns take part in more lines, so they are searched first
+COLUMN_ORDER = sorted(range(WIDTH), key=lambda c: abs(WIDTH // 2 - c))
+
+
+def alignment(bb):
+    """True if `bb` holds four in a row in any direction."""
+    # Horizontal, diagonals (/ and \), vertical
+    for shift in (H1, H1 + 1, H1 - 1, 1):
+        pairs = bb & (bb >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
+def winning_cells(bb, mask):
+    """Empty cells (on or off the playable surface) that would complete four for `bb`."""
+    # Vertical: three stacked stones
+    r = (bb << 1) & (bb << 2) & (bb << 3)
+
+    for shift in (H1, H1 + 1, H1 - 1):
+        # Gap at either end of three, or inside a pattern like xx.x / x.xx
+        p = (bb << shift) & (bb << 2 * shift)
+        r |= p & (bb << 3 * shift)
+        r |= p & (bb >> shift)
+        p = (bb >> shift) & (bb >> 2 * shift)
+        r |= p & (bb >> 3 * shift)
+        r |= p & (bb << shift)
+
+    return r & (BOARD_MASK ^ mask)
+
+
+def popcount(bb):
+    return bin(bb).count("1")
+
+
+def board_cell(bit):
+    """(row, col) of Connect4Game.board for a single-bit move."""
+    index = bit.bit_length() - 1
+    col, height = divmod(index, H1)
+    return HEIGHT - 1 - height, col
+
+
+# --------------------------------------------------
+# Position
+# --------------------------------------------------
+class Connect4Position:
+
+    __slots__ = ("current", "mask", "moves")
+
+    def __init__(self, current=0, mask=0, moves=0):
+        self.current = current
+        self.mask = mask
+        self.moves = moves
+
+    @classmethod
+    def from_board(cls, board, player):
+        """Build from Connect4Game.board (rows top-first) with `player` to move."""
+        current = mask = moves = 0
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if not cell:
+                    continue
+                bit = 1 << (c * H1 + HEIGHT - 1 - r)
+                mask |= bit
+                moves += 1
+                if cell == player:
+                    current |= bit
+        return cls(current, mask, moves)
+
+    def copy(self):
+        return Connect4Position(self.current, self.mask, self.moves)
+
+    def key(self):
+        """Unique integer for the position: current + mask sets one extra bit per column."""
+        return self.current + self.mask
+
+    # ----------------------------
+    # Moves
+    # ----------------------------
+    def can_play(self, col):
+        return not self.mask & TOP[col]
+
+    def height(self, col):
+        return popcount(self.mask & COLUMN_MASK[col])
+
+    def play(self, col):
+        """Drop a stone for the side to move; returns the board (row, col) it lands on."""
+        bit = (self.mask + BOTTOM[col]) & COLUMN_MASK[col]
+        self.current ^= self.mask
+        self.mask |= bit
+        self.moves += 1
+        return board_cell(bit)
+
+    def playable(self):
+        """Bitboard of the cell each non-full column would fill next."""
+        return (self.mask + BOTTOM_MASK) & BOARD_MASK
+
+    def is_winning_move(self, col):
+        bit = (self.mask + BOTTOM[col]) & COLUMN_MASK[col]
+        return bool(bit & winning_cells(self.current, self.mask))
+
+    def can_win_next(self):
+        return bool(self.playable() & winning_cells(self.current, self.mask))
+
+    # ----------------------------
+    # Game State
+    # ----------------------------
+    def last_player_won(self):
+        """True if the player who just moved has four in a row."""
+        return alignment(self.current ^ self.mask)
+
+    def is_full(self):
+        return self.moves == SIZE
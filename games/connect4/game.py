@@ -2,6 +2,7 @@
 # Connect 4 — Circular Disc with Drop Animation
 # =====================================
 from core.base_game import BaseGame
+from kivy.clock import Clock
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.button import Button
 from kivy.uix.boxlayout import BoxLayout
@@ -10,6 +11,8 @@ from kivy.uix.popup import Popup
 from kivy.graphics import Color, Ellipse, Rectangle
 from kivy.animation import Animation
 from datetime import datetime
+from games.connect4.engine import Connect4Position, alignment
+from games.connect4.ai import Connect4AIWorker, describe_score
 
 
 class Connect4Game(BaseGame):
@@ -22,15 +25,31 @@ class Connect4Game(BaseGame):
         "O": (0.95, 0.9, 0.1, 1),   # yellow
     }
 
+    AI_TIME_LIMIT = 0.5
+    AI_DELAY = 0.4      # let the player's disc land first
+
     def __init__(self , db):
         super().__init__(db, "Connect4")
         self.board = [["" for _ in range(self.COLS)] for _ in range(self.ROWS)]
         self.current_player = "X"
+        self.position = Connect4Position()
         self.cell_map = [[None for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        # Persistent disc layer: one (Color, Ellipse) per cell
+        self.discs = [[None for _ in range(self.COLS)] for _ in range(self.ROWS)]
         self.turn_label = None
         self.grid = None
         self._popup = None
 
+        # Computer opponent (plays O when enabled) and hints, searched in a
+        # worker process; early positions come from the opening book there
+        self.ai = Connect4AIWorker(time_limit=self.AI_TIME_LIMIT)
+        self.ai_player = None
+        self.ai_event = None
+        self.ai_generation = 0
+        self.ai_thinking = False
+        self.ai_button = None
+        self.game_over = False
+
     # -----------------------------------------------------------
     def start(self, app):
         from kivy.app import App
@@ -40,11 +59,15 @@ class Connect4Game(BaseGame):
         self.reset()
 
     def reset(self):
+        self.cancel_ai()
         self.board = [["" for _ in range(self.COLS)] for _ in range(self.ROWS)]
         self.current_player = "X"
-        for r in range(self.ROWS):
-            for c in range(self.COLS):
-                self.update_cell_disc(r, c)
+        self.position = Connect4Position()
+        self.game_over = False
+        if self.grid:
+            for r in range(self.ROWS):
+                for c in range(self.COLS):
+                    self.update_cell_disc(r, c)
         if self.turn_label:
             self.turn_label.text = f"Player {self.current_player}'s Turn"
 
@@ -58,39 +81,103 @@ class Connect4Game(BaseGame):
     # Gameplay
     # -----------------------------------------------------------
     def handle_input(self, col):
-        for row in range(self.ROWS - 1, -1, -1):
-            if self.board[row][col] == "":
-                self.board[row][col] = self.current_player
-                self.update_cell_disc(row, col)
-
-                if self.check_winner(row, col):
-                    self.end_game(f"Player {self.current_player} wins!", self.current_player, "Win")
-                elif all(self.board[r][c] != "" for r in range(self.ROWS) for c in range(self.COLS)):
-                    self.end_game("It's a Draw!", "None", "Draw")
-                else:
-                    self.current_player = "O" if self.current_player == "X" else "X"
-                    self.turn_label.text = f"Player {self.current_player}'s Turn"
-                return
-        self.show_message("Column is full!")
+        if self.game_over or self.current_player == self.ai_player:
+            return
+        self.drop_disc(col)
+
+    def drop_disc(self, col):
+        if not self.position.can_play(col):
+            self.show_message("Column is full!")
+            return
+
+        row, _ = self.position.play(col)
+        self.board[row][col] = self.current_player
+        self.update_cell_disc(row, col, animate=True)
+
+        if self.check_winner(row, col):
+            self.game_over = True
+            self.end_game(f"Player {self.current_player} wins!", self.current_player, "Win")
+        elif self.position.is_full():
+            self.game_over = True
+            self.end_game("It's a Draw!", "None", "Draw")
+        else:
+            self.current_player = "O" if self.current_player == "X" else "X"
+            self.turn_label.text = f"Player {self.current_player}'s Turn"
+            self.start_ai_turn()
 
     def check_winner(self, row, col):
-        player = self.board[row][col]
-        if not player:
+        # The bitboards already hold the last move; the player who made it is
+        # the one not on move any more
+        if not self.board[row][col]:
             return False
+        return alignment(self.position.current ^ self.position.mask)
+
+    # -----------------------------------------------------------
+    # Computer Opponent / Hints
+    # -----------------------------------------------------------
+    def toggle_ai(self):
+        self.cancel_ai()
+        self.ai_player = None if self.ai_player else "O"
+        self.ai_button.text = "Vs Computer: On" if self.ai_player else "Vs Computer: Off"
+        self.start_ai_turn()
+
+    def cancel_ai(self):
+        if self.ai_event:
+            self.ai_event.cancel()
+            self.ai_event = None
+        # Results of any search in flight are dropped, and the worker freed
+        self.ai_generation += 1
+        self.ai_thinking = False
+        self.ai.cancel()
+
+    def start_ai_turn(self):
+        if self.game_over or self.current_player != self.ai_player:
+            return
+        if self.ai_event or self.ai_thinking:
+            return
+        self.ai_event = Clock.schedule_once(lambda dt: self._play_ai_move(), self.AI_DELAY)
+
+    def _play_ai_move(self):
+        self.ai_event = None
+        if self.game_over or self.current_player != self.ai_player:
+            return
+
+        self.ai_thinking = True
+        generation = self.ai_generation
+        self.ai.request_move(
+            self.position,
+            lambda col, score: Clock.schedule_once(
+                lambda dt: self._apply_ai_move(generation, col)
+            ),
+        )
 
-        def count_dir(dr, dc):
-            r, c, count = row + dr, col + dc, 0
-            while 0 <= r < self.ROWS and 0 <= c < self.COLS and self.board[r][c] == player:
-                count += 1
-                r += dr
-                c += dc
-            return count
+    def _apply_ai_move(self, generation, col):
+        if generation != self.ai_generation or not self.ai_thinking:
+            return
+        self.ai_thinking = False
+        if col is not None and not self.game_over:
+            self.drop_disc(col)
 
-        for dr, dc in [(0, 1), (1, 0), (1, 1), (1, -1)]:
-            total = 1 + count_dir(dr, dc) + count_dir(-dr, -dc)
-            if total >= 4:
-                return True
-        return False
+    def show_hint(self):
+        if self.game_over or self.current_player == self.ai_player:
+            return
+
+        # A hint is only shown for the position it was asked about
+        generation = self.ai_generation
+        moves = self.position.moves
+        self.ai.request_move(
+            self.position,
+            lambda col, score: Clock.schedule_once(
+                lambda dt: self._show_hint_result(generation, moves, col, score)
+            ),
+        )
+
+    def _show_hint_result(self, generation, moves, col, score):
+        if generation != self.ai_generation or moves != self.position.moves:
+            return
+        if col is None or self.game_over:
+            return
+        self.show_message(f"Try column {col + 1} ({describe_score(score, moves)})")
 
     # -----------------------------------------------------------
     # UI
@@ -124,12 +211,21 @@ class Connect4Game(BaseGame):
             for c in range(self.COLS):
                 cell = Button(disabled=True)
                 self.cell_map[r][c] = cell
-                self.update_cell_disc(r, c)
+                self.build_cell_canvas(r, c)
                 self.grid.add_widget(cell)
         layout.add_widget(self.grid)
 
+        controls = BoxLayout(size_hint_y=None, height=40, spacing=5)
+        controls.add_widget(Button(text="Hint", on_release=lambda x: self.show_hint()))
+        self.ai_button = Button(
+            text="Vs Computer: On" if self.ai_player else "Vs Computer: Off",
+            on_release=lambda x: self.toggle_ai(),
+        )
+        controls.add_widget(self.ai_button)
+        layout.add_widget(controls)
+
         layout.add_widget(Button(text="Restart", size_hint_y=None, height=40, on_release=lambda x: self.reset()))
-        layout.add_widget(Button(text="Back to Menu", size_hint_y=None, height=40, on_release=lambda x: app.switch_to("menu")))
+        layout.add_widget(Button(text="Back to Menu", size_hint_y=None, height=40, on_release=lambda x: self.exit_game(app)))
 
         screen.add_widget(layout)
         app.switch_to("game")
@@ -137,38 +233,72 @@ class Connect4Game(BaseGame):
     # -----------------------------------------------------------
     # Drawing + Animation
     # -----------------------------------------------------------
-    def update_cell_disc(self, row, col):
-        """Draw a disc and animate falling."""
+    EMPTY_DISC = (0, 0, 0, 0)
+
+    def build_cell_canvas(self, row, col):
+        """Create the cell's base and disc instructions once and bind its layout."""
         cell = self.cell_map[row][col]
-        state = self.board[row][col]
         cell.canvas.before.clear()
+        cell.canvas.after.clear()
+        cell.text = ""
 
-        # Base
         with cell.canvas.before:
             Color(0.05, 0.05, 0.05, 1)
-            Rectangle(pos=cell.pos, size=cell.size)
+            base = Rectangle()
 
-        if state:
-            color = self.COLORS[state]
-            disc_size = min(cell.width, cell.height) * 0.8
-            start_y = cell.top + 150
-            end_y = cell.y + (cell.height - disc_size) / 2
-            x_pos = cell.x + (cell.width - disc_size) / 2
+        with cell.canvas.after:
+            color = Color(*self.EMPTY_DISC)
+            disc = Ellipse()
 
-            with cell.canvas.after:
-                Color(*color)
-                disc = Ellipse(pos=(x_pos, start_y), size=(disc_size, disc_size))
+        self.discs[row][col] = (base, color, disc)
+        cell.bind(pos=lambda *a: self.layout_cell(row, col),
+                  size=lambda *a: self.layout_cell(row, col))
+        self.layout_cell(row, col)
+        self.update_cell_disc(row, col)
 
-            self._animate_disc_fall(disc, (x_pos, end_y))
+    def disc_rest(self, row, col):
+        """Resting (pos, size) of the disc inside its cell."""
+        cell = self.cell_map[row][col]
+        disc_size = min(cell.width, cell.height) * 0.8
+        x_pos = cell.x + (cell.width - disc_size) / 2
+        y_pos = cell.y + (cell.height - disc_size) / 2
+        return (x_pos, y_pos), (disc_size, disc_size)
 
-        cell.bind(pos=lambda i, v: self.update_cell_disc(row, col))
-        cell.bind(size=lambda i, v: self.update_cell_disc(row, col))
-        cell.text = ""
+    def layout_cell(self, row, col):
+        cell = self.cell_map[row][col]
+        base, _, disc = self.discs[row][col]
+        base.pos = cell.pos
+        base.size = cell.size
+
+        # A resize mid-drop just lands the disc where it belongs
+        Animation.cancel_all(disc)
+        disc.pos, disc.size = self.disc_rest(row, col)
+
+    def update_cell_disc(self, row, col, animate=False):
+        """Recolour the cell's disc; `animate` drops it in from above."""
+        if self.discs[row][col] is None:
+            return
+        _, color, disc = self.discs[row][col]
+        state = self.board[row][col]
+        color.rgba = self.COLORS[state] if state else self.EMPTY_DISC
+
+        Animation.cancel_all(disc)
+        final_pos, disc.size = self.disc_rest(row, col)
+        if state and animate:
+            disc.pos = (final_pos[0], self.cell_map[row][col].top + 150)
+            self._animate_disc_fall(disc, final_pos)
+        else:
+            disc.pos = final_pos
 
     def _animate_disc_fall(self, disc, final_pos):
         anim = Animation(pos=final_pos, duration=0.35, t='out_bounce')
         anim.start(disc)
 
+    def exit_game(self, app):
+        self.cancel_ai()
+        self.ai.shutdown()
+        app.switch_to("menu")
+
     # -----------------------------------------------------------
     # Popups
     # -----------------------------------------------------------
@@ -2,7 +2,8 @@
 # games/flappy/game.py  —  Fixed & EXE-ready
 # =====================================
 import os, sys, time
-from random import randint
+from array import array
+from random import Random
 from kivy.clock import Clock
 from kivy.uix.widget import Widget
 from kivy.uix.boxlayout import BoxLayout
@@ -13,6 +14,8 @@ from kivy.graphics import Rectangle
 from kivy.core.image import Image as CoreImage
 from kivy.core.window import Window
 from core.base_game import BaseGame
+from core.fixed_step import FixedTimestep, lerp
+from games.flappy import physics
 
 
 # ---------- Safe path resolver ----------
@@ -28,25 +31,52 @@ def resource_path(relative_path: str) -> str:
 class FlappyGame(BaseGame):
     GAME_NAME = "Flappy Bird"
 
+    BIRD_SIZE = physics.BIRD_SIZE
+    COLLISION_OFFSET = physics.COLLISION_OFFSET
+    # Pipes alive at once; a 4000 px wide window needs about a dozen
+    PIPE_CAPACITY = 16
+
     def __init__(self, db):
         super().__init__(db, self.GAME_NAME)
         self.play_area = None
         self.layout = None
         self.score_label = None
-        self.pipes = []
 
-        # physics
-        self.gravity = -700.0
-        self.jump_velocity = 320.0
+        # Long-lived canvas instructions; pipe_rects[i] is the (top, bottom)
+        # pair drawing ring slot i, hidden while the slot is empty
+        self.bg_rect = None
+        self.bird_rect = None
+        self.pipe_rects = []
+
+        # Pipe ring buffer, oldest (leftmost) first. pipe_x holds world
+        # positions; on screen a pipe sits at pipe_x - scroll, so moving
+        # every pipe is a single add to `scroll`.
+        self.pipe_x = array("d", [0.0] * self.PIPE_CAPACITY)
+        self.pipe_gap_y = array("d", [0.0] * self.PIPE_CAPACITY)
+        self.pipe_passed = bytearray(self.PIPE_CAPACITY)
+        self.pipe_head = 0
+        self.pipe_count = 0
+        self.pipe_unpassed = 0      # offset from head of the first pipe not yet scored
+        self.scroll = 0.0
+
+        # physics: fixed ticks, with the previous tick's bird_y and scroll
+        # kept so rendering can interpolate between ticks
+        self.stepper = FixedTimestep(physics.TICK_RATE)
+        self.prev_bird_y = 0.0
+        self.prev_scroll = 0.0
+        self.seed = None            # set for reproducible pipe layouts
+        self.rng = Random()
+        self.gravity = physics.GRAVITY
+        self.jump_velocity = physics.JUMP_VELOCITY
         self.bird_y = 0.0
         self.bird_vy = 0.0
 
         # pipes
-        self.pipe_speed = 170.0
-        self.pipe_gap = 160
-        self.pipe_width = 80
+        self.pipe_speed = physics.PIPE_SPEED
+        self.pipe_gap = physics.PIPE_GAP
+        self.pipe_width = physics.PIPE_WIDTH
         self.pipe_spawn_timer = 0.0
-        self.pipe_interval = 1.9
+        self.pipe_interval = physics.PIPE_INTERVAL
 
         # score
         self.score = 0
@@ -91,15 +121,27 @@ class FlappyGame(BaseGame):
         screen.add_widget(self.layout)
         app.switch_to("game")
 
+        self.build_canvas()
+
         Window.bind(on_key_down=self._on_key_down)
         self.play_area.bind(size=lambda *a: self._on_resize())
+        self.play_area.bind(pos=lambda *a: self._on_resize())
 
     # ------------------------------------------------------
     def reset(self):
         self.score = 0
         self.bird_vy = 0
         self.bird_y = self.play_area.height / 2 if self.play_area.height else 300
-        self.pipes.clear()
+        self.pipe_head = 0
+        self.pipe_count = 0
+        self.pipe_unpassed = 0
+        self.scroll = 0.0
+        self.prev_bird_y = self.bird_y
+        self.prev_scroll = self.scroll
+        self.stepper.reset()
+        self.rng = Random(self.seed)
+        for i in range(self.PIPE_CAPACITY):
+            self._hide_pipe_rects(i)
         self.pipe_spawn_timer = 0.0
         self.running = True
         self.start_time = time.time()
@@ -107,20 +149,29 @@ class FlappyGame(BaseGame):
         if self._clock_ev:
             self._clock_ev.cancel()
         self._clock_ev = Clock.schedule_interval(self.update, 1 / 60.0)
-        self.update_canvas()
+        self.layout_canvas()
 
     def _on_key_down(self, instance, key, scancode, codepoint, modifiers):
         if key == 32 and self.running:  # Space
             self.bird_vy = self.jump_velocity
 
     def _on_resize(self):
-        self.update_canvas()
+        self.layout_canvas()
 
     # ------------------------------------------------------
     def update(self, dt):
         if not self.running:
             return
 
+        for _ in range(self.stepper.advance(dt)):
+            self.prev_bird_y = self.bird_y
+            self.prev_scroll = self.scroll
+            self.tick(self.stepper.step)
+            if not self.running:
+                break
+        self.update_canvas(self.stepper.alpha)
+
+    def tick(self, dt):
         # Physics
         self.bird_vy += self.gravity * dt
         self.bird_y += self.bird_vy * dt
@@ -131,41 +182,61 @@ class FlappyGame(BaseGame):
             self.pipe_spawn_timer = 0
             self._spawn_pipe()
 
-        # Move pipes
-        for p in self.pipes:
-            p["x"] -= self.pipe_speed * dt
-        self.pipes = [p for p in self.pipes if p["x"] + self.pipe_width > 0]
+        # Move pipes, then drop the ones that left the screen
+        self.scroll += self.pipe_speed * dt
+        while self.pipe_count and self.pipe_x[self.pipe_head] - self.scroll + self.pipe_width <= 0:
+            self._drop_oldest_pipe()
 
         self._check_collisions()
-        self.update_canvas()
 
     def _spawn_pipe(self):
         h = self.play_area.height or 300
-        gap_y = randint(int(h * 0.3), int(h * 0.8))
-        self.pipes.append({"x": self.play_area.width, "gap_y": gap_y, "passed": False})
+        gap_y = self.rng.randint(*physics.gap_y_bounds(h))
+        if self.pipe_count == self.PIPE_CAPACITY:
+            # Full: the oldest pipe is long off screen, recycle it
+            self._drop_oldest_pipe()
+        i = (self.pipe_head + self.pipe_count) % self.PIPE_CAPACITY
+        self.pipe_x[i] = self.play_area.width + self.scroll
+        self.pipe_gap_y[i] = gap_y
+        self.pipe_passed[i] = 0
+        self.pipe_count += 1
+        self._size_pipe_rects(i)
+
+    def _drop_oldest_pipe(self):
+        self._hide_pipe_rects(self.pipe_head)
+        self.pipe_head = (self.pipe_head + 1) % self.PIPE_CAPACITY
+        self.pipe_count -= 1
+        self.pipe_unpassed = max(0, self.pipe_unpassed - 1)
 
     def _check_collisions(self):
-        h = self.play_area.height or 600
-        w = self.play_area.width or 800
-        bird_size = 40
-        bx = w * 0.25
+        h = self.play_area.height or physics.DEFAULT_HEIGHT
+        w = self.play_area.width or physics.DEFAULT_WIDTH
+        bird_size = self.BIRD_SIZE
+        bx = w * physics.BIRD_X
         by = self.bird_y
-        COLLISION_OFFSET = 12
+        COLLISION_OFFSET = self.COLLISION_OFFSET
 
         # Ground / ceiling
         if by < 0 or by + bird_size > h:
             self._game_over()
             return
 
-        for p in self.pipes:
-            px = p["x"]
-            gap_y = p["gap_y"]
-            if bx + bird_size - COLLISION_OFFSET > px and bx + COLLISION_OFFSET < px + self.pipe_width:
+        # Pipes already scored are entirely left of the bird, and pipes are
+        # sorted by x, so only the next one or two can touch it
+        cap = self.PIPE_CAPACITY
+        for k in range(self.pipe_unpassed, self.pipe_count):
+            i = (self.pipe_head + k) % cap
+            px = self.pipe_x[i] - self.scroll
+            if px >= bx + bird_size - COLLISION_OFFSET:
+                break
+            gap_y = self.pipe_gap_y[i]
+            if bx + COLLISION_OFFSET < px + self.pipe_width:
                 if by + COLLISION_OFFSET < gap_y - self.pipe_gap / 2 or by + bird_size - COLLISION_OFFSET > gap_y + self.pipe_gap / 2:
                     self._game_over()
                     return
-            if not p["passed"] and px + self.pipe_width < bx:
-                p["passed"] = True
+            if not self.pipe_passed[i] and px + self.pipe_width < bx:
+                self.pipe_passed[i] = 1
+                self.pipe_unpassed = k + 1
                 self.score += 1
                 self.score_label.text = f"Score: {self.score}"
 
@@ -203,21 +274,54 @@ class FlappyGame(BaseGame):
         popup.open()
 
     # ------------------------------------------------------
-    def update_canvas(self):
+    def build_canvas(self):
         self.play_area.canvas.clear()
         with self.play_area.canvas:
-            Rectangle(texture=self.bg_img, pos=self.play_area.pos, size=self.play_area.size)
-
-            for p in self.pipes:
-                px = p["x"]
-                gap_y = p["gap_y"]
-                Rectangle(texture=self.pipe_img,
-                          pos=(px, self.play_area.y + gap_y + self.pipe_gap / 2),
-                          size=(self.pipe_width, self.play_area.height - (gap_y + self.pipe_gap / 2)))
-                Rectangle(texture=self.pipe_img,
-                          pos=(px, self.play_area.y),
-                          size=(self.pipe_width, gap_y - self.pipe_gap / 2))
-
-            Rectangle(texture=self.bird_img,
-                      pos=(self.play_area.width * 0.25, self.play_area.y + self.bird_y),
-                      size=(40, 40))
+            self.bg_rect = Rectangle(texture=self.bg_img)
+            self.pipe_rects = [
+                (Rectangle(texture=self.pipe_img, size=(0, 0)),
+                 Rectangle(texture=self.pipe_img, size=(0, 0)))
+                for _ in range(self.PIPE_CAPACITY)
+            ]
+            self.bird_rect = Rectangle(texture=self.bird_img, size=(self.BIRD_SIZE, self.BIRD_SIZE))
+
+    def _hide_pipe_rects(self, i):
+        if self.pipe_rects:
+            top, bottom = self.pipe_rects[i]
+            top.size = bottom.size = (0, 0)
+
+    def _size_pipe_rects(self, i):
+        """Heights of slot i's pipes; they only change on spawn and resize."""
+        if not self.pipe_rects:
+            return
+        top, bottom = self.pipe_rects[i]
+        gap_y = self.pipe_gap_y[i]
+        top.size = (self.pipe_width, self.play_area.height - (gap_y + self.pipe_gap / 2))
+        bottom.size = (self.pipe_width, gap_y - self.pipe_gap / 2)
+
+    def layout_canvas(self):
+        """Full relayout after a reset or resize."""
+        if not self.pipe_rects:
+            return
+        self.bg_rect.pos = self.play_area.pos
+        self.bg_rect.size = self.play_area.size
+        cap = self.PIPE_CAPACITY
+        for k in range(self.pipe_count):
+            self._size_pipe_rects((self.pipe_head + k) % cap)
+        self.update_canvas()
+
+    def update_canvas(self, alpha=1.0):
+        """Per-frame: move the live pipes and the bird, `alpha` of the way into the next tick."""
+        if not self.pipe_rects:
+            return
+        scroll = lerp(self.prev_scroll, self.scroll, alpha)
+        bird_y = lerp(self.prev_bird_y, self.bird_y, alpha)
+        cap = self.PIPE_CAPACITY
+        for k in range(self.pipe_count):
+            i = (self.pipe_head + k) % cap
+            px = self.pipe_x[i] - scroll
+            top, bottom = self.pipe_rects[i]
+            top.pos = (px, self.play_area.y + self.pipe_gap_y[i] + self.pipe_gap / 2)
+            bottom.pos = (px, self.play_area.y)
+
+        self.bird_rect.pos = (self.play_area.width * physics.BIRD_X, self.play_area.y + bird_y)
@@ -0,0 +1,206 @@
+# =====================================
+# Flappy — Vectorized Neuroevolution Simulator
+# =====================================
+# Headless: steps a whole population of birds with NumPy through one
+# shared pipe stream, using the rules and constants of FlappyGame (see
+# games/flappy/physics.py). Each bird is a tiny MLP
+#   inputs -> tanh hidden layer -> flap if output > 0
+# and the whole population is evaluated as one batched matmul per frame.
+#
+# Usage (from the project root, no Kivy window needed):
+#   python -m games.flappy.neuro --population 2000 --generations 30
+#   python -m games.flappy.neuro --out best.npy     # save the best genome
+import argparse
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from games.flappy import physics
+
+NUM_INPUTS = 4
+
+# Fitness = seconds survived + PIPE_BONUS per pipe passed
+PIPE_BONUS = 5.0
+
+
+def genome_size(hidden):
+    return NUM_INPUTS * hidden + hidden + hidden + 1
+
+
+class FlappyPopulationSim:
+    """One generation of birds flying the same pipes."""
+
+    def __init__(self, genomes, hidden, width=physics.DEFAULT_WIDTH,
+                 height=physics.DEFAULT_HEIGHT, seed=None, dt=1 / physics.TICK_RATE):
+        genomes = np.asarray(genomes, dtype=np.float32)
+        if genomes.shape[1] != genome_size(hidden):
+            raise ValueError(f"Genomes need {genome_size(hidden)} weights for {hidden} hidden units")
+
+        self.n = len(genomes)
+        self.width = width
+        self.height = height
+        self.dt = dt
+        self.rng = np.random.default_rng(seed)
+
+        # Views into the flat genomes: (P, in, hidden), (P, hidden), (P, hidden), (P,)
+        i = NUM_INPUTS * hidden
+        self.w1 = genomes[:, :i].reshape(self.n, NUM_INPUTS, hidden)
+        self.b1 = genomes[:, i:i + hidden]
+        self.w2 = genomes[:, i + hidden:i + 2 * hidden]
+        self.b2 = genomes[:, -1]
+
+        self.bird_x = width * physics.BIRD_X
+        self.y = np.full(self.n, height / 2, dtype=np.float32)
+        self.vy = np.zeros(self.n, dtype=np.float32)
+        self.alive = np.ones(self.n, dtype=bool)
+        self.frames = np.zeros(self.n, dtype=np.int32)
+        self.score = np.zeros(self.n, dtype=np.int32)
+
+        # Shared pipe stream: [world x, gap_y], leftmost first
+        self.pipes = deque()
+        self.scroll = 0.0
+        self.spawn_timer = 0.0
+        self.dropped = 0            # pipes that scrolled off screen, all passed
+
+    # --------------------------------------------------
+    # Policy
+    # --------------------------------------------------
+    def next_pipe(self):
+        """(screen x, gap_y) of the first pipe not yet behind the bird."""
+        for x, gap_y in self.pipes:
+            px = x - self.scroll
+            if px + physics.PIPE_WIDTH >= self.bird_x:
+                return px, gap_y
+        return float(self.width), self.height / 2
+
+    def decide(self):
+        """Boolean flap decision for every bird."""
+        px, gap_y = self.next_pipe()
+        inputs = np.empty((self.n, NUM_INPUTS), dtype=np.float32)
+        inputs[:, 0] = (self.y - gap_y) / self.height
+        inputs[:, 1] = self.vy / physics.JUMP_VELOCITY
+        inputs[:, 2] = (px - self.bird_x) / self.width
+        inputs[:, 3] = self.y / self.height
+
+        hidden = np.tanh(np.matmul(inputs[:, None, :], self.w1)[:, 0, :] + self.b1)
+        return np.einsum("ph,ph->p", hidden, self.w2) + self.b2 > 0
+
+    # --------------------------------------------------
+    # Step
+    # --------------------------------------------------
+    def step(self):
+        """One frame in FlappyGame.update order: input, physics, pipes, collisions."""
+        dt = self.dt
+        flap = self.decide() & self.alive
+        self.vy[flap] = physics.JUMP_VELOCITY
+
+        self.vy += physics.GRAVITY * dt
+        self.y += self.vy * dt
+
+        self.spawn_timer += dt
+        if self.spawn_timer >= physics.PIPE_INTERVAL:
+            self.spawn_timer = 0
+            low, high = physics.gap_y_bounds(self.height)
+            self.pipes.append((self.width + self.scroll, int(self.rng.integers(low, high + 1))))
+
+        self.scroll += physics.PIPE_SPEED * dt
+        while self.pipes and self.pipes[0][0] - self.scroll + physics.PIPE_WIDTH <= 0:
+            self.pipes.popleft()
+            self.dropped += 1
+
+        self.collide()
+        self.frames[self.alive] += 1
+
+    def collide(self):
+        size = physics.BIRD_SIZE
+        off = physics.COLLISION_OFFSET
+        bx = self.bird_x
+        y = self.y
+
+        hit = (y < 0) | (y + size > self.height)
+
+        passed = self.dropped
+        for x, gap_y in self.pipes:
+            px = x - self.scroll
+            if px >= bx + size - off:
+                break
+            if bx + off < px + physics.PIPE_WIDTH:
+                half = physics.PIPE_GAP / 2
+                hit |= (y + off < gap_y - half) | (y + size - off > gap_y + half)
+            if px + physics.PIPE_WIDTH < bx:
+                passed += 1
+
+        self.alive &= ~hit
+        self.score[self.alive] = passed
+
+    def run(self, max_seconds=60.0):
+        """Fly until every bird is dead or `max_seconds` pass; returns fitness."""
+        max_frames = int(max_seconds / self.dt)
+        for _ in range(max_frames):
+            if not self.alive.any():
+                break
+            self.step()
+        return self.frames * self.dt + PIPE_BONUS * self.score
+
+
+# --------------------------------------------------
+# Evolution
+# --------------------------------------------------
+def evolve(population=1000, generations=20, hidden=8, elite=0.1, sigma=0.2,
+           seed=0, max_seconds=60.0, log=print):
+    """Simple elitist GA; returns (best genome, best fitness)."""
+    rng = np.random.default_rng(seed)
+    size = genome_size(hidden)
+    genomes = rng.normal(0, 1, (population, size)).astype(np.float32)
+    n_elite = max(1, int(population * elite))
+
+    best_genome, best_fitness = None, -np.inf
+    for gen in range(generations):
+        t0 = time.perf_counter()
+        # Fresh pipes every generation so bots do not memorise one course
+        sim = FlappyPopulationSim(genomes, hidden, seed=seed * 100003 + gen)
+        fitness = sim.run(max_seconds)
+
+        order = np.argsort(fitness)[::-1]
+        if fitness[order[0]] > best_fitness:
+            best_fitness = float(fitness[order[0]])
+            best_genome = genomes[order[0]].copy()
+        log(f"gen {gen:3d}: best {fitness[order[0]]:7.2f}  mean {fitness.mean():6.2f}  "
+            f"pipes {sim.score.max():3d}  ({time.perf_counter() - t0:.2f}s)")
+
+        parents = genomes[order[:n_elite]]
+        children = parents[rng.integers(0, n_elite, population - n_elite)]
+        children = children + rng.normal(0, sigma, children.shape).astype(np.float32)
+        genomes = np.concatenate([parents, children])
+
+    return best_genome, best_fitness
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evolve Flappy bots headlessly")
+    parser.add_argument("--population", type=int, default=1000)
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--hidden", type=int, default=8)
+    parser.add_argument("--sigma", type=float, default=0.2, help="mutation std-dev")
+    parser.add_argument("--max-seconds", type=float, default=60.0,
+                        help="simulated seconds per generation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="save the best genome (.npy)")
+    args = parser.parse_args(argv)
+
+    genome, fitness = evolve(args.population, args.generations, args.hidden,
+                             sigma=args.sigma, seed=args.seed, max_seconds=args.max_seconds)
+    print(f"Best fitness {fitness:.2f}")
+    if args.out:
+        np.save(args.out, genome)
+        print(f"Saved genome to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
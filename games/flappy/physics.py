@@ -0,0 +1,33 @@
+# =====================================
+# Flappy Physics — Shared Constants
+# =====================================
+# Kivy-free so FlappyGame and the headless simulator tune from one place.
+# Units are pixels and seconds, y pointing up from the bottom of the play
+# area.
+
+# Physics runs in fixed ticks at this rate whatever the frame rate is
+TICK_RATE = 60
+
+GRAVITY = -700.0
+JUMP_VELOCITY = 320.0
+
+PIPE_SPEED = 170.0
+PIPE_GAP = 160
+PIPE_WIDTH = 80
+PIPE_INTERVAL = 1.9
+
+# New gap centres are drawn uniformly from this fraction of the play height
+GAP_Y_RANGE = (0.3, 0.8)
+
+BIRD_SIZE = 40
+BIRD_X = 0.25               # bird's left edge as a fraction of the play width
+COLLISION_OFFSET = 12       # hitbox inset on every side of the bird sprite
+
+# Play area used when the widget has no size yet, and by the simulator
+DEFAULT_WIDTH = 800
+DEFAULT_HEIGHT = 600
+
+
+def gap_y_bounds(height):
+    """Inclusive (low, high) range for a new gap centre."""
+    return int(height * GAP_Y_RANGE[0]), int(height * GAP_Y_RANGE[1])
@@ -0,0 +1,76 @@
+# =====================================
+# Pong AI — Analytic Intercept Paddle
+# =====================================
+# The ball moves in straight lines between bounces, so where it meets a
+# paddle face follows in closed form: run it to the face as if there were
+# no walls, then fold the resulting y back into the field, each fold being
+# one wall bounce. The AI predicts once per paddle hit (when the ball
+# turns towards it) instead of simulating frames.
+import random
+
+from games.pong import engine
+
+
+def fold(y, low, high):
+    """Reflect `y` into [low, high] as a ball bouncing between the two would."""
+    span = high - low
+    if span <= 0:
+        return low
+    m = (y - low) % (2 * span)
+    return low + (m if m <= span else 2 * span - m)
+
+
+def predict_intercept(field, side):
+    """
+    Ball y (bottom edge) when it reaches `side`'s paddle face, or None while
+    it is moving away.
+    """
+    vx, vy = field.ball_vx, field.ball_vy
+    if side == engine.LEFT:
+        if vx >= 0:
+            return None
+        t = (field.left_x + engine.PADDLE_W - field.ball_x) / vx
+    else:
+        if vx <= 0:
+            return None
+        t = (field.right_x - engine.BALL_SIZE - field.ball_x) / vx
+    t = max(t, 0.0)
+    return fold(field.ball_y + vy * t, field.y, field.top - engine.BALL_SIZE)
+
+
+class PongAI:
+    """
+    Paddle controller. `error` is the largest aiming miss in pixels, re-rolled
+    every prediction; `speed` scales the paddle speed it may use (0-1).
+    """
+
+    def __init__(self, side, error=0.0, speed=1.0, rng=None):
+        self.side = side
+        self.error = error
+        self.speed = speed
+        self.rng = rng or random.Random()
+        self.target = None
+        self.incoming = False
+
+    def reset(self):
+        self.target = None
+        self.incoming = False
+
+    def move(self, field, dt):
+        """Paddle command in [-1, 1] for the next `dt` seconds, as PongField.tick takes it."""
+        incoming = (field.ball_vx < 0) if self.side == engine.LEFT else (field.ball_vx > 0)
+        if incoming and not self.incoming:
+            y = predict_intercept(field, self.side)
+            miss = self.rng.uniform(-self.error, self.error) if self.error else 0.0
+            self.target = y + engine.BALL_SIZE / 2 + miss
+        elif not incoming:
+            # Drift back to the middle while the ball is away
+            self.target = field.y + field.height / 2
+        self.incoming = incoming
+
+        if dt <= 0:
+            return 0
+        # Full speed when far away, a partial step to stop on the target
+        center = field.paddle_y(self.side) + engine.PADDLE_H / 2
+        move = (self.target - center) / (engine.PADDLE_SPEED * dt)
+        return max(-self.speed, min(self.speed, move))
@@ -0,0 +1,196 @@
+# =====================================
+# Pong Engine — Swept Ball Physics
+# =====================================
+# Kivy-free model of a Pong field in window coordinates (x right, y up).
+# The ball is swept over each tick: the exact time of impact with a wall
+# or a paddle face is solved for, the ball is moved there, reflected, and
+# the rest of the tick continues from the contact point. A fast ball or a
+# long tick therefore cannot tunnel through the 15 px paddles.
+
+BALL_SPEED = 300
+PADDLE_SPEED = 600
+TICK_RATE = 120
+
+PADDLE_W, PADDLE_H = 15, 100
+PADDLE_MARGIN = 20          # gap between the field edge and each paddle
+BALL_SIZE = 16
+
+LEFT, RIGHT = "left", "right"
+
+# Contacts resolved per tick; more than a corner bounce needs is never reached
+MAX_CONTACTS = 8
+EPS = 1e-9
+# Extra time so an exiting ball ends strictly outside the field
+EXIT_MARGIN = 1e-6
+
+
+class PongField:
+    """Ball and paddles on a field whose bottom-left corner is (x, y)."""
+
+    def __init__(self, x=0.0, y=0.0, width=800.0, height=600.0):
+        self.x, self.y = x, y
+        self.width, self.height = width, height
+
+        self.ball_x = self.ball_y = 0.0
+        self.ball_vx = self.ball_vy = float(BALL_SPEED)
+        self.left_y = self.right_y = 0.0
+        self.center()
+
+    # --------------------------------------------------
+    # Geometry
+    # --------------------------------------------------
+    def resize(self, x, y, width, height):
+        self.x, self.y = x, y
+        self.width, self.height = width, height
+
+    @property
+    def top(self):
+        return self.y + self.height
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @property
+    def left_x(self):
+        return self.x + PADDLE_MARGIN
+
+    @property
+    def right_x(self):
+        return self.right - PADDLE_MARGIN - PADDLE_W
+
+    def paddle_y(self, side):
+        return self.left_y if side == LEFT else self.right_y
+
+    def center(self):
+        """Paddles and ball back to the middle; the ball keeps its velocity."""
+        self.left_y = self.right_y = self.y + self.height / 2 - PADDLE_H / 2
+        self.ball_x = self.x + self.width / 2 - BALL_SIZE / 2
+        self.ball_y = self.y + self.height / 2 - BALL_SIZE / 2
+
+    def state(self):
+        return (self.ball_x, self.ball_y, self.left_y, self.right_y)
+
+    # --------------------------------------------------
+    # Tick
+    # --------------------------------------------------
+    def move_paddle(self, side, dy):
+        y = max(self.y, min(self.paddle_y(side) + dy, self.top - PADDLE_H))
+        if side == LEFT:
+            self.left_y = y
+        else:
+            self.right_y = y
+
+    def tick(self, dt, left_move=0, right_move=0):
+        """
+        Advance `dt` seconds with each paddle moving at a fraction of full
+        speed in [-1 (down), 1 (up)]. Returns the side that won the point,
+        or None.
+        """
+        if left_move:
+            self.move_paddle(LEFT, left_move * PADDLE_SPEED * dt)
+        if right_move:
+            self.move_paddle(RIGHT, right_move * PADDLE_SPEED * dt)
+
+        self.push_out_of_paddles()
+        self.sweep_ball(dt)
+
+        if self.ball_x + BALL_SIZE < self.x:
+            return RIGHT
+        if self.ball_x > self.right:
+            return LEFT
+        return None
+
+    def time_to_next_event(self):
+        """
+        Seconds until the ball reaches the face of the paddle it is heading
+        for, or, once past that face, until it has left the field. Ticking
+        exactly this long lets headless runs skip the frames in between.
+        """
+        vx = self.ball_vx
+        if vx < 0:
+            face = self.left_x + PADDLE_W
+            if self.ball_x > face + EPS:
+                return (face - self.ball_x) / vx
+            return (self.x - BALL_SIZE - self.ball_x) / vx + EXIT_MARGIN
+        if vx > 0:
+            face = self.right_x - BALL_SIZE
+            if self.ball_x < face - EPS:
+                return (face - self.ball_x) / vx
+            return (self.right - self.ball_x) / vx + EXIT_MARGIN
+        return float("inf")
+
+    def overlaps_paddle(self, side):
+        px = self.left_x if side == LEFT else self.right_x
+        py = self.paddle_y(side)
+        return (self.ball_x < px + PADDLE_W and self.ball_x + BALL_SIZE > px and
+                self.ball_y < py + PADDLE_H and self.ball_y + BALL_SIZE > py)
+
+    def push_out_of_paddles(self):
+        """A paddle that moved onto the ball knocks it back out of its face."""
+        if self.ball_vx < 0 and self.overlaps_paddle(LEFT):
+            self.ball_x = self.left_x + PADDLE_W
+            self.ball_vx = -self.ball_vx
+        elif self.ball_vx > 0 and self.overlaps_paddle(RIGHT):
+            self.ball_x = self.right_x - BALL_SIZE
+            self.ball_vx = -self.ball_vx
+
+    def paddle_contact(self, side, vx, vy):
+        """Time until the ball meets `side`'s paddle face, or None."""
+        x, y = self.ball_x, self.ball_y
+        if side == LEFT:
+            face = self.left_x + PADDLE_W
+            if vx >= 0 or x < face - EPS:
+                return None
+            t = (face - x) / vx
+        else:
+            face = self.right_x
+            if vx <= 0 or x + BALL_SIZE > face + EPS:
+                return None
+            t = (face - BALL_SIZE - x) / vx
+
+        t = max(t, 0.0)
+        py = self.paddle_y(side)
+        by = y + vy * t
+        if by < py + PADDLE_H and by + BALL_SIZE > py:
+            return t
+        return None
+
+    def wall_contact(self, vy):
+        """Time until the ball meets the floor or ceiling, or None."""
+        if vy < 0:
+            return max((self.y - self.ball_y) / vy, 0.0)
+        if vy > 0:
+            return max((self.top - BALL_SIZE - self.ball_y) / vy, 0.0)
+        return None
+
+    def sweep_ball(self, dt):
+        remaining = dt
+        for _ in range(MAX_CONTACTS):
+            vx, vy = self.ball_vx, self.ball_vy
+            contacts = [
+                (t, kind) for t, kind in (
+                    (self.wall_contact(vy), "wall"),
+                    (self.paddle_contact(LEFT, vx, vy), "paddle"),
+                    (self.paddle_contact(RIGHT, vx, vy), "paddle"),
+                ) if t is not None and t <= remaining
+            ]
+            if not contacts:
+                break
+
+            t = min(c[0] for c in contacts)
+            self.ball_x += vx * t
+            self.ball_y += vy * t
+            remaining -= t
+
+            # Everything touching at the same instant bounces together (corners)
+            kinds = {kind for ct, kind in contacts if ct <= t + EPS}
+            if "wall" in kinds:
+                self.ball_y = self.y if vy < 0 else self.top - BALL_SIZE
+                self.ball_vy = -vy
+            if "paddle" in kinds:
+                self.ball_x = self.left_x + PADDLE_W if vx < 0 else self.right_x - BALL_SIZE
+                self.ball_vx = -vx
+
+        self.ball_x += self.ball_vx * remaining
+        self.ball_y += self.ball_vy * remaining
@@ -9,12 +9,17 @@ from kivy.uix.label import Label
 from kivy.clock import Clock
 from kivy.graphics import Rectangle, Color
 from kivy.uix.popup import Popup
+from core.fixed_step import FixedTimestep, lerp
+from games.pong import engine
+from games.pong.ai import PongAI
 
 
 class PongGame(BaseGame):
 
-    BALL_SPEED = 300
-    PADDLE_SPEED = 600
+    BALL_SPEED = engine.BALL_SPEED
+    PADDLE_SPEED = engine.PADDLE_SPEED
+    TICK_RATE = engine.TICK_RATE
+    AI_ERROR = 60       # px; keeps the computer beatable
 
     def __init__(self, db):
         super().__init__(db, "Pong")
@@ -23,8 +28,15 @@ class PongGame(BaseGame):
         self.left_paddle = None
         self.right_paddle = None
 
-        self.ball_vx = self.BALL_SPEED
-        self.ball_vy = self.BALL_SPEED
+        # Physics lives in the engine, advanced in fixed ticks; the
+        # Rectangles above only show it, blended with the previous tick
+        self.field = engine.PongField()
+        self.stepper = FixedTimestep(self.TICK_RATE)
+        self.prev_state = self.field.state()
+
+        # Computer opponent (plays the right paddle when enabled)
+        self.ai = None
+        self.ai_button = None
 
         self.left_score = 0
         self.right_score = 0
@@ -70,6 +82,11 @@ class PongGame(BaseGame):
 
         btns = BoxLayout(size_hint_y=None, height=50, spacing=10)
         btns.add_widget(Button(text="Restart", on_release=lambda *_: self.reset()))
+        self.ai_button = Button(
+            text="Vs Computer: On" if self.ai else "Vs Computer: Off",
+            on_release=lambda *_: self.toggle_ai(),
+        )
+        btns.add_widget(self.ai_button)
         btns.add_widget(Button(text="Back to Menu", on_release=lambda *_: self.app.switch_to("menu")))
         root.add_widget(btns)
 
@@ -89,20 +106,27 @@ class PongGame(BaseGame):
         self.play_area.canvas.clear()
         with self.play_area.canvas:
             Color(1, 1, 1, 1)
-            self.left_paddle = Rectangle(size=(15, 100))
-            self.right_paddle = Rectangle(size=(15, 100))
-            self.ball = Rectangle(size=(16, 16))
+            self.left_paddle = Rectangle(size=(engine.PADDLE_W, engine.PADDLE_H))
+            self.right_paddle = Rectangle(size=(engine.PADDLE_W, engine.PADDLE_H))
+            self.ball = Rectangle(size=(engine.BALL_SIZE, engine.BALL_SIZE))
 
     def center_objects(self):
         if not self.play_area:
             return
 
-        w, h = self.play_area.size
-        x, y = self.play_area.pos
+        self.field.resize(*self.play_area.pos, *self.play_area.size)
+        self.field.center()
 
-        self.left_paddle.pos = (x + 20, y + h / 2 - 50)
-        self.right_paddle.pos = (x + w - 35, y + h / 2 - 50)
-        self.ball.pos = (x + w / 2 - 8, y + h / 2 - 8)
+        # Snap, do not interpolate, across a reset
+        self.prev_state = self.field.state()
+        self.render(1.0)
+
+    def render(self, alpha):
+        ball_x, ball_y, left_y, right_y = (
+            lerp(a, b, alpha) for a, b in zip(self.prev_state, self.field.state()))
+        self.ball.pos = (ball_x, ball_y)
+        self.left_paddle.pos = (self.field.left_x, left_y)
+        self.right_paddle.pos = (self.field.right_x, right_y)
 
     # --------------------------------------------------
     def reset(self):
@@ -112,25 +136,33 @@ class PongGame(BaseGame):
 
         self.center_objects()
 
-        self.ball_vx = self.BALL_SPEED
-        self.ball_vy = self.BALL_SPEED
+        self.field.ball_vx = self.BALL_SPEED
+        self.field.ball_vy = self.BALL_SPEED
 
         self.running = True
+        self.stepper.reset()
+        if self.ai:
+            self.ai.reset()
 
         if self.clock_ev:
             self.clock_ev.cancel()
 
         self.clock_ev = Clock.schedule_interval(self.update, 1 / 60)
 
+    def toggle_ai(self):
+        self.ai = None if self.ai else PongAI(engine.RIGHT, error=self.AI_ERROR)
+        self.ai_button.text = "Vs Computer: On" if self.ai else "Vs Computer: Off"
+        self.right_up = self.right_down = False
+
     # --------------------------------------------------
     def on_key(self, _, key, *__):
         if key == 119:
             self.left_up = True
         elif key == 115:
             self.left_down = True
-        elif key == 273:
+        elif key == 273 and not self.ai:
             self.right_up = True
-        elif key == 274:
+        elif key == 274 and not self.ai:
             self.right_down = True
 
     def on_key_up(self, _, key, *__):
@@ -143,84 +175,37 @@ class PongGame(BaseGame):
         elif key == 274:
             self.right_down = False
 
-    def move_paddle(self, paddle, dy):
-        x, y = paddle.pos
-        y += dy
-
-        min_y = self.play_area.y
-        max_y = self.play_area.top - paddle.size[1]
-
-        paddle.pos = (x, max(min_y, min(y, max_y)))
-
     # --------------------------------------------------
     def update(self, dt):
         if not self.running:
             return
 
-        # smooth paddle movement
-        if self.left_up:
-            self.move_paddle(self.left_paddle, self.PADDLE_SPEED * dt)
-
-        if self.left_down:
-            self.move_paddle(self.left_paddle, -self.PADDLE_SPEED * dt)
-
-        if self.right_up:
-            self.move_paddle(self.right_paddle, self.PADDLE_SPEED * dt)
-
-        if self.right_down:
-            self.move_paddle(self.right_paddle, -self.PADDLE_SPEED * dt)
-
-        bx, by = self.ball.pos
-        bw, bh = self.ball.size
-
-        bx += self.ball_vx * dt
-        by += self.ball_vy * dt
-
-        # Wall collision
-        if by <= self.play_area.y:
-            by = self.play_area.y
-            self.ball_vy *= -1
-
-        elif by + bh >= self.play_area.top:
-            by = self.play_area.top - bh
-            self.ball_vy *= -1
-
-        # Paddle collision
-        if self.check_collision(self.left_paddle) and self.ball_vx < 0:
-            bx = self.left_paddle.pos[0] + self.left_paddle.size[0]
-            self.ball_vx *= -1
-
-        elif self.check_collision(self.right_paddle) and self.ball_vx > 0:
-            bx = self.right_paddle.pos[0] - bw
-            self.ball_vx *= -1
-
-        # Score
-        if bx + bw < self.play_area.x:
-            self.right_score += 1
-            self.update_score()
-            self.center_objects()
-            return
-
-        if bx > self.play_area.right:
+        for _ in range(self.stepper.advance(dt)):
+            self.prev_state = self.field.state()
+            self.tick(self.stepper.step)
+            if not self.running:
+                break
+        self.render(self.stepper.alpha)
+
+    def tick(self, dt):
+        left_move = self.left_up - self.left_down
+        if self.ai:
+            right_move = self.ai.move(self.field, dt)
+        else:
+            right_move = self.right_up - self.right_down
+
+        scorer = self.field.tick(dt, left_move, right_move)
+        if scorer == engine.LEFT:
             self.left_score += 1
-            self.update_score()
-            self.center_objects()
+        elif scorer == engine.RIGHT:
+            self.right_score += 1
+        else:
             return
 
-        self.ball.pos = (bx, by)
-
-    def check_collision(self, paddle):
-        bx, by = self.ball.pos
-        px, py = paddle.pos
-        bw, bh = self.ball.size
-        pw, ph = paddle.size
-
-        return (
-            bx < px + pw and
-            bx + bw > px and
-            by < py + ph and
-            by + bh > py
-        )
+        self.update_score()
+        self.center_objects()
+        if self.ai:
+            self.ai.reset()
 
     # --------------------------------------------------
     def update_score(self):
@@ -0,0 +1,122 @@
+# =====================================
+# Pong Match Runner — Headless AI vs AI
+# =====================================
+# Plays points between two PongAI paddles on the engine, no Kivy needed.
+# By default each tick runs exactly until the ball next reaches a paddle
+# face (or leaves the field): ball sweeps are exact for any tick length and
+# the paddles move over the same interval, so a rally costs a few ticks per
+# hit. --tick-rate runs fixed ticks like the game instead, for checking
+# physics changes at the real step size; there a paddle can also knock
+# back a ball already past its face, so rallies run slightly longer.
+#
+# Usage (from the project root):
+#   python -m games.pong.match                         # 10000 points
+#   python -m games.pong.match --left-error 40 --right-error 10
+#   python -m games.pong.match --tick-rate 120 --points 200 --json
+import argparse
+import json
+import math
+import random
+import sys
+import time
+
+from games.pong import engine
+from games.pong.ai import PongAI
+
+# Rallies longer than this are scored as a stalemate
+MAX_POINT_SECONDS = 120.0
+
+
+def serve(field, rng, speed):
+    """Centre the ball and send it off at up to 45 degrees to a random side."""
+    field.center()
+    angle = rng.uniform(-math.pi / 4, math.pi / 4)
+    direction = rng.choice((-1, 1))
+    field.ball_vx = direction * speed * math.cos(angle)
+    field.ball_vy = speed * math.sin(angle)
+
+
+def play_point(field, left, right, dt, rng, speed):
+    """
+    (winner or None for a stalemate, paddle hits, seconds played). `dt` is
+    the fixed tick, or None to tick from event to event.
+    """
+    serve(field, rng, speed)
+    left.reset()
+    right.reset()
+
+    hits = 0
+    elapsed = 0.0
+    while elapsed < MAX_POINT_SECONDS:
+        step = dt if dt else field.time_to_next_event()
+        vx = field.ball_vx
+        winner = field.tick(step, left.move(field, step), right.move(field, step))
+        elapsed += step
+        if winner:
+            return winner, hits, elapsed
+        if (field.ball_vx > 0) != (vx > 0):
+            hits += 1
+    return None, hits, elapsed
+
+
+def run_match(points, left, right, width=800, height=600, tick_rate=None,
+              speed=engine.BALL_SPEED * math.sqrt(2), seed=0):
+    rng = random.Random(seed)
+    field = engine.PongField(0, 0, width, height)
+    dt = 1.0 / tick_rate if tick_rate else None
+
+    results = {engine.LEFT: 0, engine.RIGHT: 0, None: 0}
+    hits = 0
+    seconds = 0.0
+    t0 = time.perf_counter()
+    for _ in range(points):
+        winner, point_hits, point_seconds = play_point(field, left, right, dt, rng, speed)
+        results[winner] += 1
+        hits += point_hits
+        seconds += point_seconds
+    elapsed = time.perf_counter() - t0
+
+    return {
+        "points": points,
+        "left": results[engine.LEFT],
+        "right": results[engine.RIGHT],
+        "stalemates": results[None],
+        "mean_hits": hits / points if points else 0.0,
+        "game_seconds": round(seconds, 1),
+        "elapsed": round(elapsed, 3),
+        "points_per_second": round(points / elapsed) if elapsed else 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Pong AI vs AI")
+    parser.add_argument("--points", type=int, default=10000)
+    parser.add_argument("--left-error", type=float, default=80.0, help="aiming error, px")
+    parser.add_argument("--right-error", type=float, default=80.0, help="aiming error, px")
+    parser.add_argument("--left-speed", type=float, default=1.0, help="paddle speed fraction")
+    parser.add_argument("--right-speed", type=float, default=1.0, help="paddle speed fraction")
+    parser.add_argument("--ball-speed", type=float, default=engine.BALL_SPEED * math.sqrt(2))
+    parser.add_argument("--tick-rate", type=float, default=None,
+                        help="fixed ticks per second (default: event to event)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print one JSON line")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    left = PongAI(engine.LEFT, args.left_error, args.left_speed, random.Random(rng.random()))
+    right = PongAI(engine.RIGHT, args.right_error, args.right_speed, random.Random(rng.random()))
+    stats = run_match(args.points, left, right, tick_rate=args.tick_rate,
+                      speed=args.ball_speed, seed=args.seed)
+
+    if args.json:
+        print(json.dumps(stats))
+    else:
+        print(f"{stats['points']} points in {stats['elapsed']}s "
+              f"({stats['points_per_second']}/s): left {stats['left']}, "
+              f"right {stats['right']}, stalemates {stats['stalemates']}, "
+              f"{stats['mean_hits']:.1f} hits per point")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
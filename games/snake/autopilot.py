@@ -0,0 +1,219 @@
+# =====================================
+# Snake Autopilot — Hamiltonian Cycle with Safe Shortcuts
+# =====================================
+# The cycle visits every cell once: along row 0 to the right, up the grid
+# in a serpentine over columns 1..W-1, then back down column 0. It needs
+# an even grid height.
+#
+# As long as the body lies on the cycle in order (tail behind head), every
+# cell strictly between the head and the tail along the cycle is free, so
+# the head may jump to any neighbour in that stretch. Shortcuts keep a
+# growth buffer and stop once the snake covers half the board; after that
+# it just follows the cycle, which always reaches the food and fills the
+# board.
+#
+# The autopilot can be switched on mid-game, with the body anywhere. Until
+# the body lies on the cycle in order again it takes no shortcuts: it
+# follows the cycle where that cell is free and otherwise steps to the free
+# neighbour with the most room. Following the cycle for a body length puts
+# the body back in order.
+#
+# Per grid size the tables are built once and cached next to this module:
+#   header  b"SNHC", version u16, width u16, height u16
+#   order   W*H x u16        position of each cell (y * W + x) on the cycle
+#   ahead   W*H x 4 x i16    forward cycle distance to the neighbour in each
+#                            ACTIONS direction, -1 off the board
+import os
+import struct
+
+from games.snake import engine
+
+MAGIC = b"SNHC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHH")
+
+ACTIONS = ('up', 'down', 'left', 'right')
+
+CACHE_DIR = os.path.dirname(__file__)
+
+# Cells kept in reserve ahead of the tail when cutting across the cycle
+GROWTH_BUFFER = 4
+
+
+def cache_path(width, height):
+    return os.path.join(CACHE_DIR, f"hamilton_{width}x{height}.bin")
+
+
+# --------------------------------------------------
+# Tables
+# --------------------------------------------------
+def hamiltonian_cycle(width, height):
+    """Cells (x, y) in cycle order."""
+    if height % 2 or width < 2:
+        raise ValueError(f"No Hamiltonian cycle layout for a {width}x{height} grid")
+
+    cycle = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        xs = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        cycle.extend((x, y) for x in xs)
+    cycle.extend((0, y) for y in range(height - 1, 0, -1))
+    return cycle
+
+
+def build_tables(width, height):
+    """(order, ahead) as flat lists; see the module comment for the layout."""
+    cells = width * height
+    order = [0] * cells
+    for i, (x, y) in enumerate(hamiltonian_cycle(width, height)):
+        order[y * width + x] = i
+
+    ahead = []
+    for y in range(height):
+        for x in range(width):
+            here = order[y * width + x]
+            for name in ACTIONS:
+                dx, dy = engine.DIRECTIONS[name]
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    ahead.append((order[ny * width + nx] - here) % cells)
+                else:
+                    ahead.append(-1)
+    return order, ahead
+
+
+def write_tables(path, width, height, order, ahead):
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, width, height))
+        f.write(struct.pack(f"<{len(order)}H", *order))
+        f.write(struct.pack(f"<{len(ahead)}h", *ahead))
+
+
+def read_tables(path, width, height):
+    """(order, ahead) from `path`, or None if it is missing or for another grid."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    cells = width * height
+    if len(data) != HEADER.size + 2 * cells + 8 * cells:
+        return None
+    magic, version, w, h = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION or (w, h) != (width, height):
+        return None
+
+    order = list(struct.unpack_from(f"<{cells}H", data, HEADER.size))
+    ahead = list(struct.unpack_from(f"<{4 * cells}h", data, HEADER.size + 2 * cells))
+    return order, ahead
+
+
+def load_tables(width, height):
+    """Cached tables for the grid size, building and saving them on first use."""
+    path = cache_path(width, height)
+    tables = read_tables(path, width, height)
+    if tables is None:
+        tables = build_tables(width, height)
+        try:
+            write_tables(path, width, height, *tables)
+        except OSError as e:
+            # Read-only install (e.g. the packaged EXE): keep them in memory
+            print(f"[Snake] Could not cache autopilot tables: {e}")
+    return tables
+
+
+# --------------------------------------------------
+# Autopilot
+# --------------------------------------------------
+class Autopilot:
+    """Chooses SnakeGame directions from the cycle tables."""
+
+    def __init__(self, width=engine.GRID_WIDTH, height=engine.GRID_HEIGHT):
+        self.width = width
+        self.cells = width * height
+        self.order, self.ahead = load_tables(width, height)
+
+    def distance(self, a, b):
+        """Steps from cell a to cell b following the cycle."""
+        return (self.order[b[1] * self.width + b[0]]
+                - self.order[a[1] * self.width + a[0]]) % self.cells
+
+    def in_order(self, snake):
+        """True when the body, tail to head, only moves forward along the cycle."""
+        tail = snake[-1]
+        last = -1
+        for cell in reversed(snake):
+            d = self.distance(tail, cell)
+            if d <= last:
+                return False
+            last = d
+        return True
+
+    def room(self, start, free):
+        """Free cells reachable from `start` (itself free), by flood fill."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            x, y = stack.pop()
+            for dx, dy in engine.DIRECTIONS.values():
+                cell = (x + dx, y + dy)
+                if cell not in seen and cell in free:
+                    seen.add(cell)
+                    stack.append(cell)
+        return len(seen)
+
+    def next_direction(self, snake, food, free):
+        """
+        Direction for the next move given the head-first body, the food cell
+        (or None) and the FreeCells index.
+        """
+        head = snake[0]
+        base = 4 * (head[1] * self.width + head[0])
+
+        if not self.in_order(snake):
+            return self._recover(head, base, free)
+
+        to_tail = self.distance(head, snake[-1])
+
+        if len(snake) >= self.cells // 2:
+            limit = 1
+        else:
+            limit = max(1, to_tail - GROWTH_BUFFER)
+        to_food = self.distance(head, food) if food is not None else self.cells
+
+        best_dir, best = None, 0
+        for i, name in enumerate(ACTIONS):
+            step = self.ahead[base + i]
+            if step <= 0 or step > limit or step > to_food:
+                continue
+            dx, dy = engine.DIRECTIONS[name]
+            if (head[0] + dx, head[1] + dy) not in free:
+                continue
+            if step > best:
+                best_dir, best = name, step
+
+        if best_dir is None:
+            # Follow the cycle; with an ordered body its next cell is free
+            return self._recover(head, base, free)
+        return best_dir
+
+    def _recover(self, head, base, free):
+        """The cycle successor if free, else the free neighbour with the most room."""
+        options = []
+        for i, name in enumerate(ACTIONS):
+            step = self.ahead[base + i]
+            dx, dy = engine.DIRECTIONS[name]
+            cell = (head[0] + dx, head[1] + dy)
+            if step <= 0 or cell not in free:
+                continue
+            if step == 1:
+                return name
+            options.append((name, cell, step))
+
+        if not options:
+            # Boxed in; any move ends the game
+            return next(name for i, name in enumerate(ACTIONS) if self.ahead[base + i] >= 0)
+
+        # Most room first, then the shortest hop forward along the cycle
+        name, _, _ = max(options, key=lambda o: (self.room(o[1], free), -o[2]))
+        return name
@@ -0,0 +1,56 @@
+# =====================================
+# Snake Engine — Rules & Free-Cell Index
+# =====================================
+# Rule constants shared by SnakeGame and the headless environments.
+# Cells are (x, y) tuples with y pointing up. FreeCells keeps every cell
+# not covered by the snake in a dense list plus a cell -> slot dict, so
+# membership, add, remove (swap with the last slot) and uniform random
+# choice are all O(1).
+import random
+
+GRID_WIDTH = 40
+GRID_HEIGHT = 40
+
+DIRECTIONS = {
+    'up': (0, 1),
+    'down': (0, -1),
+    'left': (-1, 0),
+    'right': (1, 0),
+}
+OPPOSITE = {'up': 'down', 'down': 'up', 'left': 'right', 'right': 'left'}
+
+# Head first
+START_BODY = ((5, 5), (5, 4), (5, 3))
+START_DIRECTION = 'right'
+
+
+class FreeCells:
+    """Set of free grid cells with O(1) uniform random selection."""
+
+    def __init__(self, width, height):
+        self.cells = [(x, y) for y in range(height) for x in range(width)]
+        self.slot = {cell: i for i, cell in enumerate(self.cells)}
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        return cell in self.slot
+
+    def add(self, cell):
+        if cell not in self.slot:
+            self.slot[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def remove(self, cell):
+        i = self.slot.pop(cell)
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[i] = last
+            self.slot[last] = i
+
+    def choice(self, rng=random):
+        """A uniformly random free cell, or None when the board is full."""
+        if not self.cells:
+            return None
+        return self.cells[rng.randrange(len(self.cells))]
@@ -4,30 +4,45 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.clock import Clock
-from kivy.graphics import Color, Rectangle
+from kivy.graphics import Color, Rectangle, InstructionGroup
+from kivy.core.image import Image as CoreImage
 from kivy.core.window import Window
 from kivy.uix.popup import Popup
 import random
+from collections import deque
+from games.snake import engine
+from games.snake.engine import FreeCells
+from games.snake.autopilot import Autopilot
+from core.game_manager import resource_path
 
 
 class SnakeGame(BaseGame):
 
-    GRID_WIDTH = 40
-    GRID_HEIGHT = 40
+    GRID_WIDTH = engine.GRID_WIDTH
+    GRID_HEIGHT = engine.GRID_HEIGHT
     MOVE_INTERVAL = 0.1
+    AUTOPILOT_INTERVAL = 1 / 60
 
-    DIRECTIONS = {
-        'up': (0, 1),
-        'down': (0, -1),
-        'left': (-1, 0),
-        'right': (1, 0),
+    DIRECTIONS = engine.DIRECTIONS
+
+    # Sprite regions as fractions (x, y, w, h) of each texture, y from the bottom
+    HEAD_REGIONS = {
+        'up': (0.09, 0.61, 0.34, 0.34),
+        'down': (0.55, 0.61, 0.34, 0.34),
+        'left': (0.08, 0.15, 0.35, 0.35),
+        'right': (0.56, 0.15, 0.35, 0.35),
     }
+    BODY_REGION = (0.37, 0.40, 0.20, 0.30)
+    APPLE_REGION = (0.29, 0.22, 0.42, 0.62)
 
     def __init__(self, db):
         super().__init__(db, "Snake")
 
-        self.snake = [(5, 5), (5, 4), (5, 3)]
-        self.direction = 'right'
+        # Body is head-first; every other cell lives in `free`, which gives
+        # O(1) collision checks and food placement
+        self.snake = deque(engine.START_BODY)
+        self.free = self.build_free_cells()
+        self.direction = engine.START_DIRECTION
         self.food = (10, 10)
         self.score = 0
         self.running = False
@@ -36,6 +51,37 @@ class SnakeGame(BaseGame):
         self.clock_event = None
         self.cell_size = 20
 
+        # Zero-input stress mode; tables are loaded the first time it is enabled
+        self.autopilot = None
+        self.autopilot_on = False
+        self.autopilot_button = None
+
+        # Persistent instructions: segment_rects[i] draws snake[i]; the pool
+        # only grows, spare rectangles are hidden after a reset
+        self.segment_pool = []
+        self.segment_rects = deque()
+        self.segment_group = None
+        self.bg_rect = None
+        self.food_rect = None
+
+        assets = "games/snake/assets"
+        head_sheet = CoreImage(resource_path(f"{assets}/head.png")).texture
+        self.head_textures = {
+            name: self.texture_region(head_sheet, region)
+            for name, region in self.HEAD_REGIONS.items()
+        }
+        self.body_texture = self.texture_region(
+            CoreImage(resource_path(f"{assets}/body.png")).texture, self.BODY_REGION)
+        self.apple_texture = self.texture_region(
+            CoreImage(resource_path(f"{assets}/apple.png")).texture, self.APPLE_REGION)
+        self.bg_texture = CoreImage(resource_path(f"{assets}/background.png")).texture
+
+    @staticmethod
+    def texture_region(texture, region):
+        fx, fy, fw, fh = region
+        w, h = texture.size
+        return texture.get_region(int(fx * w), int(fy * h), int(fw * w), int(fh * h))
+
     def start(self , app):
         from kivy.app import App
         self.app = App.get_running_app()
@@ -46,17 +92,30 @@ class SnakeGame(BaseGame):
 
 
     def reset(self):
-        self.snake = [(5, 5), (5, 4), (5, 3)]
-        self.direction = 'right'
+        self.snake = deque(engine.START_BODY)
+        self.free = self.build_free_cells()
+        self.direction = engine.START_DIRECTION
         self.spawn_food()
         self.score = 0
         self.running = True
         self.update_grid()
 
+        self.schedule_ticks()
+
+    def schedule_ticks(self):
         if self.clock_event:
             self.clock_event.cancel()
 
-        self.clock_event = Clock.schedule_interval(self.update, self.MOVE_INTERVAL)
+        interval = self.AUTOPILOT_INTERVAL if self.autopilot_on else self.MOVE_INTERVAL
+        self.clock_event = Clock.schedule_interval(self.update, interval)
+
+    def toggle_autopilot(self):
+        if self.autopilot is None:
+            self.autopilot = Autopilot(self.GRID_WIDTH, self.GRID_HEIGHT)
+        self.autopilot_on = not self.autopilot_on
+        self.autopilot_button.text = "Autopilot: On" if self.autopilot_on else "Autopilot: Off"
+        if self.running:
+            self.schedule_ticks()
 
     def build_ui(self):
         screen = self.app.game_screen
@@ -72,25 +131,35 @@ class SnakeGame(BaseGame):
 
         btn_box = BoxLayout(size_hint_y=None, height=50, spacing=10)
         btn_box.add_widget(Button(text="Restart", on_release=lambda *_: self.reset()))
+        self.autopilot_button = Button(
+            text="Autopilot: On" if self.autopilot_on else "Autopilot: Off",
+            on_release=lambda *_: self.toggle_autopilot(),
+        )
+        btn_box.add_widget(self.autopilot_button)
         btn_box.add_widget(Button(text="Back to Menu", on_release=lambda *_: self.app.switch_to("menu")))
         layout.add_widget(btn_box)
 
         screen.add_widget(layout)
         self.app.switch_to("game")
 
+        self.build_grid_canvas()
+
         Window.bind(on_key_down=self.handle_key)
         self.grid_widget.bind(size=lambda *_: self.update_grid())
+        self.grid_widget.bind(pos=lambda *_: self.update_grid())
+
+    def build_free_cells(self):
+        free = FreeCells(self.GRID_WIDTH, self.GRID_HEIGHT)
+        for cell in self.snake:
+            free.remove(cell)
+        return free
 
     def spawn_food(self):
-        while True:
-            pos = (random.randint(0, self.GRID_WIDTH - 1),
-                   random.randint(0, self.GRID_HEIGHT - 1))
-            if pos not in self.snake:
-                self.food = pos
-                break
+        # None once the snake fills the board
+        self.food = self.free.choice(random)
 
     def handle_key(self, instance, key, *_):
-        if not self.running:
+        if not self.running or self.autopilot_on:
             return
 
         mapping = {
@@ -102,39 +171,42 @@ class SnakeGame(BaseGame):
 
         if key in mapping:
             new_dir = mapping[key]
-            opposite = {
-                ('up', 'down'), ('down', 'up'),
-                ('left', 'right'), ('right', 'left')
-            }
-            if (self.direction, new_dir) not in opposite:
+            if engine.OPPOSITE[self.direction] != new_dir:
                 self.direction = new_dir
 
     def update(self, dt):
         if not self.running:
             return
 
+        if self.autopilot_on:
+            self.direction = self.autopilot.next_direction(self.snake, self.food, self.free)
+
         dx, dy = self.DIRECTIONS[self.direction]
         head_x, head_y = self.snake[0]
         new_head = (head_x + dx, head_y + dy)
 
-        if (new_head in self.snake or
-                not (0 <= new_head[0] < self.GRID_WIDTH) or
-                not (0 <= new_head[1] < self.GRID_HEIGHT)):
+        if new_head not in self.free:
+            # Off the board or into the body
             self.game_over()
             return
 
-        self.snake.insert(0, new_head)
+        self.snake.appendleft(new_head)
+        self.free.remove(new_head)
 
-        if new_head == self.food:
+        grew = new_head == self.food
+        if grew:
             self.score += 1
             self.score_label.text = f"Score: {self.score}"
             self.spawn_food()
         else:
-            self.snake.pop()
+            self.free.add(self.snake.pop())
 
-        self.update_grid()
+        self.advance_grid(grew)
 
-    def game_over(self):
+        if self.food is None:
+            self.game_over(won=True)
+
+    def game_over(self, won=False):
         self.running = False
 
         if self.clock_event:
@@ -147,7 +219,7 @@ class SnakeGame(BaseGame):
         )
 
         layout.add_widget(Label(
-            text=f"Game Over\nScore: {self.score}",
+            text=f"{'You Win!' if won else 'Game Over'}\nScore: {self.score}",
             font_size=24
         ))
 
@@ -178,28 +250,78 @@ class SnakeGame(BaseGame):
         self.popup.open()
 
 
+    # ---------------------------------
+    # DRAW
+    # ---------------------------------
+    def build_grid_canvas(self):
+        canvas = self.grid_widget.canvas
+        canvas.clear()
+        self.segment_pool = []
+        self.segment_rects = deque()
+        self.segment_group = InstructionGroup()
+
+        canvas.add(Color(1, 1, 1, 1))
+        self.bg_rect = Rectangle(texture=self.bg_texture)
+        canvas.add(self.bg_rect)
+        canvas.add(self.segment_group)
+        self.food_rect = Rectangle(texture=self.apple_texture)
+        canvas.add(self.food_rect)
+
+    def cell_pos(self, cell):
+        return (self.grid_widget.x + cell[0] * self.cell_size,
+                self.grid_widget.y + cell[1] * self.cell_size)
+
+    def pooled_rect(self, i):
+        """The i-th segment rectangle, allocating it the first time the snake is this long."""
+        if i == len(self.segment_pool):
+            rect = Rectangle()
+            self.segment_group.add(rect)
+            self.segment_pool.append(rect)
+        return self.segment_pool[i]
+
+    def place_food(self):
+        if self.food is None:
+            self.food_rect.size = (0, 0)
+        else:
+            self.food_rect.pos = self.cell_pos(self.food)
+            self.food_rect.size = (self.cell_size, self.cell_size)
+
     def update_grid(self):
-        self.grid_widget.canvas.clear()
+        """Lay out every instruction; used on reset and resize."""
+        if self.segment_group is None:
+            return
+
         self.cell_size = min(
             self.grid_widget.width / self.GRID_WIDTH,
             self.grid_widget.height / self.GRID_HEIGHT
         )
+        self.bg_rect.pos = self.grid_widget.pos
+        self.bg_rect.size = self.grid_widget.size
+
+        size = (self.cell_size, self.cell_size)
+        self.segment_rects = deque()
+        for i, cell in enumerate(self.snake):
+            rect = self.pooled_rect(i)
+            rect.pos = self.cell_pos(cell)
+            rect.size = size
+            rect.texture = self.head_textures[self.direction] if i == 0 else self.body_texture
+            self.segment_rects.append(rect)
+        for rect in self.segment_pool[len(self.snake):]:
+            rect.size = (0, 0)
+
+        self.place_food()
+
+    def advance_grid(self, grew):
+        """Per-tick update: only the old head, the new head and the tail change."""
+        self.segment_rects[0].texture = self.body_texture
+
+        if grew:
+            rect = self.pooled_rect(len(self.segment_rects))
+            rect.size = (self.cell_size, self.cell_size)
+            self.place_food()
+        else:
+            rect = self.segment_rects.pop()
 
-        with self.grid_widget.canvas:
-            Color(0.2, 0.2, 0.2, 1)
-            Rectangle(pos=self.grid_widget.pos, size=self.grid_widget.size)
-
-            Color(0, 1, 0, 1)
-            for x, y in self.snake:
-                Rectangle(
-                    pos=(self.grid_widget.x + x * self.cell_size,
-                         self.grid_widget.y + y * self.cell_size),
-                    size=(self.cell_size, self.cell_size)
-                )
-
-            Color(1, 0, 0, 1)
-            Rectangle(
-                pos=(self.grid_widget.x + self.food[0] * self.cell_size,
-                     self.grid_widget.y + self.food[1] * self.cell_size),
-                size=(self.cell_size, self.cell_size)
-            )
+        rect.pos = self.cell_pos(self.snake[0])
+        rect.texture = self.head_textures[self.direction]
+        self.segment_rects.appendleft(rect)
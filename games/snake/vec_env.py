@@ -0,0 +1,209 @@
+# =====================================
+# Snake — Vectorized Headless Environment
+# =====================================
+# Steps N independent boards at once with NumPy, following the same rules
+# as SnakeGame.update: the head moves one cell per step, reversing is
+# ignored, hitting a wall or any body cell (the tail included, since it
+# has not moved yet) ends the board, eating grows the snake by one and
+# respawns food uniformly on a free cell. A board that fills the grid is
+# won. Finished boards stay frozen until reset.
+#
+# Cells are indexed y * width + x. Each body is a ring buffer of cell
+# indices: body[n, head[n]] is the head, body[n, tail[n]] the tail.
+#
+# Benchmark with a random policy (from the project root):
+#   python -m games.snake.vec_env --boards 4096 --steps 2000
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from games.snake import engine
+
+# Action index -> direction name, matching engine.DIRECTIONS
+ACTIONS = ('up', 'down', 'left', 'right')
+ACTION_INDEX = {name: i for i, name in enumerate(ACTIONS)}
+DX = np.array([engine.DIRECTIONS[a][0] for a in ACTIONS], dtype=np.int32)
+DY = np.array([engine.DIRECTIONS[a][1] for a in ACTIONS], dtype=np.int32)
+OPPOSITE = np.array([ACTION_INDEX[engine.OPPOSITE[a]] for a in ACTIONS], dtype=np.int8)
+
+
+class SnakeVecEnv:
+    """N Snake boards stepped together; see the module comment for the rules."""
+
+    def __init__(self, num_boards, width=engine.GRID_WIDTH, height=engine.GRID_HEIGHT, seed=None):
+        if not all(0 <= x < width and 0 <= y < height for x, y in engine.START_BODY):
+            raise ValueError(f"Start body does not fit a {width}x{height} grid")
+
+        self.n = num_boards
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.rng = np.random.default_rng(seed)
+
+        n, cells = self.n, self.cells
+        self.body = np.zeros((n, cells), dtype=np.int32)
+        self.head = np.zeros(n, dtype=np.int32)
+        self.tail = np.zeros(n, dtype=np.int32)
+        self.occupied = np.zeros((n, cells), dtype=bool)
+        self.direction = np.zeros(n, dtype=np.int8)
+        self.food = np.zeros(n, dtype=np.int32)
+        self.length = np.zeros(n, dtype=np.int32)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.done = np.zeros(n, dtype=bool)
+        self.won = np.zeros(n, dtype=bool)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.rows = np.arange(n)
+
+        start = [y * width + x for x, y in engine.START_BODY]
+        # Ring order runs tail -> head
+        self.start_body = np.array(start[::-1], dtype=np.int32)
+        self.reset()
+
+    # --------------------------------------------------
+    # Reset
+    # --------------------------------------------------
+    def reset(self, boards=None):
+        """Reset every board, or only the ones selected by index/mask `boards`."""
+        idx = self.rows if boards is None else self.rows[boards]
+        if idx.size == 0:
+            return
+
+        k = len(self.start_body)
+        self.body[idx, :k] = self.start_body
+        self.tail[idx] = 0
+        self.head[idx] = k - 1
+        self.occupied[idx] = False
+        self.occupied[idx[:, None], self.start_body] = True
+        self.direction[idx] = ACTION_INDEX[engine.START_DIRECTION]
+        self.length[idx] = k
+        self.score[idx] = 0
+        self.done[idx] = False
+        self.won[idx] = False
+        self.steps[idx] = 0
+        self._spawn_food(idx)
+
+    def reset_done(self):
+        """Restart every finished board; returns their indices."""
+        idx = np.flatnonzero(self.done)
+        self.reset(idx)
+        return idx
+
+    # --------------------------------------------------
+    # Step
+    # --------------------------------------------------
+    def step(self, actions=None):
+        """
+        Advance every running board one move. `actions` holds an ACTIONS
+        index per board (None keeps the current directions).
+        Returns (ate, died) boolean arrays for this step.
+        """
+        live = ~self.done
+        if actions is not None:
+            actions = np.asarray(actions, dtype=np.int8)
+            turn = live & (actions != OPPOSITE[self.direction])
+            self.direction[turn] = actions[turn]
+
+        head_cell = self.body[self.rows, self.head]
+        x = head_cell % self.width + DX[self.direction]
+        y = head_cell // self.width + DY[self.direction]
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        new_cell = np.where(inside, y * self.width + x, 0)
+
+        hit = ~inside | self.occupied[self.rows, new_cell]
+        died = live & hit
+        move = np.flatnonzero(live & ~hit)
+
+        cell = new_cell[move]
+        ate = np.zeros(self.n, dtype=bool)
+        ate[move] = cell == self.food[move]
+
+        # Grow at the head
+        head = (self.head[move] + 1) % self.cells
+        self.head[move] = head
+        self.body[move, head] = cell
+        self.occupied[move, cell] = True
+        self.steps[move] += 1
+
+        # Shrink at the tail unless the board just ate
+        shrink = move[~ate[move]]
+        self.occupied[shrink, self.body[shrink, self.tail[shrink]]] = False
+        self.tail[shrink] = (self.tail[shrink] + 1) % self.cells
+
+        eaters = np.flatnonzero(ate)
+        self.length[eaters] += 1
+        self.score[eaters] += 1
+        self._spawn_food(eaters)
+
+        self.done |= died
+        return ate, died
+
+    def _spawn_food(self, idx):
+        """Place food on a uniformly random free cell of each board in `idx`."""
+        if idx.size == 0:
+            return
+        free_count = self.cells - self.length[idx]
+
+        full = free_count == 0
+        if full.any():
+            self.food[idx[full]] = -1
+            self.won[idx[full]] = True
+            self.done[idx[full]] = True
+            idx, free_count = idx[~full], free_count[~full]
+            if idx.size == 0:
+                return
+
+        # k-th free cell: first index where the running count of free cells passes k
+        pick = (self.rng.random(idx.size) * free_count).astype(np.int32)
+        running = np.cumsum(~self.occupied[idx], axis=1, dtype=np.int32)
+        self.food[idx] = np.argmax(running > pick[:, None], axis=1)
+
+    # --------------------------------------------------
+    # Inspection
+    # --------------------------------------------------
+    def snake_cells(self, board):
+        """Body of one board as (x, y) tuples, head first (SnakeGame.snake order)."""
+        length = self.length[board]
+        ring = (self.head[board] - np.arange(length)) % self.cells
+        return [(int(c) % self.width, int(c) // self.width) for c in self.body[board, ring]]
+
+    def food_cell(self, board):
+        food = int(self.food[board])
+        return None if food < 0 else (food % self.width, food // self.width)
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized Snake environment")
+    parser.add_argument("--boards", type=int, default=4096)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=engine.GRID_WIDTH)
+    parser.add_argument("--height", type=int, default=engine.GRID_HEIGHT)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    env = SnakeVecEnv(args.boards, args.width, args.height, seed=args.seed)
+    rng = np.random.default_rng(args.seed + 1)
+    actions = rng.integers(0, len(ACTIONS), size=(args.steps, args.boards), dtype=np.int8)
+
+    games = 0
+    best = 0
+    t0 = time.perf_counter()
+    for t in range(args.steps):
+        env.step(actions[t])
+        if env.done.any():
+            best = max(best, int(env.score[env.done].max()))
+            games += len(env.reset_done())
+    elapsed = time.perf_counter() - t0
+
+    print(f"{args.boards} boards x {args.steps} steps in {elapsed:.2f}s: "
+          f"{args.boards * args.steps / elapsed:,.0f} board-steps/s, "
+          f"{games} games finished, best score {best}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# =====================================
+# TankWar Entities — Structure-of-Arrays Storage
+# =====================================
+# Enemy tanks and bullets live in one NumPy array per field instead of a
+# dict per entity, so TankWarGame can move, reload and cull all of them
+# with a handful of array operations per frame. Arrays are allocated with
+# spare capacity; only the first `n` entries are live. Removal is a
+# single compaction pass that keeps the survivors in order.
+import numpy as np
+
+PLAYER, ENEMY = 0, 1        # bullet owners
+
+
+class EntityArrays:
+    """Base for a set of parallel per-field arrays; subclasses list FIELDS."""
+
+    FIELDS = ()
+
+    def __init__(self, capacity=64):
+        self.n = 0
+        self.capacity = capacity
+        for name, dtype in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def reserve(self, count):
+        """Make room for `count` more entries, doubling the arrays as needed."""
+        need = self.n + count
+        if need <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < need:
+            capacity *= 2
+        for name, dtype in self.FIELDS:
+            grown = np.zeros(capacity, dtype=dtype)
+            grown[:self.n] = getattr(self, name)[:self.n]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def extend(self, count, **columns):
+        """Append `count` entries; each column is a scalar or `count` values."""
+        if count <= 0:
+            return
+        self.reserve(count)
+        start, end = self.n, self.n + count
+        for name, dtype in self.FIELDS:
+            getattr(self, name)[start:end] = columns.get(name, 0)
+        self.n = end
+
+    def append(self, **values):
+        self.extend(1, **values)
+
+    def compact(self, keep):
+        """Drop every live entry whose `keep` flag is False, preserving order."""
+        index = np.flatnonzero(keep)
+        count = len(index)
+        if count == self.n:
+            return
+        for name, _ in self.FIELDS:
+            arr = getattr(self, name)
+            arr[:count] = arr[:self.n][index]
+        self.n = count
+
+
+class TankArrays(EntityArrays):
+    """Enemy tanks. `sheet` indexes TankWarGame.enemy_textures."""
+
+    FIELDS = (
+        ("x", np.float64),
+        ("y", np.float64),
+        ("angle", np.float64),      # degrees, as Kivy's Rotate takes it
+        ("speed", np.float64),
+        ("cooldown", np.int32),
+        ("ammo", np.int32),
+        ("reload", np.int32),
+        ("health", np.int32),
+        ("sheet", np.int16),
+    )
+
+
+class BulletArrays(EntityArrays):
+    """Bullets, with the velocity worked out once when fired."""
+
+    FIELDS = (
+        ("x", np.float64),
+        ("y", np.float64),
+        ("vx", np.float64),
+        ("vy", np.float64),
+        ("owner", np.int8),         # PLAYER or ENEMY
+    )
+
+    def fire(self, x, y, angle, owner, speed):
+        rad = np.radians(angle)
+        count = np.size(rad)
+        self.extend(count, x=x, y=y, vx=np.cos(rad) * speed,
+                    vy=np.sin(rad) * speed, owner=owner)
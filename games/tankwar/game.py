@@ -4,13 +4,20 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.clock import Clock
-from kivy.graphics import Rectangle, PushMatrix, PopMatrix, Rotate, Color
+from kivy.graphics import (
+    Rectangle, Color, Mesh, Fbo, ClearColor, ClearBuffers, Callback
+)
+from kivy.graphics.opengl import glDisable, glEnable, GL_BLEND
 from kivy.core.window import Window
 from kivy.core.image import Image as CoreImage
 from kivy.uix.popup import Popup
 import os
 import random
 import math
+import numpy as np
+from games.tankwar.spatial import WallGrid, PointGrid
+from games.tankwar.entities import TankArrays, BulletArrays, PLAYER, ENEMY
+from games.tankwar.sprites import shelf_pack, quad_vertices, quad_indices
 
 
 class TankWarGame(BaseGame):
@@ -18,6 +25,15 @@ class TankWarGame(BaseGame):
     UPDATE_RATE = 1/60
     MAX_AMMO = 3
     RELOAD_TIME = 100
+    WALL_CELL = 60
+    WALL_SIZE = 40
+    HIT_RANGE = 20      # bullet hits a tank within this distance on both axes
+    BULLET_SPEED = 350
+    ENEMY_SPEED = 80
+    ENEMY_COOLDOWN = 60
+    TANK_SIZE = 48
+    BULLET_SIZE = 16
+    ATLAS_WIDTH = 256
 
     def __init__(self, db):
         super().__init__(db, "TankWar")
@@ -32,6 +48,20 @@ class TankWarGame(BaseGame):
         self.level = 1
         self.max_health = 3
 
+        # self.walls keeps draw order; wall_grid answers collision queries
+        self.walls = []
+        self.wall_grid = WallGrid(self.WALL_CELL, self.WALL_SIZE/2)
+
+        # Enemy positions, rebuilt every frame for bullet hit tests
+        self.enemy_grid = PointGrid(2*self.HIT_RANGE)
+
+        # One array per field; see entities.py
+        self.enemies = TankArrays()
+        self.bullets = BulletArrays()
+
+        # Built by build_canvas on the first reset
+        self.wall_layer = None
+
     # -------------------------------------------------
     # ASSETS
     # -------------------------------------------------
@@ -58,6 +88,11 @@ class TankWarGame(BaseGame):
             tex = CoreImage(os.path.join(enemy_folder,file)).texture
             self.enemy_sheets.append(tex)
 
+        # Tanks refer to these by index (TankArrays.sheet)
+        self.enemy_textures = [
+            sheet.get_region(0,0,48,48) for sheet in self.enemy_sheets
+        ]
+
         self.bullet_texture = CoreImage(
             os.path.join(img,"bullet",
                          sorted(os.listdir(os.path.join(img,"bullet")))[0])
@@ -70,6 +105,58 @@ class TankWarGame(BaseGame):
             "iron": CoreImage(os.path.join(scene,"iron.png")).texture,
         }
 
+        self.build_atlas()
+
+    def build_atlas(self):
+        """
+        Copy every tank, bullet and wall frame into one texture. The
+        sprite and wall textures are then replaced by regions of it.
+        """
+        frames=[("player",self.player_texture)]
+        frames+=[(f"enemy{i}",tex) for i,tex in enumerate(self.enemy_textures)]
+        frames+=[("bullet",self.bullet_texture)]
+        frames+=[(kind,tex) for kind,tex in self.wall_textures.items()]
+
+        sizes=[(int(tex.width),int(tex.height)) for _,tex in frames]
+        positions,height=shelf_pack(sizes,self.ATLAS_WIDTH)
+
+        self.atlas_fbo=Fbo(size=(self.ATLAS_WIDTH,height))
+
+        with self.atlas_fbo:
+            ClearColor(0,0,0,0)
+            ClearBuffers()
+            Color(1,1,1,1)
+
+            # Straight copy, not blended over the cleared background
+            Callback(lambda *_:glDisable(GL_BLEND))
+
+            for (_,tex),pos,size in zip(frames,positions,sizes):
+                Rectangle(texture=tex,pos=pos,size=size)
+
+            Callback(lambda *_:glEnable(GL_BLEND))
+
+        self.atlas_fbo.draw()
+        self.atlas=self.atlas_fbo.texture
+
+        regions={
+            name:self.atlas.get_region(x,y,w,h)
+            for (name,_),(x,y),(w,h) in zip(frames,positions,sizes)
+        }
+
+        self.player_texture=regions["player"]
+        self.enemy_textures=[regions[f"enemy{i}"] for i in range(len(self.enemy_textures))]
+        self.bullet_texture=regions["bullet"]
+        self.wall_textures={kind:regions[kind] for kind in self.wall_textures}
+
+        # Mesh uv rows: the player, one per enemy sheet, then the bullet
+        self.sprite_uv=np.array(
+            [self.player_texture.tex_coords]+
+            [tex.tex_coords for tex in self.enemy_textures]+
+            [self.bullet_texture.tex_coords],
+            dtype=np.float32
+        )
+        self.bullet_uv_row=len(self.sprite_uv)-1
+
     # -------------------------------------------------
     # START
     # -------------------------------------------------
@@ -86,11 +173,12 @@ class TankWarGame(BaseGame):
 
     def reset(self):
 
-        self.enemies=[]
-        self.bullets=[]
+        self.enemies.clear()
+        self.bullets.clear()
         self.walls=[]
         self.score=0
 
+        self.build_canvas()
         self.generate_walls()
 
         self.player={
@@ -132,20 +220,17 @@ class TankWarGame(BaseGame):
 
             if not self.wall_collision(x,y):
 
-                sheet=random.choice(self.enemy_sheets)
-                texture=sheet.get_region(0,0,48,48)
-
-                self.enemies.append({
-                    "x":x,
-                    "y":y,
-                    "angle":0,
-                    "speed":80,
-                    "cooldown":60,
-                    "ammo":self.MAX_AMMO,
-                    "reload":0,
-                    "health":1,
-                    "texture":texture
-                })
+                self.enemies.append(
+                    x=x,
+                    y=y,
+                    angle=0,
+                    speed=self.ENEMY_SPEED,
+                    cooldown=self.ENEMY_COOLDOWN,
+                    ammo=self.MAX_AMMO,
+                    reload=0,
+                    health=1,
+                    sheet=random.randrange(len(self.enemy_textures))
+                )
                 return
 
     # -------------------------------------------------
@@ -171,6 +256,7 @@ class TankWarGame(BaseGame):
 
         self.widget=Widget()
         self.widget.bind(on_touch_down=self.on_mouse_click)
+        self.widget.bind(size=self.layout_canvas)
 
         center.add_widget(self.widget)
         layout.add_widget(center)
@@ -216,7 +302,7 @@ class TankWarGame(BaseGame):
         self.player["angle"]=angle
 
         if self.player["ammo"]>0:
-            self.spawn_bullet(self.player["x"],self.player["y"],angle,"player")
+            self.spawn_bullet(self.player["x"],self.player["y"],angle,PLAYER)
             self.player["ammo"]-=1
         elif self.player["reload"]==0:
             self.player["reload"]=self.RELOAD_TIME
@@ -228,8 +314,9 @@ class TankWarGame(BaseGame):
     def generate_walls(self):
 
         self.walls.clear()
+        self.wall_grid.clear()
 
-        cell=60
+        cell=self.WALL_CELL
         cols=int(self.widget.width//cell)
         rows=int(self.widget.height//cell)
 
@@ -254,7 +341,7 @@ class TankWarGame(BaseGame):
         wall={
             "x":x,
             "y":y,
-            "size":40,
+            "size":self.WALL_SIZE,
             "type":wall_type
         }
 
@@ -262,12 +349,35 @@ class TankWarGame(BaseGame):
             wall["health"]=2
 
         self.walls.append(wall)
+        self.wall_grid.add(wall)
+        self._add_wall_sprite(wall)
+
+    def _remove_wall(self,wall):
+
+        self.walls.remove(wall)
+        self.wall_grid.remove(wall)
+
+        for instruction in self.wall_sprites.pop(id(wall)):
+            self.wall_layer.remove(instruction)
+
+    def _damage_wall(self,wall):
+
+        wall["health"]-=1
+
+        if wall["health"]<=0:
+            self._remove_wall(wall)
+        else:
+            color,_=self.wall_sprites[id(wall)]
+            color.rgba=self.wall_tint(wall)
+
+    def wall_tint(self,wall):
+        return (1,0.7,0.7,1) if wall.get("health")==1 else (1,1,1,1)
 
     def wall_collision(self,x,y):
 
         tank_half=20
 
-        for wall in self.walls:
+        for wall in self.wall_grid.near(x,y,tank_half):
 
             half=wall["size"]/2
 
@@ -286,14 +396,7 @@ class TankWarGame(BaseGame):
     # -------------------------------------------------
 
     def spawn_bullet(self,x,y,angle,owner):
-
-        self.bullets.append({
-            "x":x,
-            "y":y,
-            "angle":angle,
-            "owner":owner,
-            "speed":350
-        })
+        self.bullets.fire(x,y,angle,owner,self.BULLET_SPEED)
 
     # -------------------------------------------------
     # UPDATE
@@ -326,93 +429,124 @@ class TankWarGame(BaseGame):
             if self.player["reload"]<=0:
                 self.player["ammo"]=self.MAX_AMMO
 
-        # enemy update
-        for enemy in self.enemies:
-            self.update_enemy(enemy,dt)
+        self.update_enemies(dt)
+        self.update_bullets(dt)
 
-        # bullet update
-        for b in self.bullets[:]:
+        self.check_collisions()
+        self.draw()
 
-            rad=math.radians(b["angle"])
+    def update_bullets(self,dt):
 
-            b["x"]+=math.cos(rad)*b["speed"]*dt
-            b["y"]+=math.sin(rad)*b["speed"]*dt
+        bullets=self.bullets
+        n=bullets.n
 
-            # screen bounds
-            if (
-                b["x"]<0 or
-                b["x"]>self.widget.width or
-                b["y"]<0 or
-                b["y"]>self.widget.height
-            ):
-                self.bullets.remove(b)
-                continue
+        if not n:
+            return
+
+        x=bullets.x[:n]
+        y=bullets.y[:n]
+
+        x+=bullets.vx[:n]*dt
+        y+=bullets.vy[:n]*dt
+
+        # screen bounds
+        keep=(
+            (x>=0) & (x<=self.widget.width) &
+            (y>=0) & (y<=self.widget.height)
+        )
 
-            # wall collision
-            for wall in self.walls[:]:
+        xs=x.tolist()
+        ys=y.tolist()
+
+        # wall collision, only for bullets still on screen
+        for i in np.flatnonzero(keep).tolist():
+
+            bx=xs[i]
+            by=ys[i]
+
+            for wall in self.wall_grid.near(bx,by):
 
                 half=wall["size"]/2
 
                 if (
-                    abs(b["x"]-wall["x"])<half and
-                    abs(b["y"]-wall["y"])<half
+                    abs(bx-wall["x"])<half and
+                    abs(by-wall["y"])<half
                 ):
 
                     if wall["type"]=="brick":
-                        wall["health"]-=1
-                        if wall["health"]<=0:
-                            self.walls.remove(wall)
+                        self._damage_wall(wall)
 
-                    self.bullets.remove(b)
+                    keep[i]=False
                     break
 
-        self.check_collisions()
-        self.draw()
+        bullets.compact(keep)
 
     # -------------------------------------------------
     # ENEMY AI
     # -------------------------------------------------
 
-    def update_enemy(self,enemy,dt):
+    def update_enemies(self,dt):
 
-        dx=self.player["x"]-enemy["x"]
-        dy=self.player["y"]-enemy["y"]
+        enemies=self.enemies
+        n=enemies.n
 
-        enemy["angle"]=math.degrees(math.atan2(dy,dx))
+        if not n:
+            return
 
-        rad=math.radians(enemy["angle"])
+        x=enemies.x[:n]
+        y=enemies.y[:n]
 
-        new_x=enemy["x"]+math.cos(rad)*enemy["speed"]*dt
-        new_y=enemy["y"]+math.sin(rad)*enemy["speed"]*dt
+        # Head straight for the player
+        dx=self.player["x"]-x
+        dy=self.player["y"]-y
 
-        if not self.wall_collision(new_x,new_y):
-            enemy["x"]=new_x
-            enemy["y"]=new_y
+        enemies.angle[:n]=np.degrees(np.arctan2(dy,dx))
+
+        dist=np.hypot(dx,dy)
+        on_top=dist==0
+        dist[on_top]=1
+        ux=np.where(on_top,1.0,dx/dist)
+        uy=dy/dist
+
+        step=enemies.speed[:n]*dt
+        new_x=x+ux*step
+        new_y=y+uy*step
+
+        for i,(nx,ny) in enumerate(zip(new_x.tolist(),new_y.tolist())):
+            if not self.wall_collision(nx,ny):
+                x[i]=nx
+                y[i]=ny
 
         # reload logic
-        if enemy["reload"]>0:
-            enemy["reload"]-=1
-            if enemy["reload"]<=0:
-                enemy["ammo"]=self.MAX_AMMO
+        ammo=enemies.ammo[:n]
+        reload=enemies.reload[:n]
+        cooldown=enemies.cooldown[:n]
 
-        enemy["cooldown"]-=1
+        reloading=reload>0
+        reload[reloading]-=1
+        ammo[reloading & (reload<=0)]=self.MAX_AMMO
 
-        if enemy["cooldown"]<=0:
+        cooldown-=1
 
-            if enemy["ammo"]>0:
+        ready=cooldown<=0
+        shoot=ready & (ammo>0)
+        reload[ready & (ammo<=0) & (reload==0)]=self.RELOAD_TIME
 
-                self.spawn_bullet(
-                    enemy["x"],
-                    enemy["y"],
-                    enemy["angle"],
-                    "enemy"
-                )
+        if shoot.any():
 
-                enemy["ammo"]-=1
-                enemy["cooldown"]=60
+            speed=self.BULLET_SPEED
 
-            elif enemy["reload"]==0:
-                enemy["reload"]=self.RELOAD_TIME
+            self.bullets.extend(
+                int(shoot.sum()),
+                x=x[shoot],
+                y=y[shoot],
+                vx=ux[shoot]*speed,
+                vy=uy[shoot]*speed,
+                owner=ENEMY
+            )
+
+            ammo[shoot]-=1
+            cooldown[shoot]=self.ENEMY_COOLDOWN
 
     # -------------------------------------------------
     # COLLISIONS
@@ -420,32 +554,72 @@ class TankWarGame(BaseGame):
 
     def check_collisions(self):
 
-        for b in self.bullets[:]:
+        hit_range=self.HIT_RANGE
+
+        enemies=self.enemies
+        bullets=self.bullets
+        n=bullets.n
+
+        bx=bullets.x[:n]
+        by=bullets.y[:n]
+        owner=bullets.owner[:n]
+
+        # Enemy bullets only ever test the player
+        px=self.player["x"]
+        py=self.player["y"]
 
-            if b["owner"]=="player":
+        hits_player=(
+            (owner==ENEMY) &
+            (np.abs(bx-px)<hit_range) &
+            (np.abs(by-py)<hit_range)
+        )
+        keep=~hits_player
+
+        if hits_player.any():
+
+            self.player["health"]-=int(hits_player.sum())
 
-                for enemy in self.enemies[:]:
+            if self.player["health"]<=0:
+                self.game_over()
 
-                    if abs(enemy["x"]-b["x"])<20 and abs(enemy["y"]-b["y"])<20:
+        # Player bullets against the tanks near them
+        health=enemies.health[:enemies.n]
+        ex=enemies.x[:enemies.n].tolist()
+        ey=enemies.y[:enemies.n].tolist()
+        self.enemy_grid.build(zip(ex,ey))
 
-                        enemy["health"]-=1
-                        self.bullets.remove(b)
+        xs=bx.tolist()
+        ys=by.tolist()
 
-                        if enemy["health"]<=0:
-                            self.enemies.remove(enemy)
-                            self.score+=20
+        for i in np.flatnonzero(owner==PLAYER).tolist():
 
-                        break
+            x=xs[i]
+            y=ys[i]
 
-            else:
+            # First enemy in list order that the bullet overlaps
+            hit=None
 
-                if abs(self.player["x"]-b["x"])<20 and abs(self.player["y"]-b["y"])<20:
+            for j in self.enemy_grid.near(x,y,hit_range):
 
-                    self.player["health"]-=1
-                    self.bullets.remove(b)
+                if (
+                    health[j]>0 and
+                    (hit is None or j<hit) and
+                    abs(ex[j]-x)<hit_range and
+                    abs(ey[j]-y)<hit_range
+                ):
+                    hit=j
 
-                    if self.player["health"]<=0:
-                        self.game_over()
+            if hit is None:
+                continue
+
+            keep[i]=False
+            health[hit]-=1
+
+            if health[hit]<=0:
+                self.score+=20
+
+        bullets.compact(keep)
+        enemies.compact(health>0)
 
         if not self.enemies:
             self.level+=1
@@ -503,7 +677,13 @@ class TankWarGame(BaseGame):
 
     # -------------------------------------------------
 
-    def draw(self):
+    # Retained canvas: the background and the baked wall layer stay put,
+    # and every tank and bullet is one quad of a single atlas Mesh whose
+    # vertices draw() rewrites each frame.
+
+    def build_canvas(self):
+
+        size=(int(self.widget.width),int(self.widget.height))
 
         self.widget.canvas.clear()
 
@@ -511,58 +691,93 @@ class TankWarGame(BaseGame):
 
             Color(1,1,1,1)
 
-            Rectangle(
+            self.background_rect=Rectangle(
                 texture=self.background_texture,
                 pos=(0,0),
-                size=(self.widget.width,self.widget.height)
+                size=size
             )
 
-            for wall in self.walls:
+            # Walls render into this only when a brick changes
+            self.wall_layer=Fbo(size=size)
 
-                if wall.get("health")==2:
-                    Color(1,1,1,1)
-                elif wall.get("health")==1:
-                    Color(1,0.7,0.7,1)
-                else:
-                    Color(1,1,1,1)
+            Color(1,1,1,1)
 
-                Rectangle(
-                    texture=self.wall_textures.get(wall["type"]),
-                    pos=(wall["x"]-20,wall["y"]-20),
-                    size=(40,40)
-                )
+            self.wall_rect=Rectangle(
+                texture=self.wall_layer.texture,
+                pos=(0,0),
+                size=size
+            )
 
-            PushMatrix()
-            Rotate(angle=self.player["angle"],origin=(self.player["x"],self.player["y"]))
+            self.sprite_mesh=Mesh(mode="triangles",texture=self.atlas)
 
-            Rectangle(
-                texture=self.player_texture,
-                pos=(self.player["x"]-24,self.player["y"]-24),
-                size=(48,48)
-            )
+        with self.wall_layer:
+            ClearColor(0,0,0,0)
+            ClearBuffers()
 
-            PopMatrix()
+        self.wall_sprites={}
+        self.sprite_count=0
 
-            for enemy in self.enemies:
+    def layout_canvas(self,*_):
+        """Resize the background and re-bake the wall layer at the new size."""
+        if self.wall_layer is None:
+            return
 
-                PushMatrix()
-                Rotate(angle=enemy["angle"],origin=(enemy["x"],enemy["y"]))
+        size=(int(self.widget.width),int(self.widget.height))
 
-                Rectangle(
-                    texture=enemy["texture"],
-                    pos=(enemy["x"]-24,enemy["y"]-24),
-                    size=(48,48)
-                )
+        self.background_rect.size=size
 
-                PopMatrix()
+        # A new size means a new framebuffer and texture; redraw the walls into it
+        self.wall_layer.size=size
+        self.wall_layer.ask_update()
+        self.wall_rect.texture=self.wall_layer.texture
+        self.wall_rect.size=size
 
-            for b in self.bullets:
+    def _add_wall_sprite(self,wall):
 
-                Rectangle(
-                    texture=self.bullet_texture,
-                    pos=(b["x"]-8,b["y"]-8),
-                    size=(16,16)
-                )
+        size=wall["size"]
+        half=size/2
+
+        color=Color(*self.wall_tint(wall))
+
+        rect=Rectangle(
+            texture=self.wall_textures[wall["type"]],
+            pos=(wall["x"]-half,wall["y"]-half),
+            size=(size,size)
+        )
+
+        self.wall_layer.add(color)
+        self.wall_layer.add(rect)
+        self.wall_sprites[id(wall)]=(color,rect)
+
+    def draw(self):
+
+        enemies=self.enemies
+        bullets=self.bullets
+        n=enemies.n
+        m=bullets.n
+        count=1+n+m
+
+        # Draw order: player, enemies, bullets
+        x=np.concatenate(([self.player["x"]],enemies.x[:n],bullets.x[:m]))
+        y=np.concatenate(([self.player["y"]],enemies.y[:n],bullets.y[:m]))
+
+        angle=np.zeros(count)
+        angle[0]=self.player["angle"]
+        angle[1:1+n]=enemies.angle[:n]
+
+        half=np.full(count,self.TANK_SIZE/2,dtype=np.float32)
+        half[1+n:]=self.BULLET_SIZE/2
+
+        rows=np.full(count,self.bullet_uv_row)
+        rows[0]=0
+        rows[1:1+n]=enemies.sheet[:n]+1
+
+        mesh=self.sprite_mesh
+        mesh.vertices=quad_vertices(x,y,angle,half,self.sprite_uv[rows]).tolist()
+
+        if count!=self.sprite_count:
+            mesh.indices=quad_indices(count).tolist()
+            self.sprite_count=count
 
     # -------------------------------------------------
 
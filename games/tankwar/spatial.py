@@ -0,0 +1,81 @@
+# =====================================
+# TankWar Spatial Index — Uniform Wall Grid
+# =====================================
+# Walls are bucketed by the grid cell holding their centre, using the same
+# cell size generate_walls lays them out on. A query for a box around
+# (x, y) only visits the cells that box, grown by the largest wall half
+# size, can reach — at most a 2x2 or 3x3 block — instead of every wall.
+#
+# Tanks move every frame, so PointGrid is simply rebuilt per frame from
+# their centres and hands back list indices for the bullet hit tests.
+
+
+class WallGrid:
+
+    def __init__(self, cell=60, max_half=20):
+        self.cell = cell
+        self.max_half = max_half
+        self.cells = {}
+
+    def key(self, x, y):
+        return int(x // self.cell), int(y // self.cell)
+
+    def clear(self):
+        self.cells.clear()
+
+    def add(self, wall):
+        self.cells.setdefault(self.key(wall["x"], wall["y"]), []).append(wall)
+
+    def remove(self, wall):
+        key = self.key(wall["x"], wall["y"])
+        bucket = self.cells[key]
+        bucket.remove(wall)
+        if not bucket:
+            del self.cells[key]
+
+    def near(self, x, y, half=0):
+        """Walls that may overlap the box of half size `half` centred on (x, y)."""
+        reach = half + self.max_half
+        c0, r0 = self.key(x - reach, y - reach)
+        c1, r1 = self.key(x + reach, y + reach)
+        cells = self.cells
+        for c in range(c0, c1 + 1):
+            for r in range(r0, r1 + 1):
+                bucket = cells.get((c, r))
+                if bucket:
+                    yield from bucket
+
+
+class PointGrid:
+    """
+    Per-frame buckets of point indices for short-range queries. Rebuilt
+    from scratch each frame, since everything in it moves.
+    """
+
+    def __init__(self, cell=40):
+        self.cell = cell
+        self.cells = {}
+
+    def build(self, points):
+        cells = self.cells
+        cells.clear()
+        cell = self.cell
+        for i, (x, y) in enumerate(points):
+            key = (int(x // cell), int(y // cell))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [i]
+            else:
+                bucket.append(i)
+
+    def near(self, x, y, reach):
+        """Indices of points that may lie within `reach` of (x, y) on both axes."""
+        cell = self.cell
+        c0, r0 = int((x - reach) // cell), int((y - reach) // cell)
+        c1, r1 = int((x + reach) // cell), int((y + reach) // cell)
+        cells = self.cells
+        for c in range(c0, c1 + 1):
+            for r in range(r0, r1 + 1):
+                bucket = cells.get((c, r))
+                if bucket:
+                    yield from bucket
@@ -0,0 +1,59 @@
+# =====================================
+# TankWar Sprites — Atlas Packing and Quad Batches
+# =====================================
+# Kivy-free helpers for TankWarGame's retained sprite layer. Every tank
+# and bullet frame is copied once into a single atlas texture, so all
+# moving sprites can share one Mesh: each frame only the vertex array is
+# rewritten, four (x, y, u, v) corners per sprite, rotated here with NumPy
+# instead of a PushMatrix/Rotate/PopMatrix per tank.
+import numpy as np
+
+# Corner order matches Kivy's tex_coords: bottom-left, bottom-right,
+# top-right, top-left
+CORNERS = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float32)
+
+# Two triangles per quad
+QUAD_TRIANGLES = np.array([0, 1, 2, 2, 3, 0], dtype=np.int32)
+
+
+def shelf_pack(sizes, width, padding=1):
+    """
+    Lay out (w, h) boxes left to right in rows ("shelves") no wider than
+    `width`. Returns the (x, y) of each box and the total height used.
+    """
+    positions = []
+    x = y = shelf = 0
+    for w, h in sizes:
+        if x and x + w > width:
+            y += shelf + padding
+            x = shelf = 0
+        positions.append((x, y))
+        x += w + padding
+        shelf = max(shelf, h)
+    return positions, y + shelf
+
+
+def quad_vertices(x, y, angle, half, uv):
+    """
+    Flat Mesh vertex data for N sprites centred on (x, y), `half` their
+    half size, turned `angle` degrees anticlockwise. `uv` is (N, 8): the
+    tex_coords of each sprite's atlas region.
+    """
+    rad = np.radians(angle)
+    cos = np.cos(rad)[:, None]
+    sin = np.sin(rad)[:, None]
+
+    ox = CORNERS[:, 0] * half[:, None]
+    oy = CORNERS[:, 1] * half[:, None]
+
+    verts = np.empty((len(x), 4, 4), dtype=np.float32)
+    verts[:, :, 0] = x[:, None] + ox * cos - oy * sin
+    verts[:, :, 1] = y[:, None] + ox * sin + oy * cos
+    verts[:, :, 2:] = uv.reshape(-1, 4, 2)
+    return verts.ravel()
+
+
+def quad_indices(count):
+    """Triangle indices for `count` quads laid out as quad_vertices builds them."""
+    base = np.arange(count, dtype=np.int32)[:, None] * 4
+    return (base + QUAD_TRIANGLES).ravel()
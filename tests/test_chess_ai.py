@@ -0,0 +1,25 @@
+from games.chess.ai import ChessAI, MATE_SCORE
+from games.chess.engine import Position, move_to_uci
+
+# White mates in two: Rg7, then Rf8#
+MATE_IN_TWO = "k7/8/8/8/8/8/6R1/5R1K w - - 0 1"
+
+
+def play(pos, *moves):
+    pos = pos.copy()
+    for uci in moves:
+        pos.make_move(next(m for m in pos.legal_moves() if move_to_uci(m) == uci))
+    return pos
+
+
+def test_mate_distance_survives_the_transposition_table():
+    ai = ChessAI(time_limit=2.0, max_depth=6)
+    pos = Position.from_fen(MATE_IN_TWO)
+
+    # Leaves a mate-in-one entry that the next search meets two plies down
+    _, score, _ = ai.search(play(pos, "g2g7", "a8b8"))
+    assert score == MATE_SCORE - 1
+
+    move, score, _ = ai.search(pos)
+    assert move_to_uci(move) == "g2g7"
+    assert score == MATE_SCORE - 3
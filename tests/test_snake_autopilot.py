@@ -0,0 +1,69 @@
+import random
+from collections import deque
+
+import pytest
+
+from games.snake import engine
+from games.snake.autopilot import Autopilot
+
+
+def free_cells(width, height, snake):
+    free = engine.FreeCells(width, height)
+    for cell in snake:
+        free.remove(cell)
+    return free
+
+
+def step(direction, snake, free, food, rng):
+    """One SnakeGame.update; returns the new food cell, or raises on a crash."""
+    dx, dy = engine.DIRECTIONS[direction]
+    head = (snake[0][0] + dx, snake[0][1] + dy)
+    assert head in free, f"moved {direction} into {head}"
+    snake.appendleft(head)
+    free.remove(head)
+    if head == food:
+        return free.choice(rng)
+    free.add(snake.pop())
+    return food
+
+
+def test_never_turns_into_the_neck():
+    # Body across the cycle's direction: its successor is the neck
+    pilot = Autopilot(10, 8)
+    snake = deque([(3, 5), (2, 5), (1, 5)])
+    free = free_cells(10, 8, snake)
+    direction = pilot.next_direction(snake, (7, 1), free)
+    dx, dy = engine.DIRECTIONS[direction]
+    assert (3 + dx, 5 + dy) in free
+
+
+@pytest.mark.parametrize("width,height", [(10, 8), (20, 20)])
+@pytest.mark.parametrize("seed", range(8))
+def test_enabled_mid_game_fills_the_board(width, height, seed):
+    rng = random.Random(seed)
+    pilot = Autopilot(width, height)
+    snake = deque([(3, 3), (3, 2), (3, 1)])
+    free = free_cells(width, height, snake)
+    food = free.choice(rng)
+
+    # Random manual play first, so the body is out of cycle order
+    direction = 'right'
+    for _ in range(40):
+        options = [
+            name for name, (dx, dy) in engine.DIRECTIONS.items()
+            if (snake[0][0] + dx, snake[0][1] + dy) in free
+        ]
+        if not options:
+            pytest.skip("manual moves boxed the snake in")
+        direction = rng.choice(options)
+        food = step(direction, snake, free, food, rng)
+        if food is None:
+            break
+
+    # Past half the board every food can cost a whole lap of the cycle
+    for _ in range((width * height) ** 2):
+        if food is None:
+            break
+        food = step(pilot.next_direction(snake, food, free), snake, free, food, rng)
+
+    assert food is None and len(snake) == width * height